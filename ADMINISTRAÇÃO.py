@@ -2,57 +2,29 @@
 import streamlit as st
 import pandas as pd
 import os
+import uuid
 from openpyxl import load_workbook
-from streamlit_js_eval import streamlit_js_eval
-import importlib
-import sys
 
 # Importar diretamente os módulos
-from mongodb_config import get_database
-from fornecedores_por_unidade import get_fornecedores
-from unidades import get_unidades
+from avaliacoes_repositorio import montar_documento_avaliacao, salvar_avaliacao, AVALIACAO_EXISTENTE, AVALIACAO_SUBSTITUIDA
+from fila_arquivos import listar_arquivos, baixar_arquivo, processar_fila, STATUS_CONCLUIDO, STATUS_ERRO, MIME_EXCEL
 #from perguntas_por_fornecedor import get_perguntas
 
-# Função para importação dinâmica
-def import_module(module_name, file_path):
-    try:
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
-        if spec is None:
-            st.error(f"Erro ao importar {module_name}: Arquivo não encontrado")
-            return None
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[module_name] = module
-        spec.loader.exec_module(module)
-        return module
-    except Exception as e:
-        st.error(f"Erro ao importar {module_name}: {str(e)}")
-        return None
-
-# Importar módulos locais de forma consistente
-fornecedores_module = import_module('fornecedores_por_unidade', 'fornecedores_por_unidade.py')
-unidades_module = import_module('unidades', 'unidades.py')
-perguntas_module = import_module('perguntas_por_fornecedor', 'perguntas_por_fornecedor.py')
+# Catálogos compartilhados (módulo importado uma vez por processo)
+import catalogos
 
 # Acessar os atributos dos módulos usando as novas funções MongoDB
 try:
-    # Tentar obter dados do MongoDB
-    unidades = unidades_module.get_unidades()
-    fornecedores_por_unidade = fornecedores_module.get_fornecedores()
-    perguntas_por_fornecedor = perguntas_module.get_perguntas()
+    # Tentar obter dados do MongoDB (com cache entre as execuções da página)
+    unidades, fornecedores_por_unidade, perguntas_por_fornecedor = catalogos.carregar_catalogos()
     
-    # Verificar se os dados foram obtidos corretamente
-    if not unidades or not fornecedores_por_unidade or not perguntas_por_fornecedor:
-        raise Exception("Dados vazios retornados do MongoDB")
-        
     # Adicionar mensagem de sucesso
     st.success("Dados carregados com sucesso do Banco de Dados")
     
 except Exception as e:
     # Fallback para os dados originais apenas se houver erro
     st.error(f"Erro ao conectar com o Banco de Dados: {str(e)}. Usando dados locais como fallback.")
-    fornecedores_por_unidade = getattr(fornecedores_module, 'fornecedores_por_unidade', {})
-    unidades = getattr(unidades_module, 'unidades', [])
-    perguntas_por_fornecedor = getattr(perguntas_module, 'perguntas_por_fornecedor', {})
+    unidades, fornecedores_por_unidade, perguntas_por_fornecedor = catalogos.carregar_catalogos_locais()
 
 # Listas fixas
 meses_raw = ['31/01/2025', '28/02/2025', '31/03/2025', '30/04/2025', '31/05/2025', '30/06/2025', '31/07/2025', '31/08/2025',
@@ -104,11 +76,11 @@ CAMINHO_FORNECEDORES = 'fornecedores_por_unidade.py'
 def salvar_fornecedores(fornecedor, unidades_selecionadas):
     try:
         # Usar a função do módulo para adicionar/atualizar fornecedor
-        success = fornecedores_module.add_fornecedor(fornecedor, unidades_selecionadas)
+        success = catalogos.add_fornecedor(fornecedor, unidades_selecionadas)
         if success:
             # Atualizar a variável local
             global fornecedores_por_unidade
-            fornecedores_por_unidade = fornecedores_module.get_fornecedores()
+            fornecedores_por_unidade = catalogos.get_fornecedores()
             return True
         return False
     except Exception as e:
@@ -165,28 +137,31 @@ st.markdown(
 
 st.sidebar.write('---')
 
+# Limpar as respostas da avaliação enviada antes de criar os widgets (mantém unidade e período)
+for chave in st.session_state.pop('respostas_a_limpar', []):
+    st.session_state.pop(chave, None)
+mensagem_envio = st.session_state.pop('mensagem_envio', None)
+
 # Sidebar, Caixas de seleção da unidade, período e fornecedor
 unidade = st.sidebar.selectbox('Selecione a unidade', index=None, options=unidades, placeholder='Escolha a unidade')
 periodo = st.sidebar.selectbox('Selecione o período avaliado', index=indice_mes_anterior, options=meses, placeholder='Defina o período de avaliação')
 
 # Filtrar fornecedores baseado na unidade selecionada
 if unidade:
-    fornecedores_filtrados = [
-        fornecedor for fornecedor, unidades in fornecedores_por_unidade.items()
-        if unidade in unidades
-    ]
-    # Ordenar fornecedores em ordem alfabética
-    fornecedores_filtrados.sort()
+    # Fornecedores da unidade já em ordem alfabética (índice mantido no catálogo)
+    fornecedores_filtrados = fornecedores_por_unidade.fornecedores_da_unidade(unidade)
     
     fornecedor = st.sidebar.selectbox('Selecione o fornecedor a ser avaliado', 
                                      index=None, 
                                      options=fornecedores_filtrados, 
-                                     placeholder='Selecione o prestador/fornecedor')
+                                     placeholder='Selecione o prestador/fornecedor',
+                                     key='fornecedor_avaliado')
 else:
     fornecedor = st.sidebar.selectbox('Selecione o fornecedor a ser avaliado', 
                                      index=None, 
                                      options=[], 
-                                     placeholder='Primeiro selecione uma unidade')
+                                     placeholder='Primeiro selecione uma unidade',
+                                     key='fornecedor_avaliado')
 
 # Tela para cadastrar nova pergunta
 @st.dialog("Cadastrar Nova Pergunta", width="large")
@@ -208,11 +183,11 @@ def cadastrar_pergunta():
             if fornecedor and categoria and nova_pergunta:
                 try:
                     # Usar a função do módulo para adicionar pergunta
-                    success = perguntas_module.add_pergunta(fornecedor, categoria, nova_pergunta)
+                    success = catalogos.add_pergunta(fornecedor, categoria, nova_pergunta)
                     if success:
                         # Atualizar a variável local
                         global perguntas_por_fornecedor
-                        perguntas_por_fornecedor = perguntas_module.get_perguntas()
+                        perguntas_por_fornecedor = catalogos.get_perguntas()
                         st.success("Pergunta adicionada com sucesso!")
                     else:
                         st.warning("Não foi possível adicionar a pergunta.")
@@ -237,6 +212,11 @@ if periodo:
 
 st.write('---')
 
+# Confirmação da última avaliação enviada
+if mensagem_envio:
+    st.success(mensagem_envio)
+    st.info("📁 O arquivo Excel da avaliação está sendo gerado. Acompanhe em **Arquivos das avaliações**.")
+
 # Subtitulo
 if fornecedor and unidade and periodo:
     st.subheader(f'Contratada/Fornecedor: {fornecedor}')
@@ -249,6 +229,7 @@ if fornecedor and unidade and periodo:
 
     respostas = []
     perguntas = []
+    chaves_respostas = []
 
     # Obter perguntas específicas do fornecedor
     perguntas_fornecedor = perguntas_por_fornecedor.get(fornecedor, {})
@@ -259,6 +240,7 @@ if fornecedor and unidade and periodo:
             resposta = st.selectbox(pergunta, options=opcoes, index=None, 
                                   placeholder='Selecione uma opção', 
                                   key=f'op_{i}_{pergunta}')
+            chaves_respostas.append(f'op_{i}_{pergunta}')
             respostas.append(resposta)
             perguntas.append(pergunta)
 
@@ -268,6 +250,7 @@ if fornecedor and unidade and periodo:
             resposta = st.selectbox(pergunta, options=opcoes, index=None, 
                                   placeholder='Selecione uma opção', 
                                   key=f'seg_{i}_{pergunta}')
+            chaves_respostas.append(f'seg_{i}_{pergunta}')
             respostas.append(resposta)
             perguntas.append(pergunta)
 
@@ -277,6 +260,7 @@ if fornecedor and unidade and periodo:
             resposta = st.selectbox(pergunta, options=opcoes, index=None, 
                                   placeholder='Selecione uma opção', 
                                   key=f'qual_{i}_{pergunta}')
+            chaves_respostas.append(f'qual_{i}_{pergunta}')
             respostas.append(resposta)
             perguntas.append(pergunta)
 
@@ -293,8 +277,19 @@ if fornecedor and unidade and periodo:
     if 'pesquisa_salva' not in st.session_state:
         st.session_state.pesquisa_salva = False
     
+    # Identificador deste envio: clicar de novo ou reenviar a mesma avaliação não duplica o registro
+    if 'id_envio' not in st.session_state:
+        st.session_state.id_envio = uuid.uuid4().hex
+    chave_avaliacao = (fornecedor, unidade, meses_raw[meses.index(periodo)])
+    
+    enviar = st.button('Enviar pesquisa')
+    substituir = False
+    if st.session_state.get('avaliacao_existente') == chave_avaliacao:
+        st.warning('Já existe uma avaliação deste fornecedor para a unidade e o período selecionados. Deseja substituí-la por estas respostas?')
+        substituir = st.button('Substituir avaliação existente', type='primary')
+    
     # Botão para salvar no MongoDB
-    if st.button('Enviar pesquisa'):
+    if enviar or substituir:
         try:
             if None in respostas:
                 st.warning('Por favor, responda todas as perguntas antes de salvar.')
@@ -318,79 +313,34 @@ if fornecedor and unidade and periodo:
                 
                 # Salvar no MongoDB (coleção avaliacoes_adm)
                 try:
-                    db = get_database()
-                    collection = db["avaliacoes_adm"]
-                    
-                    # Converter DataFrame para dicionário e inserir no MongoDB
-                    avaliacao_dict = df_respostas.to_dict('records')
-                    collection.insert_many(avaliacao_dict)
-                    
-                    # Atualizar progresso - 66%
-                    progress_bar.progress(66, text="Gerando arquivo Excel...")
-                    
-                    # Gerar arquivo Excel
-                    def gerar_nome_arquivo_avaliacao(fornecedor, periodo, unidade, origem):
-                        # Limpar nome do fornecedor
-                        nome_fornecedor = "".join(x for x in fornecedor if x.isalnum() or x in ['_', '-'])
-                        
-                        # Converter período para formato abreviado
-                        periodo_parts = periodo.split('/')
-                        if len(periodo_parts) >= 2:
-                            mes_num = periodo_parts[1]
-                            ano_completo = periodo_parts[2] if len(periodo_parts) > 2 else periodo_parts[0][-4:]
-                            ano_abrev = ano_completo[-2:]
-                        else:
-                            mes_num = '01'
-                            ano_abrev = '25'
-                        
-                        # Dicionário para conversão de mês
-                        meses_abrev = {
-                            '01': 'JAN', '02': 'FEV', '03': 'MAR', '04': 'ABR',
-                            '05': 'MAI', '06': 'JUN', '07': 'JUL', '08': 'AGO',
-                            '09': 'SET', '10': 'OUT', '11': 'NOV', '12': 'DEZ'
-                        }
-                        nome_periodo = f"{meses_abrev[mes_num]}-{ano_abrev}"
-                        
-                        nome_unidade = "".join(x for x in unidade if x.isalnum() or x in ['_', '-'])
-                        
-                        if origem == 'SUPRIMENTOS':
-                            nome_arquivo = f'{nome_fornecedor}_{nome_periodo}_{nome_unidade}_SUP.xlsx'
-                        else:
-                            nome_arquivo = f'{nome_fornecedor}_{nome_periodo}_{nome_unidade}.xlsx'
-                        
-                        return nome_arquivo
-                    
-                    # Gerar nome do arquivo
-                    nome_arquivo = gerar_nome_arquivo_avaliacao(fornecedor, meses_raw[meses.index(periodo)], unidade, 'ADMINISTRAÇÃO')
+                    # Gravar a avaliação em um único documento (cabeçalho + respostas embutidas)
+                    documento = montar_documento_avaliacao(
+                        unidade,
+                        meses_raw[meses.index(periodo)],
+                        fornecedor,
+                        categorias,
+                        perguntas,
+                        respostas,
+                        df_respostas['Data_Avaliacao'].iloc[0],
+                        id_envio=st.session_state.id_envio
+                    )
+                    situacao = salvar_avaliacao(documento, 'ADMINISTRAÇÃO', substituir=substituir)
                     
-                    # Criar arquivo Excel em memória
-                    from io import BytesIO
-                    output = BytesIO()
-                    with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                        df_respostas.to_excel(writer, index=False, sheet_name='Avaliação')
+                    if situacao == AVALIACAO_EXISTENTE:
+                        # Pedir confirmação antes de substituir a avaliação já registrada
+                        st.session_state.avaliacao_existente = chave_avaliacao
+                        st.rerun()
                     
                     # Atualizar progresso - 100%
                     progress_bar.progress(100, text="Processo concluído!")
                     
-                    st.success('Avaliação realizada e salva com SUCESSO! Obrigado.')
-                    
-                    # Botão de download do arquivo Excel
-                    st.download_button(
-                        label="📥 Baixar Arquivo Excel da Avaliação",
-                        data=output.getvalue(),
-                        file_name=nome_arquivo,
-                        mime='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-                        type="primary"
-                    )
-                    
-                    st.info(f"📁 **Arquivo gerado:** {nome_arquivo}")
-                    
-                    # Aguardar um momento para mostrar a mensagem de sucesso
-                    import time
-                    time.sleep(3)
-                    
-                    # Recarregar a página automaticamente
-                    streamlit_js_eval(js_expressions='parent.window.location.reload()')
+                    # Preparar o formulário para a próxima avaliação sem recarregar a página
+                    st.session_state.respostas_a_limpar = chaves_respostas + ['fornecedor_avaliado', 'id_envio', 'avaliacao_existente']
+                    if situacao == AVALIACAO_SUBSTITUIDA:
+                        st.session_state.mensagem_envio = 'Avaliação substituída com SUCESSO! Obrigado.'
+                    else:
+                        st.session_state.mensagem_envio = 'Avaliação realizada e salva com SUCESSO! Obrigado.'
+                    st.rerun()
                     
                 except Exception as e:
                     st.error(f"Erro ao salvar no MongoDB: {str(e)}")
@@ -399,6 +349,41 @@ if fornecedor and unidade and periodo:
         except Exception as e:
             st.error(f"Erro ao processar a solicitação: {str(e)}")
 
+# Arquivos Excel gerados em segundo plano para as avaliações da unidade e período selecionados
+if unidade and periodo:
+    with st.expander("📁 Arquivos das avaliações"):
+        try:
+            arquivos = listar_arquivos({'Unidade': unidade, 'Período': meses_raw[meses.index(periodo)]}, origem='ADMINISTRAÇÃO')
+            if not arquivos:
+                st.info("Nenhum arquivo gerado para a unidade e o período selecionados.")
+            elif any(a['status'] not in (STATUS_CONCLUIDO, STATUS_ERRO) for a in arquivos):
+                # Retomar tarefas que ficaram na fila (ex.: após reinício do app)
+                processar_fila()
+            for i, arquivo in enumerate(arquivos):
+                col1, col2 = st.columns([3, 1])
+                col1.write(f"**{arquivo['Fornecedor']}** - {arquivo['nome_arquivo']} ({arquivo['status']})")
+                if arquivo['status'] == STATUS_CONCLUIDO:
+                    # Ler o arquivo do GridFS só quando pedido (um por vez, guardado na sessão)
+                    preparado = st.session_state.get('arquivo_preparado')
+                    if not preparado or preparado['arquivo_id'] != arquivo['arquivo_id']:
+                        if col2.button("📄 Preparar download", key=f"preparar_arquivo_{i}"):
+                            preparado = {'arquivo_id': arquivo['arquivo_id'], 'conteudo': baixar_arquivo(arquivo['arquivo_id'])}
+                            st.session_state.arquivo_preparado = preparado
+                    if preparado and preparado['arquivo_id'] == arquivo['arquivo_id']:
+                        col2.download_button(
+                            label="📥 Baixar",
+                            data=preparado['conteudo'],
+                            file_name=arquivo['nome_arquivo'],
+                            mime=MIME_EXCEL,
+                            key=f"baixar_arquivo_{i}"
+                        )
+                elif arquivo['status'] == STATUS_ERRO:
+                    col2.error(arquivo.get('erro') or "Erro ao gerar o arquivo")
+            if arquivos:
+                st.button("🔄 Atualizar situação dos arquivos")
+        except Exception as e:
+            st.error(f"Erro ao consultar os arquivos das avaliações: {str(e)}")
+
 # Rodapé com copyright
 st.sidebar.markdown("""
     <style>
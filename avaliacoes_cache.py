@@ -0,0 +1,254 @@
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+import pyarrow as pa
+import pyarrow.compute as pc
+from bson import ObjectId
+from mongodb_config import get_database
+from avaliacoes_repositorio import (
+    COLECOES_POR_ORIGEM, COLECAO_EXCLUSOES, RETENCAO_EXCLUSOES, CAMPOS_AVALIACAO, CAMPOS_CABECALHO,
+    _origens, listar_avaliacoes, listar_cabecalhos_avaliacoes
+)
+from exportacao_parquet import ESQUEMA_AVALIACOES, lotes_avaliacoes
+
+# Pasta do cache local: um arquivo Arrow IPC por origem e o estado da sincronização
+PASTA_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache_avaliacoes')
+ARQUIVO_ESTADO = 'estado.json'
+
+# Respostas em cache (uma linha por pergunta) com o _id da avaliação, para aplicar alterações e exclusões
+ESQUEMA_CACHE = ESQUEMA_AVALIACOES.append(pa.field('avaliacao_id', pa.string()))
+
+# Folga aplicada às marcas d'água: cobre diferenças de relógio entre instâncias do app
+# e documentos gravados durante a sincronização (os que vierem repetidos são substituídos)
+MARGEM_SINCRONIZACAO = timedelta(minutes=5)
+
+# Formato de Data_Avaliacao gravado pelas páginas
+FORMATO_DATA = '%Y-%m-%d %H:%M:%S'
+
+_lock = threading.Lock()
+
+# Tabelas já mapeadas neste processo: {origem: (arquivo, tabela)}
+_tabelas = {}
+
+def _caminho(nome):
+    return os.path.join(PASTA_CACHE, nome)
+
+def _ler_estado():
+    try:
+        with open(_caminho(ARQUIVO_ESTADO), encoding='utf-8') as arquivo:
+            return json.load(arquivo)
+    except (OSError, ValueError):
+        return {}
+
+def _gravar_estado(estado):
+    temporario = _caminho(ARQUIVO_ESTADO + '.tmp')
+    with open(temporario, 'w', encoding='utf-8') as arquivo:
+        json.dump(estado, arquivo)
+    os.replace(temporario, _caminho(ARQUIVO_ESTADO))
+
+def _ler_tabela(origem, arquivo):
+    # O arquivo é mapeado em memória: as colunas são lidas do disco sob demanda, sem cópia
+    mapeada = _tabelas.get(origem)
+    if mapeada and mapeada[0] == arquivo:
+        return mapeada[1]
+    with pa.memory_map(_caminho(arquivo)) as fonte:
+        tabela = pa.ipc.open_file(fonte).read_all()
+    _tabelas[origem] = (arquivo, tabela)
+    return tabela
+
+def _gravar_tabela(origem, tabela, info):
+    # Cada gravação usa um arquivo novo: sessões que ainda leem o anterior não são afetadas
+    geracao = info.get('geracao', 0) + 1
+    arquivo = f"{COLECOES_POR_ORIGEM[origem]}-{geracao}.arrow"
+    tabela = tabela.unify_dictionaries().combine_chunks()
+    with pa.OSFile(_caminho(arquivo), 'wb') as destino:
+        with pa.ipc.new_file(destino, ESQUEMA_CACHE) as escritor:
+            escritor.write_table(tabela)
+
+    anterior = info.get('arquivo')
+    info['arquivo'] = arquivo
+    info['geracao'] = geracao
+    _tabelas[origem] = (arquivo, tabela)
+    if anterior:
+        try:
+            os.remove(_caminho(anterior))
+        except OSError:
+            # No Windows um arquivo mapeado não pode ser removido; fica para a próxima gravação
+            pass
+
+def _filtro_novos(info):
+    # Documentos criados (_id) ou substituídos (Data_Avaliacao) depois das marcas d'água, com folga
+    condicoes = []
+    if info.get('ultimo_id'):
+        gerado_em = ObjectId(info['ultimo_id']).generation_time
+        condicoes.append({'_id': {'$gt': ObjectId.from_datetime(gerado_em - MARGEM_SINCRONIZACAO)}})
+    if info.get('ultima_data'):
+        try:
+            desde = datetime.strptime(info['ultima_data'], FORMATO_DATA) - MARGEM_SINCRONIZACAO
+            condicoes.append({'Data_Avaliacao': {'$gte': desde.strftime(FORMATO_DATA)}})
+        except ValueError:
+            condicoes.append({'Data_Avaliacao': {'$gte': info['ultima_data']}})
+    if not condicoes:
+        return {}
+    return {'$or': condicoes}
+
+def _buscar_documentos(db, origem, query, info, recebidos):
+    # Percorrer o cursor atualizando as marcas d'água; 'recebidos' guarda {_id: Data_Avaliacao}
+    filtro = {'respostas': {'$exists': True}}
+    filtro.update(query)
+    for documento in db[COLECOES_POR_ORIGEM[origem]].find(filtro, batch_size=500):
+        documento['Origem'] = origem
+        avaliacao_id = str(documento['_id'])
+        data = str(documento.get('Data_Avaliacao') or '')
+        recebidos[avaliacao_id] = data
+        if not info.get('ultimo_id') or ObjectId(avaliacao_id) > ObjectId(info['ultimo_id']):
+            info['ultimo_id'] = avaliacao_id
+        if data > info.get('ultima_data', ''):
+            info['ultima_data'] = data
+        yield documento
+
+def _formatar_data(coluna):
+    # Em segundos, para que o texto volte ao formato gravado (sem a fração do milissegundo)
+    return pc.strftime(pc.cast(coluna, pa.timestamp('s'), safe=False), format=FORMATO_DATA)
+
+def _ja_em_cache(tabela, recebidos):
+    # Os documentos da folga já estão no cache com a mesma data: nada a regravar
+    linhas = tabela.filter(pc.is_in(tabela['avaliacao_id'], value_set=pa.array(list(recebidos), pa.string())))
+    existentes = dict(zip(
+        linhas['avaliacao_id'].to_pylist(),
+        _formatar_data(linhas['Data_Avaliacao']).to_pylist()
+    ))
+    return all(existentes.get(avaliacao_id) == data for avaliacao_id, data in recebidos.items())
+
+def _sincronizar_origem(db, origem, estado, exclusoes, recriar):
+    info = estado.setdefault(origem, {})
+    exclusoes = [e for e in exclusoes if e.get('origem') == origem]
+    # Recarga pedida para a coleção inteira e ainda não aplicada por este cache
+    recargas = [e['excluido_em'] for e in exclusoes if e.get('avaliacao_id') is None]
+    ultima_recarga = max(recargas) if recargas else None
+    if ultima_recarga and info.get('recarregado_em') and ultima_recarga <= datetime.fromisoformat(info['recarregado_em']):
+        ultima_recarga = None
+
+    tabela = None
+    if not recriar and not ultima_recarga and info.get('arquivo'):
+        try:
+            tabela = _ler_tabela(origem, info['arquivo'])
+        except (OSError, pa.ArrowException):
+            tabela = None
+
+    recebidos = {}
+    if tabela is None:
+        # Carga completa: primeira execução, cache expirado ou coleção alterada por inteiro
+        for chave in ('ultimo_id', 'ultima_data'):
+            info.pop(chave, None)
+        novos = pa.Table.from_batches(
+            list(lotes_avaliacoes(_buscar_documentos(db, origem, {}, info, recebidos), esquema=ESQUEMA_CACHE)),
+            schema=ESQUEMA_CACHE
+        )
+        if ultima_recarga:
+            info['recarregado_em'] = ultima_recarga.isoformat()
+        _gravar_tabela(origem, novos, info)
+        return _tabelas[origem][1]
+
+    # Somente o que mudou desde a última sincronização
+    novos = pa.Table.from_batches(
+        list(lotes_avaliacoes(_buscar_documentos(db, origem, _filtro_novos(info), info, recebidos), esquema=ESQUEMA_CACHE)),
+        schema=ESQUEMA_CACHE
+    )
+    excluidos = {str(e['avaliacao_id']) for e in exclusoes if e.get('avaliacao_id') is not None}
+    if recebidos and _ja_em_cache(tabela, recebidos):
+        recebidos = {}
+    remover = excluidos | set(recebidos)
+    if not remover:
+        return tabela
+
+    manter = pc.invert(pc.is_in(tabela['avaliacao_id'], value_set=pa.array(list(remover), pa.string())))
+    atualizada = tabela.filter(manter)
+    if recebidos:
+        atualizada = pa.concat_tables([atualizada, novos])
+    elif atualizada.num_rows == tabela.num_rows:
+        # As exclusões da folga já tinham sido aplicadas
+        return tabela
+    _gravar_tabela(origem, atualizada, info)
+    return _tabelas[origem][1]
+
+def sincronizar_cache():
+    """
+    Atualiza o cache local com o que mudou no banco desde a última sincronização:
+    avaliações novas ou substituídas (pelas marcas d'água de _id e Data_Avaliacao) e
+    exclusões registradas em avaliacoes_excluidas. Retorna {origem: tabela Arrow}.
+    """
+    with _lock:
+        os.makedirs(PASTA_CACHE, exist_ok=True)
+        estado = _ler_estado()
+        db = get_database()
+        inicio = datetime.now()
+
+        # Sem sincronização dentro do período de retenção, exclusões podem ter expirado: recriar tudo
+        sincronizado_em = estado.get('sincronizado_em')
+        recriar = not sincronizado_em or inicio - datetime.fromisoformat(sincronizado_em) > RETENCAO_EXCLUSOES
+        exclusoes = []
+        if not recriar:
+            desde = datetime.fromisoformat(sincronizado_em) - MARGEM_SINCRONIZACAO
+            exclusoes = list(db[COLECAO_EXCLUSOES].find({'excluido_em': {'$gte': desde}}, {'_id': 0}))
+
+        tabelas = {
+            origem: _sincronizar_origem(db, origem, estado, exclusoes, recriar)
+            for origem in COLECOES_POR_ORIGEM
+        }
+        estado['sincronizado_em'] = inicio.isoformat()
+        _gravar_estado(estado)
+        return tabelas
+
+def _consultar(filtros, origem):
+    # Mesmas regras de montar_filtro, aplicadas sobre as tabelas em cache
+    tabelas = sincronizar_cache()
+    tabela = pa.concat_tables([tabelas[nome_origem] for nome_origem in _origens(origem)])
+    for campo, valor in (filtros or {}).items():
+        if valor is None or valor in ('Todos', 'Todas'):
+            continue
+        valores = list(valor) if isinstance(valor, (list, tuple, set)) else [valor]
+        if not valores:
+            continue
+        coluna = tabela[campo]
+        if pa.types.is_dictionary(coluna.type):
+            coluna = coluna.cast(pa.string())
+        tabela = tabela.filter(pc.is_in(coluna, value_set=pa.array([str(v) for v in valores], pa.string())))
+    return tabela
+
+def _para_dataframe(tabela, colunas):
+    dados = {}
+    for campo in colunas:
+        coluna = tabela['origem' if campo == 'Origem' else campo]
+        if campo == 'Data_Avaliacao':
+            coluna = _formatar_data(coluna)
+        elif pa.types.is_dictionary(coluna.type):
+            coluna = coluna.cast(pa.string())
+        dados[campo] = coluna
+    return pa.table(dados).to_pandas()
+
+def listar_avaliacoes_cache(filtros=None, origem=None):
+    """
+    Mesmo resultado de listar_avaliacoes (uma linha por pergunta, com 'Origem'), lido do cache
+    local. Se o cache não puder ser lido ou gravado, consulta o banco diretamente.
+    """
+    try:
+        tabela = _consultar(filtros, origem)
+    except (OSError, pa.ArrowException) as e:
+        print(f"Erro ao usar o cache local de avaliações: {str(e)}")
+        return listar_avaliacoes(filtros, origem=origem)
+    return _para_dataframe(tabela, CAMPOS_AVALIACAO + ['Origem'])
+
+def listar_cabecalhos_cache(filtros=None, origem=None):
+    """
+    Mesmo resultado de listar_cabecalhos_avaliacoes (uma linha por avaliação), lido do cache local.
+    """
+    try:
+        tabela = _consultar(filtros, origem)
+    except (OSError, pa.ArrowException) as e:
+        print(f"Erro ao usar o cache local de avaliações: {str(e)}")
+        return listar_cabecalhos_avaliacoes(filtros, origem=origem)
+    df = _para_dataframe(tabela, ['avaliacao_id'] + CAMPOS_CABECALHO + ['Origem'])
+    df = df.drop_duplicates('avaliacao_id').drop(columns='avaliacao_id')
+    return df.reset_index(drop=True)
@@ -0,0 +1,292 @@
+import heapq
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import pandas as pd
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from mongodb_config import get_database
+
+# Coleção de cada origem de avaliação
+COLECOES_POR_ORIGEM = {
+    'SUPRIMENTOS': 'avaliacoes',
+    'ADMINISTRAÇÃO': 'avaliacoes_adm'
+}
+
+# Campos que identificam uma avaliação (cabeçalho)
+CAMPOS_CABECALHO = ['Fornecedor', 'Unidade', 'Período', 'Data_Avaliacao']
+
+# Campos de cada resposta registrada (linha da planilha de avaliação)
+CAMPOS_AVALIACAO = ['Unidade', 'Período', 'Fornecedor', 'categorias', 'Pergunta', 'Resposta', 'Data_Avaliacao']
+
+# Campos de cada item do array 'respostas' do documento de avaliação
+CAMPOS_RESPOSTA = ['categorias', 'Pergunta', 'Resposta']
+
+# Campos que identificam uma avaliação de forma única em cada coleção (índice único)
+CHAVE_AVALIACAO = ['Fornecedor', 'Unidade', 'Período']
+
+# Registro das exclusões, lido pelo cache local para remover as avaliações excluídas
+COLECAO_EXCLUSOES = 'avaliacoes_excluidas'
+
+# Tempo que os registros de exclusão são mantidos (índice TTL); caches mais antigos são recriados
+RETENCAO_EXCLUSOES = timedelta(days=90)
+
+# Resultado de salvar_avaliacao
+AVALIACAO_CRIADA = 'criada'
+AVALIACAO_REPETIDA = 'repetida'
+AVALIACAO_EXISTENTE = 'existente'
+AVALIACAO_SUBSTITUIDA = 'substituida'
+
+def montar_documento_avaliacao(unidade, periodo, fornecedor, categorias, perguntas, respostas, data_avaliacao, id_envio=None):
+    """
+    Monta o documento de uma avaliação: cabeçalho + respostas embutidas.
+    'id_envio' identifica o envio feito pela página (repetir o mesmo envio não grava nada).
+    """
+    documento = {
+        'Unidade': unidade,
+        'Período': periodo,
+        'Fornecedor': fornecedor,
+        'Data_Avaliacao': data_avaliacao,
+        'respostas': [
+            {'categorias': categoria, 'Pergunta': pergunta, 'Resposta': resposta}
+            for categoria, pergunta, resposta in zip(categorias, perguntas, respostas)
+        ]
+    }
+    if id_envio:
+        documento['id_envio'] = id_envio
+    return documento
+
+def salvar_avaliacao(documento, origem, substituir=False):
+    """
+    Grava uma avaliação na coleção da origem, atualiza o resumo mensal e registra na fila
+    a geração do arquivo Excel, que é feita em segundo plano.
+    Só existe uma avaliação por (fornecedor, unidade, período):
+    - o mesmo envio repetido (mesmo id_envio) não grava nada;
+    - outro envio para a mesma chave só substitui a avaliação existente com substituir=True.
+    Retorna AVALIACAO_CRIADA, AVALIACAO_REPETIDA, AVALIACAO_EXISTENTE ou AVALIACAO_SUBSTITUIDA.
+    """
+    from resumo_avaliacoes import atualizar_resumo
+    from fila_arquivos import enfileirar_arquivo, processar_fila
+
+    db = get_database()
+    collection = db[COLECOES_POR_ORIGEM[origem]]
+    filtro = {campo: documento[campo] for campo in CHAVE_AVALIACAO}
+    # Linhas do modelo antigo (uma por pergunta) não contam como avaliação existente
+    filtro['respostas'] = {'$exists': True}
+
+    # Inserir apenas se ainda não existe avaliação com a mesma chave
+    try:
+        resultado = collection.update_one(filtro, {'$setOnInsert': documento}, upsert=True)
+        criado_id = resultado.upserted_id
+    except DuplicateKeyError:
+        # Outro envio simultâneo gravou a mesma chave
+        criado_id = None
+
+    if criado_id is not None:
+        documento['_id'] = criado_id
+        situacao = AVALIACAO_CRIADA
+    else:
+        existente = collection.find_one(filtro, {'_id': 1, 'id_envio': 1})
+        if existente and documento.get('id_envio') and existente.get('id_envio') == documento['id_envio']:
+            return AVALIACAO_REPETIDA
+        if not substituir:
+            return AVALIACAO_EXISTENTE
+
+        # Substituir mantendo o _id e descontar a avaliação anterior do resumo
+        anterior = collection.find_one_and_replace(filtro, documento, upsert=True, return_document=ReturnDocument.BEFORE)
+        if anterior is not None:
+            documento['_id'] = anterior['_id']
+            atualizar_resumo(anterior, origem, sinal=-1)
+        else:
+            documento['_id'] = collection.find_one(filtro, {'_id': 1})['_id']
+        situacao = AVALIACAO_SUBSTITUIDA
+
+    enfileirar_arquivo(documento, origem, db)
+    atualizar_resumo(documento, origem)
+    processar_fila(db)
+    return situacao
+
+def registrar_exclusoes(origem, ids=None, db=None):
+    """
+    Registra a exclusão das avaliações 'ids' da origem. Sem 'ids', registra que a coleção
+    inteira foi alterada (exclusão total, restauração, renomeação), e o cache local a recarrega.
+    """
+    if db is None:
+        db = get_database()
+
+    agora = datetime.now()
+    if ids is None:
+        db[COLECAO_EXCLUSOES].insert_one({'origem': origem, 'avaliacao_id': None, 'excluido_em': agora})
+    elif ids:
+        db[COLECAO_EXCLUSOES].insert_many([
+            {'origem': origem, 'avaliacao_id': avaliacao_id, 'excluido_em': agora} for avaliacao_id in ids
+        ])
+
+def remover_avaliacoes_duplicadas(origem=None):
+    """
+    Mantém apenas a avaliação mais recente de cada (fornecedor, unidade, período), descontando
+    as removidas do resumo mensal. Necessário antes de criar o índice único em bases antigas.
+    Retorna {origem: avaliações removidas}.
+    """
+    from resumo_avaliacoes import atualizar_resumo
+    from fila_arquivos import remover_arquivos
+
+    db = get_database()
+    pipeline = [
+        {'$match': {'respostas': {'$exists': True}}},
+        {'$sort': {'Data_Avaliacao': -1, '_id': -1}},
+        {'$group': {'_id': {campo: f'${campo}' for campo in CHAVE_AVALIACAO}, 'ids': {'$push': '$_id'}}},
+        {'$match': {'ids.1': {'$exists': True}}}
+    ]
+
+    removidas = {}
+    for nome_origem in _origens(origem):
+        collection = db[COLECOES_POR_ORIGEM[nome_origem]]
+        ids_removidos = []
+        for grupo in collection.aggregate(pipeline, allowDiskUse=True):
+            for documento_id in grupo['ids'][1:]:
+                documento = collection.find_one_and_delete({'_id': documento_id})
+                if documento is not None:
+                    atualizar_resumo(documento, nome_origem, sinal=-1)
+                    ids_removidos.append(documento_id)
+        registrar_exclusoes(nome_origem, ids_removidos, db)
+        remover_arquivos(ids_removidos, db)
+        removidas[nome_origem] = len(ids_removidos)
+    return removidas
+
+def excluir_avaliacao(fornecedor, unidade, periodo, origem):
+    """
+    Exclui as avaliações de (fornecedor, unidade, período) da origem, descontando-as do resumo mensal
+    e removendo os arquivos Excel gerados pela fila.
+    Retorna a quantidade de avaliações excluídas.
+    """
+    from resumo_avaliacoes import atualizar_resumo
+    from fila_arquivos import remover_arquivos
+
+    db = get_database()
+    collection = db[COLECOES_POR_ORIGEM[origem]]
+    filtro = {'Fornecedor': fornecedor, 'Unidade': unidade, 'Período': periodo}
+
+    ids_excluidos = []
+    # Excluir um documento por vez para descontar exatamente o que foi removido
+    while True:
+        documento = collection.find_one_and_delete(filtro)
+        if documento is None:
+            break
+        atualizar_resumo(documento, origem, sinal=-1)
+        ids_excluidos.append(documento['_id'])
+    registrar_exclusoes(origem, ids_excluidos, db)
+    remover_arquivos(ids_excluidos, db)
+    return len(ids_excluidos)
+
+def _origens(origem):
+    if origem is None or origem in ('Todas', 'Todos'):
+        return list(COLECOES_POR_ORIGEM.keys())
+    if isinstance(origem, str):
+        return [origem]
+    return list(origem)
+
+def montar_filtro(filtros=None):
+    """
+    Converte {campo: valor ou lista de valores} em um filtro do MongoDB.
+    Valores vazios, None, 'Todos' e 'Todas' são ignorados.
+    """
+    query = {}
+    for campo, valor in (filtros or {}).items():
+        if valor is None or valor in ('Todos', 'Todas'):
+            continue
+        if isinstance(valor, (list, tuple, set)):
+            if len(valor) == 0:
+                continue
+            query[campo] = {'$in': list(valor)}
+        else:
+            query[campo] = valor
+    return query
+
+def _consultar_origens(origem, consulta):
+    # Ler as coleções de cada origem em paralelo
+    origens = _origens(origem)
+    if len(origens) == 1:
+        return {origens[0]: consulta(origens[0])}
+    with ThreadPoolExecutor(max_workers=len(origens)) as executor:
+        resultados = dict(zip(origens, executor.map(consulta, origens)))
+    return resultados
+
+def _para_dataframe(resultados, colunas):
+    dfs = []
+    for origem, documentos in resultados.items():
+        if documentos:
+            df = pd.DataFrame(documentos)
+            df['Origem'] = origem
+            dfs.append(df)
+    if not dfs:
+        return pd.DataFrame(columns=colunas + ['Origem'])
+    return pd.concat(dfs, ignore_index=True)
+
+def _estagios_respostas(campos=None):
+    # Desdobrar o array 'respostas' em uma linha por pergunta, no formato da planilha
+    campos = list(campos or CAMPOS_AVALIACAO)
+    projecao = {'_id': 0}
+    for campo in campos:
+        projecao[campo] = f'$respostas.{campo}' if campo in CAMPOS_RESPOSTA else f'${campo}'
+    return [{'$unwind': '$respostas'}, {'$project': projecao}]
+
+def listar_avaliacoes(filtros=None, origem=None, campos=None):
+    """
+    Retorna as respostas das avaliações que atendem aos filtros, uma linha por pergunta
+    e com a coluna 'Origem'. Os filtros são aplicados no banco antes de desdobrar as respostas.
+    """
+    db = get_database()
+    campos = list(campos or CAMPOS_AVALIACAO)
+    pipeline = [{'$match': montar_filtro(filtros)}] + _estagios_respostas(campos)
+
+    def consulta(nome_origem):
+        return list(db[COLECOES_POR_ORIGEM[nome_origem]].aggregate(pipeline))
+
+    return _para_dataframe(_consultar_origens(origem, consulta), campos)
+
+def listar_cabecalhos_avaliacoes(filtros=None, origem=None):
+    """
+    Retorna uma linha por avaliação (Fornecedor, Unidade, Período, Data_Avaliacao, Origem),
+    sem carregar as respostas.
+    """
+    db = get_database()
+    query = montar_filtro(filtros)
+    projecao = {campo: 1 for campo in CAMPOS_CABECALHO}
+    projecao['_id'] = 0
+
+    def consulta(nome_origem):
+        return list(db[COLECOES_POR_ORIGEM[nome_origem]].find(query, projecao))
+
+    df = _para_dataframe(_consultar_origens(origem, consulta), CAMPOS_CABECALHO)
+    return df[CAMPOS_CABECALHO + ['Origem']]
+
+def iterar_avaliacoes(filtros=None, origem=None, ordenar_por=None, tamanho_lote=500):
+    """
+    Percorre os documentos de avaliação (com a coluna 'Origem') direto do cursor, em lotes,
+    sem montar um DataFrame. Com 'ordenar_por' (lista de campos), os documentos de todas as
+    origens são intercalados nessa ordem.
+    """
+    db = get_database()
+    query = montar_filtro(filtros)
+    ordem = [(campo, ASCENDING) for campo in (ordenar_por or [])]
+
+    def documentos(nome_origem):
+        cursor = db[COLECOES_POR_ORIGEM[nome_origem]].find(query, {'_id': 0}, batch_size=tamanho_lote)
+        if ordem:
+            cursor = cursor.sort(ordem).allow_disk_use(True)
+        for documento in cursor:
+            documento['Origem'] = nome_origem
+            yield documento
+
+    cursores = [documentos(nome_origem) for nome_origem in _origens(origem)]
+    if ordem:
+        return heapq.merge(*cursores, key=lambda documento: tuple(str(documento.get(campo) or '') for campo in ordenar_por))
+    return itertools.chain(*cursores)
+
+def buscar_avaliacao(fornecedor, unidade, periodo, origem, campos=None):
+    """
+    Retorna as respostas de uma única avaliação.
+    """
+    filtros = {'Fornecedor': fornecedor, 'Unidade': unidade, 'Período': periodo}
+    return listar_avaliacoes(filtros, origem=origem, campos=campos)
@@ -0,0 +1,128 @@
+"""
+Mede o tempo e o pico de memória para gerar o arquivo Excel de uma avaliação.
+
+Antes, cada página montava o arquivo com pd.ExcelWriter(BytesIO(), engine='openpyxl'),
+que mantém todo o workbook em objetos Python até o fim.
+Agora exportacao_excel.py grava com o XlsxWriter em modo de memória constante,
+com os formatos do modelo criados uma vez por arquivo.
+
+Também compara a exportação em ZIP do CONTROLE ("Gerar Arquivos Individuais"):
+antes, uma máscara sobre todas as linhas por avaliação e um arquivo por vez em memória;
+agora, os documentos lidos um a um do cursor, um pool de processos e o ZIP gravado em disco.
+
+Uso: python benchmarks/exportacao_excel.py [repetições] [perguntas por avaliação] [avaliações no ZIP]
+"""
+import os
+import sys
+import time
+import tracemalloc
+import zipfile
+from io import BytesIO
+import pandas as pd
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_PATH)
+
+from exportacao_excel import COLUNAS_AVALIACAO, gerar_excel_avaliacao, gerar_zip_avaliacoes, gerar_nome_arquivo_avaliacao
+
+RESPOSTAS = ['Atende Totalmente', 'Atende Parcialmente', 'Não Atende', 'Não se Aplica']
+
+def _avaliacao(perguntas):
+    # Avaliação fictícia no formato das linhas retornadas por listar_avaliacoes
+    return pd.DataFrame({
+        'Unidade': 'CSA-BH',
+        'Período': '31/01/2025',
+        'Fornecedor': 'FORNECEDOR DE TESTE LTDA',
+        'categorias': [f'Categoria {i % 3}' for i in range(perguntas)],
+        'Pergunta': [f'Pergunta {i}: o fornecedor cumpriu o item {i} do contrato no período avaliado?' for i in range(perguntas)],
+        'Resposta': [RESPOSTAS[i % len(RESPOSTAS)] for i in range(perguntas)],
+        'Data_Avaliacao': '2025-02-01 10:00:00',
+    }, columns=COLUNAS_AVALIACAO)
+
+def _openpyxl(df):
+    # Caminho anterior
+    output = BytesIO()
+    with pd.ExcelWriter(output, engine='openpyxl') as writer:
+        df.to_excel(writer, index=False, sheet_name='Avaliação')
+    return output.getvalue()
+
+def _xlsxwriter(df):
+    return gerar_excel_avaliacao(df)
+
+def medir(funcao, df, repeticoes):
+    # Retorna (tempo médio em ms, pico de memória em MB)
+    funcao(df)
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao(df)
+    tempo = (time.perf_counter() - inicio) * 1000 / repeticoes
+
+    tracemalloc.start()
+    funcao(df)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return tempo, pico / 1024 / 1024
+
+def _respostas(avaliacoes, perguntas):
+    # Linhas de várias avaliações, no formato de listar_avaliacoes (com a coluna Origem)
+    partes = []
+    for i in range(avaliacoes):
+        df = _avaliacao(perguntas)
+        df['Fornecedor'] = f'FORNECEDOR {i}'
+        df['Origem'] = 'SUPRIMENTOS' if i % 2 else 'ADMINISTRAÇÃO'
+        partes.append(df)
+    return pd.concat(partes, ignore_index=True)
+
+def _zip_anterior(respostas_df, dados_base):
+    # Laço anterior do CONTROLE: máscara de três colunas por avaliação e ZIP em memória
+    zip_buffer = BytesIO()
+    with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        for _, row in dados_base.iterrows():
+            dados = respostas_df[
+                (respostas_df['Fornecedor'] == row['Fornecedor']) &
+                (respostas_df['Unidade'] == row['Unidade']) &
+                (respostas_df['Período'] == row['Período']) &
+                (respostas_df['Origem'] == row['Origem'])
+            ].drop('Origem', axis=1)
+            nome = gerar_nome_arquivo_avaliacao(row['Fornecedor'], row['Período'], row['Unidade'], row['Origem'])
+            zip_file.writestr(nome, _openpyxl(dados))
+    return zip_buffer.getvalue()
+
+def _documentos(respostas_df):
+    # Documentos de avaliação, no formato de iterar_avaliacoes
+    for (fornecedor, unidade, periodo, origem), df in respostas_df.groupby(['Fornecedor', 'Unidade', 'Período', 'Origem'], sort=False):
+        yield {
+            'Fornecedor': fornecedor, 'Unidade': unidade, 'Período': periodo, 'Origem': origem,
+            'Data_Avaliacao': df['Data_Avaliacao'].iloc[0],
+            'respostas': df[['categorias', 'Pergunta', 'Resposta']].to_dict('records'),
+        }
+
+def _zip_atual(respostas_df, dados_base):
+    documentos = list(_documentos(respostas_df))
+    caminho, _ = gerar_zip_avaliacoes(iter(documentos), dados_base)
+    os.remove(caminho)
+
+def medir_zip(avaliacoes, perguntas):
+    respostas_df = _respostas(avaliacoes, perguntas)
+    dados_base = respostas_df[['Fornecedor', 'Unidade', 'Período', 'Origem']].drop_duplicates()
+    print(f"ZIP com {avaliacoes} avaliações ({os.cpu_count()} núcleos):")
+    for nome, funcao in [("laço anterior (openpyxl)", _zip_anterior), ("gerar_zip_avaliacoes", _zip_atual)]:
+        inicio = time.perf_counter()
+        funcao(respostas_df, dados_base)
+        print(f"  {nome:32s} {(time.perf_counter() - inicio):10.2f} s")
+
+def main(repeticoes=20, perguntas=30, avaliacoes=200):
+    for linhas, vezes in [(perguntas, repeticoes), (perguntas * 1000, max(1, repeticoes // 10))]:
+        df = _avaliacao(linhas)
+        print(f"Arquivo com {linhas} linhas ({vezes} repetições):")
+        for nome, funcao in [("openpyxl (anterior)", _openpyxl), ("XlsxWriter (exportacao_excel)", _xlsxwriter)]:
+            tempo, pico = medir(funcao, df, vezes)
+            print(f"  {nome:32s} {tempo:10.2f} ms/arquivo  pico {pico:8.2f} MB")
+    medir_zip(avaliacoes, perguntas)
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 20,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 30,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 200
+    )
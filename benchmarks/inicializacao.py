@@ -0,0 +1,73 @@
+"""
+Mede o custo de inicialização dos catálogos padrão nas páginas.
+
+Antes, cada execução de página carregava fornecedores_por_unidade.py e
+perguntas_por_fornecedor.py com os catálogos escritos como literais Python.
+Agora os dados ficam em dados/*.json e só são lidos na carga inicial ou no fallback.
+
+Uso: python benchmarks/inicializacao.py [repetições]
+"""
+import os
+import sys
+import time
+import types
+import importlib.util
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BASE_PATH)
+
+from dados_locais import carregar_dados_locais
+
+CATALOGOS = ["perguntas_por_fornecedor", "fornecedores_por_unidade", "unidades"]
+MODULOS = ["fornecedores_por_unidade", "unidades", "perguntas_por_fornecedor"]
+
+def _instalar_config_ficticio():
+    # Os módulos atuais importam mongodb_config, que exige o secrets.toml do Streamlit.
+    # Nenhum banco é acessado ao carregá-los: basta um módulo com as mesmas funções.
+    def sem_banco():
+        raise RuntimeError("benchmark executado sem banco de dados")
+    config = types.ModuleType("mongodb_config")
+    config.MONGODB_DATABASE = "avaliacao_fornecedores"
+    config.get_mongo_client = sem_banco
+    config.get_database = sem_banco
+    sys.modules["mongodb_config"] = config
+
+def medir(funcao, repeticoes):
+    # Retorna o tempo médio em milissegundos
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) * 1000 / repeticoes
+
+def _exec_literais(fontes):
+    # Reproduz o carregamento anterior: compilar e executar os literais a cada execução da página
+    def executar():
+        for nome, fonte in fontes.items():
+            exec(compile(fonte, f"{nome}.py", "exec"), {})
+    return executar
+
+def _ler_json():
+    for nome in CATALOGOS:
+        carregar_dados_locais(nome)
+
+def _exec_modulos():
+    # Mesmo carregamento feito pelas páginas (import_module com exec_module)
+    for nome in MODULOS:
+        spec = importlib.util.spec_from_file_location(nome, os.path.join(BASE_PATH, f"{nome}.py"))
+        modulo = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(modulo)
+
+def main(repeticoes=50):
+    fontes = {nome: f"{nome} = {carregar_dados_locais(nome)!r}\n" for nome in CATALOGOS}
+
+    print(f"Tempo médio em {repeticoes} repetições:")
+    print(f"  literais Python (carregamento anterior, a cada execução): {medir(_exec_literais(fontes), repeticoes):8.2f} ms")
+    print(f"  leitura dos arquivos JSON (apenas carga inicial/fallback): {medir(_ler_json, repeticoes):8.2f} ms")
+
+    _instalar_config_ficticio()
+    # Primeira execução: importa as dependências dos módulos (streamlit, pymongo), fora da média
+    _exec_modulos()
+    print(f"  módulos atuais (exec_module, sem ler os catálogos):     {medir(_exec_modulos, repeticoes):8.2f} ms")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 50)
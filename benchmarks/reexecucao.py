@@ -0,0 +1,131 @@
+"""
+Mede a latência de reexecução (rerun) de uma página do Streamlit no trecho que carrega
+os módulos dos catálogos.
+
+Antes, cada página executava fornecedores_por_unidade.py, unidades.py e
+perguntas_por_fornecedor.py com import_module (exec_module) a cada interação.
+Agora as páginas fazem "import catalogos", executado uma única vez por processo.
+
+O cenário anterior usa as fontes da revisão base (por padrão o primeiro commit do
+repositório), extraídas com "git show" para uma pasta temporária, com os catálogos
+ainda escritos como literais Python.
+
+Usa o AppTest do Streamlit com credenciais fictícias: nenhuma conexão é aberta,
+a menos que --com-banco seja informado (nesse caso usa o secrets.toml do projeto
+e inclui a leitura dos catálogos com cache).
+
+Uso: python benchmarks/reexecucao.py [repetições] [--com-banco] [--base=<revisão>]
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from streamlit.testing.v1 import AppTest
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Arquivos da revisão base executados pelas páginas antigas a cada interação
+ARQUIVOS_ANTERIORES = ["mongodb_config.py", "fornecedores_por_unidade.py", "unidades.py", "perguntas_por_fornecedor.py"]
+
+def revisao_base():
+    # Primeiro commit do repositório (estado anterior às otimizações)
+    saida = subprocess.run(
+        ["git", "rev-list", "--max-parents=0", "HEAD"],
+        cwd=BASE_PATH, capture_output=True, text=True, check=True
+    )
+    return saida.stdout.split()[-1]
+
+def extrair_fontes(revisao, pasta):
+    for nome in ARQUIVOS_ANTERIORES:
+        conteudo = subprocess.run(
+            ["git", "show", f"{revisao}:{nome}"],
+            cwd=BASE_PATH, capture_output=True, check=True
+        ).stdout
+        with open(os.path.join(pasta, nome), "wb") as arquivo:
+            arquivo.write(conteudo)
+
+def script_anterior(pasta):
+    return f'''
+import sys
+import importlib.util
+sys.path.insert(0, {pasta!r})
+
+def import_module(module_name, file_path):
+    spec = importlib.util.spec_from_file_location(module_name, file_path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+fornecedores_module = import_module('fornecedores_por_unidade', {os.path.join(pasta, 'fornecedores_por_unidade.py')!r})
+unidades_module = import_module('unidades', {os.path.join(pasta, 'unidades.py')!r})
+perguntas_module = import_module('perguntas_por_fornecedor', {os.path.join(pasta, 'perguntas_por_fornecedor.py')!r})
+'''
+
+CARREGAR_ANTERIOR = '''
+catalogos_carregados = (unidades_module.get_unidades(), fornecedores_module.get_fornecedores(), perguntas_module.get_perguntas())
+'''
+
+def descarregar_fontes(pasta):
+    # Os módulos da revisão base têm os mesmos nomes dos atuais: retirá-los antes do cenário atual
+    while pasta in sys.path:
+        sys.path.remove(pasta)
+    for nome, modulo in list(sys.modules.items()):
+        arquivo = getattr(modulo, "__file__", None) or ""
+        if arquivo.startswith(pasta):
+            del sys.modules[nome]
+
+SCRIPT_ATUAL = f'''
+import sys
+sys.path.insert(0, {BASE_PATH!r})
+import catalogos
+'''
+
+CARREGAR_CATALOGOS = '''
+catalogos_carregados = __import__("catalogos").carregar_catalogos()
+'''
+
+SECRETS_FICTICIOS = {
+    "MONGODB_USERNAME": "benchmark",
+    "MONGODB_PASSWORD": "benchmark",
+    "MONGODB_CLUSTER": "localhost",
+}
+
+def medir(script, carga, repeticoes, com_banco):
+    app = AppTest.from_string(script + (carga if com_banco else ""), default_timeout=60)
+    if not com_banco:
+        app.secrets["mongodb"] = SECRETS_FICTICIOS
+
+    # Primeira execução: importações do processo (não entram na média)
+    app.run()
+    if app.exception:
+        raise RuntimeError(app.exception[0].message)
+
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        app.run()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    tempos.sort()
+    return sum(tempos) / len(tempos), tempos[len(tempos) // 2]
+
+def main(repeticoes=30, com_banco=False, revisao=None):
+    revisao = revisao or revisao_base()
+    pasta = tempfile.mkdtemp(prefix="reexecucao_base_")
+    try:
+        extrair_fontes(revisao, pasta)
+        print(f"Latência de reexecução em {repeticoes} reruns (média / mediana), base {revisao[:10]}:")
+        media, mediana = medir(script_anterior(pasta), CARREGAR_ANTERIOR, repeticoes, com_banco)
+        print(f"  {'import_module (anterior)':26s} {media:8.2f} ms / {mediana:8.2f} ms")
+        descarregar_fontes(pasta)
+        media, mediana = medir(SCRIPT_ATUAL, CARREGAR_CATALOGOS, repeticoes, com_banco)
+        print(f"  {'import catalogos (atual)':26s} {media:8.2f} ms / {mediana:8.2f} ms")
+    finally:
+        shutil.rmtree(pasta, ignore_errors=True)
+
+if __name__ == "__main__":
+    argumentos = [a for a in sys.argv[1:] if not a.startswith("--")]
+    base = next((a.split("=", 1)[1] for a in sys.argv[1:] if a.startswith("--base=")), None)
+    main(int(argumentos[0]) if argumentos else 30, "--com-banco" in sys.argv, base)
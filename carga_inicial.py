@@ -0,0 +1,136 @@
+import datetime
+from pymongo import UpdateOne, ReplaceOne, ReturnDocument
+from pymongo.errors import BulkWriteError
+from mongodb_config import get_database
+from catalogo_versao import COLECAO_VERSAO, ID_VERSAO, CATALOGOS
+from dados_locais import carregar_dados_locais
+
+# Marcador gravado quando a carga inicial dos catálogos foi concluída
+ID_CARGA_INICIAL = "carga_inicial"
+
+# Código de erro do MongoDB para chave duplicada
+ERRO_CHAVE_DUPLICADA = 11000
+
+def _dados_locais():
+    # Ler os dados padrão apenas quando a carga for necessária
+    return (
+        carregar_dados_locais("fornecedores_por_unidade"),
+        carregar_dados_locais("perguntas_por_fornecedor"),
+        carregar_dados_locais("unidades"),
+    )
+
+def _operacao(chave, documento, substituir):
+    # substituir=True sobrescreve o documento; caso contrário só cria se não existir
+    if substituir:
+        return ReplaceOne(chave, documento, upsert=True)
+    return UpdateOne(chave, {"$setOnInsert": documento}, upsert=True)
+
+def _executar_lote(collection, operacoes):
+    if not operacoes:
+        return 0
+    try:
+        return collection.bulk_write(operacoes, ordered=False).upserted_count
+    except BulkWriteError as e:
+        # Outro processo pode ter criado o mesmo documento ao mesmo tempo (índice único)
+        erros = [erro for erro in e.details.get("writeErrors", []) if erro.get("code") != ERRO_CHAVE_DUPLICADA]
+        if erros:
+            raise
+        return e.details.get("nUpserted", 0)
+
+def semear_fornecedores(db, dados, substituir=False):
+    collection = db["fornecedores"]
+    operacoes = [
+        _operacao({"fornecedor": fornecedor}, {"fornecedor": fornecedor, "unidades": unidades}, substituir)
+        for fornecedor, unidades in dados.items()
+    ]
+    criados = _executar_lote(collection, operacoes)
+    if substituir:
+        # Remover fornecedores que não existem nos dados importados
+        collection.delete_many({"fornecedor": {"$nin": list(dados.keys())}})
+    return criados
+
+def semear_perguntas(db, dados, substituir=False):
+    collection = db["perguntas"]
+    operacoes = []
+    chaves = []
+    for fornecedor, categorias in dados.items():
+        for categoria, perguntas in categorias.items():
+            chave = {"fornecedor": fornecedor, "categoria": categoria}
+            chaves.append(chave)
+            operacoes.append(_operacao(chave, dict(chave, perguntas=perguntas), substituir))
+    criados = _executar_lote(collection, operacoes)
+    if substituir and chaves:
+        # Remover categorias que não existem nos dados importados
+        collection.delete_many({"$nor": chaves})
+    return criados
+
+def semear_unidades(db, dados, substituir=False):
+    collection = db["unidades"]
+    # A coleção de unidades tem um único documento com a lista completa
+    if substituir:
+        doc = collection.find_one_and_replace({}, {"unidades": list(dados)}, upsert=True, return_document=ReturnDocument.AFTER)
+        collection.delete_many({"_id": {"$ne": doc["_id"]}})
+        return 1
+    resultado = collection.update_one({}, {"$setOnInsert": {"unidades": list(dados)}}, upsert=True)
+    return 1 if resultado.upserted_id is not None else 0
+
+def semear_catalogos(db=None, substituir=False, catalogos=None):
+    """
+    Grava os catálogos padrão (fornecedores, perguntas e unidades) com bulk_write,
+    usando as chaves naturais de cada coleção. Pode ser executada várias vezes.
+    Com substituir=False apenas cria o que não existe; com substituir=True os
+    catálogos passam a ser exatamente os dados locais.
+    Retorna {catalogo: documentos criados}.
+    """
+    if db is None:
+        db = get_database()
+    if catalogos is None:
+        catalogos = CATALOGOS
+
+    fornecedores, perguntas, unidades = _dados_locais()
+    funcoes = {
+        "fornecedores": (semear_fornecedores, fornecedores),
+        "perguntas": (semear_perguntas, perguntas),
+        "unidades": (semear_unidades, unidades),
+    }
+
+    resultado = {}
+    for catalogo in catalogos:
+        funcao, dados = funcoes[catalogo]
+        resultado[catalogo] = funcao(db, dados, substituir)
+    return resultado
+
+def carga_inicial_concluida(db=None):
+    if db is None:
+        db = get_database()
+    return db[COLECAO_VERSAO].find_one({"_id": ID_CARGA_INICIAL}) is not None
+
+def garantir_carga_inicial(db=None):
+    """
+    Executa a carga inicial uma única vez: semeia apenas os catálogos ainda vazios
+    e grava o marcador. Com o marcador presente, não faz nenhuma outra consulta.
+    """
+    if db is None:
+        db = get_database()
+    if carga_inicial_concluida(db):
+        return {}
+
+    vazios = [catalogo for catalogo in CATALOGOS if db[catalogo].find_one({}, {"_id": 1}) is None]
+    resultado = semear_catalogos(db, catalogos=vazios) if vazios else {}
+
+    # Invalidar o cache dos catálogos criados, caso algum processo já os tenha lido vazios.
+    # O documento de versões é sempre criado aqui, pois a carga conjunta dos catálogos parte dele.
+    alterados = {f"versoes.{catalogo}": 1 for catalogo, criados in resultado.items() if criados}
+    operacao = {"$inc": alterados} if alterados else {"$setOnInsert": {"versoes": {}}}
+    db[COLECAO_VERSAO].update_one({"_id": ID_VERSAO}, operacao, upsert=True)
+
+    db[COLECAO_VERSAO].update_one(
+        {"_id": ID_CARGA_INICIAL},
+        {"$setOnInsert": {"data": datetime.datetime.now(), "catalogos": vazios}},
+        upsert=True
+    )
+    return resultado
+
+# Executar a carga inicial manualmente
+if __name__ == "__main__":
+    print(f"Carga inicial: {garantir_carga_inicial()}")
@@ -0,0 +1,90 @@
+import threading
+import time
+import streamlit as st
+from catalogo_versao import get_versao
+
+class CacheCatalogo:
+    """
+    Cache em memória de um catálogo ({chave: valor}), compartilhado pelas sessões do processo.
+    O conteúdo vale para uma versão do catálogo e é descartado quando a versão muda por
+    alteração de outro processo ou quando expira (ttl). Alterações feitas neste processo
+    atualizam apenas a entrada afetada (write-through), sem recarregar o catálogo inteiro.
+    O catálogo pode ser um dicionário (atualizar_entrada/remover_entrada) ou qualquer
+    objeto (aplicar/substituir). Com 'copiar', as alterações são feitas em uma cópia
+    (copy-on-write): o objeto entregue por obter() nunca muda e pode ser lido sem cópia.
+    """
+    def __init__(self, nome, carregar, ttl=3600, copiar=None):
+        self.nome = nome
+        self._carregar = carregar
+        self._ttl = ttl
+        self._copiar = copiar
+        self._lock = threading.RLock()
+        self._versao = None
+        self._dados = None
+        self._carregado_em = 0
+
+    def _expirado(self):
+        return self._dados is None or time.monotonic() - self._carregado_em > self._ttl
+
+    def carregado(self):
+        with self._lock:
+            return not self._expirado()
+
+    def valido(self, versao):
+        with self._lock:
+            return not self._expirado() and self._versao == versao
+
+    def obter(self, versao=None):
+        # A versão pode ser informada por quem já a consultou (ex.: carga conjunta dos catálogos)
+        if versao is None:
+            versao = get_versao(self.nome)
+        with self._lock:
+            if self._expirado() or self._versao != versao:
+                self._dados = self._carregar()
+                self._versao = versao
+                self._carregado_em = time.monotonic()
+            return self._dados
+
+    def aplicar(self, nova_versao, alteracao):
+        with self._lock:
+            # Só é seguro aplicar a alteração se nenhuma outra ocorreu desde a última leitura
+            if self._dados is None or self._versao != nova_versao - 1:
+                self._dados = None
+                return
+            dados = self._copiar(self._dados) if self._copiar else self._dados
+            alteracao(dados)
+            self._dados = dados
+            self._versao = nova_versao
+
+    def atualizar_entrada(self, chave, valor, nova_versao):
+        def alteracao(dados):
+            dados[chave] = valor
+        self.aplicar(nova_versao, alteracao)
+
+    def remover_entrada(self, chave, nova_versao):
+        def alteracao(dados):
+            dados.pop(chave, None)
+        self.aplicar(nova_versao, alteracao)
+
+    def substituir(self, dados, nova_versao):
+        with self._lock:
+            self._dados = dados
+            self._versao = nova_versao
+            self._carregado_em = time.monotonic()
+
+    def invalidar(self):
+        with self._lock:
+            self._dados = None
+
+@st.cache_resource(show_spinner=False)
+def _get_caches():
+    return {}
+
+def get_cache(nome, carregar, ttl=3600, copiar=None):
+    """
+    Retorna o cache do catálogo 'nome', criando-o na primeira chamada do processo.
+    """
+    caches = _get_caches()
+    if nome not in caches:
+        caches.setdefault(nome, CacheCatalogo(nome, carregar, ttl, copiar))
+    return caches[nome]
@@ -0,0 +1,81 @@
+import threading
+import streamlit as st
+from pymongo import ReturnDocument
+from mongodb_config import get_database
+
+# Documento único com a versão de cada catálogo (fornecedores, perguntas, unidades)
+COLECAO_VERSAO = "catalogo_versao"
+ID_VERSAO = "catalogo"
+CATALOGOS = ["fornecedores", "perguntas", "unidades"]
+
+def _ler_versoes():
+    db = get_database()
+    doc = db[COLECAO_VERSAO].find_one({"_id": ID_VERSAO}) or {}
+    versoes = doc.get("versoes", {})
+    return {catalogo: versoes.get(catalogo, 0) for catalogo in CATALOGOS}
+
+class _MonitorVersoes:
+    """
+    Acompanha o documento de versões por change stream, quando disponível,
+    para que a verificação de versão não precise consultar o banco.
+    """
+    def __init__(self):
+        self.versoes = None
+        self.ativo = False
+        self._thread = threading.Thread(target=self._executar, name="monitor-catalogo", daemon=True)
+        self._thread.start()
+
+    def _executar(self):
+        try:
+            db = get_database()
+            pipeline = [{"$match": {"documentKey._id": ID_VERSAO}}]
+            with db[COLECAO_VERSAO].watch(pipeline, full_document="updateLookup") as stream:
+                # Ler o estado atual somente depois de abrir o stream, para não perder alterações
+                self.versoes = _ler_versoes()
+                self.ativo = True
+                for mudanca in stream:
+                    documento = mudanca.get("fullDocument") or {}
+                    versoes = documento.get("versoes", {})
+                    self.versoes = {catalogo: versoes.get(catalogo, 0) for catalogo in CATALOGOS}
+        except Exception as e:
+            # Change streams exigem replica set (ex.: Atlas); sem eles, a versão é lida do banco a cada verificação
+            print(f"Monitor de versões do catálogo indisponível: {str(e)}")
+        finally:
+            self.ativo = False
+
+@st.cache_resource(show_spinner=False)
+def _get_monitor():
+    return _MonitorVersoes()
+
+def get_versoes_catalogo():
+    """
+    Retorna {catalogo: versão}. Usa o valor mantido pelo change stream quando ativo;
+    caso contrário, lê o documento de versões (uma consulta pequena).
+    """
+    monitor = _get_monitor()
+    if monitor.ativo and monitor.versoes is not None:
+        return dict(monitor.versoes)
+    return _ler_versoes()
+
+def get_versao(catalogo):
+    return get_versoes_catalogo()[catalogo]
+
+def incrementar_versao(catalogo):
+    """
+    Marca o catálogo como alterado, invalidando o cache de todas as sessões.
+    Deve ser chamada por toda função que altera fornecedores, perguntas ou unidades.
+    Retorna a nova versão do catálogo.
+    """
+    db = get_database()
+    doc = db[COLECAO_VERSAO].find_one_and_update(
+        {"_id": ID_VERSAO},
+        {"$inc": {f"versoes.{catalogo}": 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    versoes = doc.get("versoes", {})
+    # Atualizar imediatamente o valor local, sem esperar o change stream
+    monitor = _get_monitor()
+    if monitor.versoes is not None:
+        monitor.versoes = {c: versoes.get(c, 0) for c in CATALOGOS}
+    return versoes.get(catalogo, 0)
@@ -0,0 +1,87 @@
+# Acesso aos catálogos (unidades, fornecedores e perguntas) compartilhado por todas as páginas.
+# Deve ser importado normalmente (import catalogos): o módulo é executado uma única vez por
+# processo e os dados ficam nos caches dos catálogos entre as execuções das páginas.
+from mongodb_config import get_database
+from catalogo_versao import COLECAO_VERSAO, ID_VERSAO, get_versoes_catalogo
+from fornecedores_por_unidade import CatalogoFornecedores, get_fornecedores, get_fornecedores_por_unidade, get_unidades_do_fornecedor, add_fornecedor, remove_fornecedor, ler_planilha_fornecedores, validar_fornecedores, importar_fornecedores, get_cache_fornecedores, montar_fornecedores
+from unidades import get_unidades, add_unidade, remove_unidade, get_cache_unidades, montar_unidades
+from perguntas_por_fornecedor import get_perguntas, get_perguntas_por_fornecedor, add_pergunta, remove_pergunta, update_pergunta, get_categoria, add_perguntas, remove_perguntas, reordenar_perguntas, get_cache_perguntas, montar_perguntas
+from dados_locais import carregar_dados_locais
+
+# Como ler cada catálogo na carga conjunta: (cache, projeção da coleção, conversão dos documentos)
+_CATALOGOS_CARGA = {
+    "unidades": (get_cache_unidades, {"_id": 0, "unidades": 1}, montar_unidades),
+    "fornecedores": (get_cache_fornecedores, {"_id": 0, "fornecedor": 1, "unidades": 1}, montar_fornecedores),
+    "perguntas": (get_cache_perguntas, {"_id": 0, "fornecedor": 1, "categoria": 1, "perguntas": 1}, montar_perguntas),
+}
+
+def _consultar_catalogos(nomes):
+    """
+    Lê o documento de versões e os catálogos pedidos em uma única agregação ($lookup).
+    Retorna None se o documento de versões ainda não existir.
+    """
+    pipeline = [{"$match": {"_id": ID_VERSAO}}]
+    for nome in nomes:
+        _, projecao, _ = _CATALOGOS_CARGA[nome]
+        estagios = [{"$project": projecao}]
+        if nome == "unidades":
+            estagios.insert(0, {"$limit": 1})
+        pipeline.append({"$lookup": {"from": nome, "pipeline": estagios, "as": nome}})
+
+    for doc in get_database()[COLECAO_VERSAO].aggregate(pipeline):
+        return doc
+    return None
+
+def _atualizar_caches():
+    """
+    Garante que os caches dos catálogos estejam na versão atual com no máximo uma ida ao banco
+    (nenhuma quando o change stream de versões está ativo e os caches estão válidos).
+    Retorna as versões usadas.
+    """
+    caches = {nome: get_cache() for nome, (get_cache, _, _) in _CATALOGOS_CARGA.items()}
+
+    # Sem nenhum catálogo em memória (início do processo), as versões vêm junto com os dados
+    versoes = None
+    pendentes = list(caches)
+    if any(cache.carregado() for cache in caches.values()):
+        versoes = get_versoes_catalogo()
+        pendentes = [nome for nome, cache in caches.items() if not cache.valido(versoes[nome])]
+
+    if pendentes:
+        doc = _consultar_catalogos(pendentes)
+        if doc is not None:
+            versoes_doc = doc.get("versoes", {})
+            versoes = dict(versoes or {}, **{nome: versoes_doc.get(nome, 0) for nome in pendentes})
+            for nome in pendentes:
+                _, _, montar = _CATALOGOS_CARGA[nome]
+                caches[nome].substituir(montar(doc[nome]), versoes[nome])
+
+    # Sem documento de versões, cada catálogo é carregado individualmente pelo próprio cache
+    return versoes or {}
+
+def carregar_catalogos():
+    """
+    Retorna (unidades, fornecedores_por_unidade, perguntas_por_fornecedor) do banco de dados,
+    buscando os catálogos desatualizados em uma única consulta.
+    Lança exceção se algum catálogo vier vazio, para que a página use os dados locais.
+    """
+    versoes = _atualizar_caches()
+    unidades = get_unidades(versoes.get("unidades"))
+    fornecedores_por_unidade = get_fornecedores(versoes.get("fornecedores"))
+    perguntas_por_fornecedor = get_perguntas(versoes.get("perguntas"))
+    
+    # Verificar se os dados foram obtidos corretamente
+    if not unidades or not fornecedores_por_unidade or not perguntas_por_fornecedor:
+        raise Exception("Dados vazios retornados do MongoDB")
+    
+    return unidades, fornecedores_por_unidade, perguntas_por_fornecedor
+
+def carregar_catalogos_locais():
+    """
+    Retorna os catálogos padrão (dados/*.json), usados como fallback quando o banco não responde.
+    """
+    return (
+        carregar_dados_locais("unidades"),
+        CatalogoFornecedores(carregar_dados_locais("fornecedores_por_unidade")),
+        carregar_dados_locais("perguntas_por_fornecedor"),
+    )
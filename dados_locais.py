@@ -0,0 +1,13 @@
+import os
+import json
+
+# Pasta com os catálogos padrão usados na carga inicial e como fallback
+PASTA_DADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dados")
+
+def carregar_dados_locais(nome):
+    """
+    Lê o arquivo dados/<nome>.json. Só deve ser chamada quando os dados padrão
+    forem de fato necessários (carga inicial, importação ou fallback).
+    """
+    with open(os.path.join(PASTA_DADOS, f"{nome}.json"), encoding="utf-8") as arquivo:
+        return json.load(arquivo)
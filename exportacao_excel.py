@@ -0,0 +1,303 @@
+import os
+import multiprocessing
+import tempfile
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+import pandas as pd
+import xlsxwriter
+
+# Aba e colunas do arquivo de uma avaliação (mesmo formato da planilha gerada no envio).
+# Não depende da conexão com o banco, para poder ser usado também fora do Streamlit.
+ABA_AVALIACAO = 'Avaliação'
+COLUNAS_AVALIACAO = ['Unidade', 'Período', 'Fornecedor', 'categorias', 'Pergunta', 'Resposta', 'Data_Avaliacao']
+
+MIME_EXCEL = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# Modelo da planilha: formatos e larguras definidos uma vez e aplicados a cada arquivo
+FORMATO_CABECALHO = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+LARGURAS_COLUNAS = {
+    'Unidade': 12,
+    'Período': 12,
+    'Fornecedor': 30,
+    'categorias': 24,
+    'Pergunta': 80,
+    'Resposta': 20,
+    'Data_Avaliacao': 20,
+}
+
+# Opções do XlsxWriter: cada linha é gravada em disco assim que escrita (memória constante)
+OPCOES_WORKBOOK = {'constant_memory': True, 'strings_to_numbers': False, 'strings_to_urls': False}
+
+MESES_ABREV = {
+    '01': 'JAN', '02': 'FEV', '03': 'MAR', '04': 'ABR',
+    '05': 'MAI', '06': 'JUN', '07': 'JUL', '08': 'AGO',
+    '09': 'SET', '10': 'OUT', '11': 'NOV', '12': 'DEZ'
+}
+
+def gerar_nome_arquivo_avaliacao(fornecedor, periodo, unidade, origem):
+    """
+    Gera o nome do arquivo de uma avaliação, ex.: FORNECEDOR_JAN-25_UNIDADE_SUP.xlsx.
+    """
+    # Limpar nome do fornecedor
+    nome_fornecedor = "".join(x for x in fornecedor if x.isalnum() or x in ['_', '-'])
+
+    # Converter período (DD/MM/AAAA) para formato abreviado
+    periodo_parts = periodo.split('/')
+    if len(periodo_parts) >= 2:
+        mes_num = periodo_parts[1]
+        ano_completo = periodo_parts[2] if len(periodo_parts) > 2 else periodo_parts[0][-4:]
+        ano_abrev = ano_completo[-2:]
+    else:
+        mes_num = '01'
+        ano_abrev = '25'
+    nome_periodo = f"{MESES_ABREV.get(mes_num, mes_num)}-{ano_abrev}"
+
+    nome_unidade = "".join(x for x in unidade if x.isalnum() or x in ['_', '-'])
+
+    if origem == 'SUPRIMENTOS':
+        return f'{nome_fornecedor}_{nome_periodo}_{nome_unidade}_SUP.xlsx'
+    return f'{nome_fornecedor}_{nome_periodo}_{nome_unidade}.xlsx'
+
+def linhas_documento(documento):
+    """
+    Linhas (uma por pergunta, na ordem de COLUNAS_AVALIACAO) de um documento de avaliação.
+    """
+    for item in documento.get('respostas', []):
+        yield (
+            documento.get('Unidade'),
+            documento.get('Período'),
+            documento.get('Fornecedor'),
+            item.get('categorias'),
+            item.get('Pergunta'),
+            item.get('Resposta'),
+            documento.get('Data_Avaliacao'),
+        )
+
+def linhas_dataframe(df, colunas=COLUNAS_AVALIACAO):
+    # Percorrer o DataFrame sem criar uma Series por linha; valores ausentes viram células vazias
+    df = df.reindex(columns=colunas).astype(object)
+    df = df.where(pd.notna(df), None)
+    return df.itertuples(index=False, name=None)
+
+def criar_formatos(workbook):
+    """
+    Cria os formatos do modelo no workbook (uma vez por arquivo, reaproveitados por todas as abas).
+    """
+    return {'cabecalho': workbook.add_format(FORMATO_CABECALHO)}
+
+def escrever_aba(workbook, formatos, nome_aba, linhas, colunas=COLUNAS_AVALIACAO):
+    """
+    Escreve o cabeçalho e as linhas em uma nova aba, linha a linha.
+    Retorna a quantidade de linhas escritas.
+    """
+    worksheet = workbook.add_worksheet(nome_aba)
+    for indice, coluna in enumerate(colunas):
+        worksheet.set_column(indice, indice, LARGURAS_COLUNAS.get(coluna, 15))
+    worksheet.write_row(0, 0, colunas, formatos['cabecalho'])
+
+    total = 0
+    for total, linha in enumerate(linhas, start=1):
+        worksheet.write_row(total, 0, linha)
+    return total
+
+def gerar_excel_avaliacao(linhas, destino=None, colunas=COLUNAS_AVALIACAO, nome_aba=ABA_AVALIACAO):
+    """
+    Gera o arquivo Excel de uma avaliação com o XlsxWriter em modo de memória constante.
+    'linhas' pode ser um DataFrame, um documento de avaliação ou um iterável de tuplas.
+    Grava em 'destino' (caminho ou arquivo aberto) ou, sem destino, retorna os bytes do arquivo.
+    """
+    if isinstance(linhas, pd.DataFrame):
+        linhas = linhas_dataframe(linhas, colunas)
+    elif isinstance(linhas, dict):
+        linhas = linhas_documento(linhas)
+
+    saida = BytesIO() if destino is None else destino
+    workbook = xlsxwriter.Workbook(saida, OPCOES_WORKBOOK)
+    try:
+        escrever_aba(workbook, criar_formatos(workbook), nome_aba, linhas, colunas)
+    finally:
+        workbook.close()
+
+    if destino is None:
+        return saida.getvalue()
+    return destino
+
+# Chave de cada avaliação (documentos de iterar_avaliacoes, com a coluna 'Origem')
+CHAVE_ARQUIVO = ['Fornecedor', 'Unidade', 'Período', 'Origem']
+
+# Abaixo desta quantidade de arquivos não compensa iniciar processos
+MINIMO_ARQUIVOS_PROCESSOS = 20
+
+# Arquivos enviados ao pool por processo antes de esperar o primeiro ficar pronto
+ARQUIVOS_POR_PROCESSO = 4
+
+def _gerar_arquivo(tarefa):
+    # Executada nos processos do pool: grava um arquivo da avaliação na pasta temporária
+    caminho, nome, linhas = tarefa
+    gerar_excel_avaliacao(linhas, caminho)
+    return caminho, nome
+
+def _nome_entrada_zip(nome, usados):
+    # Nomes diferentes podem gerar o mesmo arquivo (o nome do fornecedor perde espaços e símbolos):
+    # acrescentar um sufixo, sem diferenciar maiúsculas de minúsculas como no Windows
+    base, extensao = os.path.splitext(nome)
+    candidato = nome
+    sufixo = 2
+    while candidato.lower() in usados:
+        candidato = f"{base} ({sufixo}){extensao}"
+        sufixo += 1
+    usados.add(candidato.lower())
+    return candidato
+
+def _tarefas_zip(documentos, chaves, pasta):
+    # Uma tarefa por documento lido do cursor, só com as linhas daquela avaliação
+    usados = set()
+    for indice, documento in enumerate(documentos):
+        chave = tuple(documento.get(campo) for campo in CHAVE_ARQUIVO)
+        if not documento.get('respostas') or (chaves is not None and chave not in chaves):
+            continue
+        fornecedor, unidade, periodo, origem = chave
+        nome = _nome_entrada_zip(gerar_nome_arquivo_avaliacao(fornecedor or '', periodo or '', unidade or '', origem), usados)
+        yield os.path.join(pasta, f'{indice}.xlsx'), nome, list(linhas_documento(documento))
+
+def _executar_no_pool(executor, tarefas, limite):
+    # Manter no máximo 'limite' arquivos em andamento: o cursor só é lido conforme os arquivos ficam prontos
+    pendentes = deque()
+    for tarefa in tarefas:
+        pendentes.append(executor.submit(_gerar_arquivo, tarefa))
+        if len(pendentes) >= limite:
+            yield pendentes.popleft().result()
+    while pendentes:
+        yield pendentes.popleft().result()
+
+def gerar_zip_avaliacoes(documentos, avaliacoes=None, destino=None, progresso=None, processos=None):
+    """
+    Gera um ZIP com um arquivo Excel por avaliação, gravado em disco (não em memória).
+    'documentos' são os documentos de avaliação (com a coluna 'Origem'), lidos direto do cursor
+    de iterar_avaliacoes; 'avaliacoes' opcionalmente limita as avaliações exportadas
+    (DataFrame com Fornecedor, Unidade, Período e Origem). Apenas alguns documentos ficam
+    em memória por vez, e os arquivos são gerados em um pool de processos.
+    'progresso(feitos, total)' é chamada a cada arquivo (total é None sem 'avaliacoes').
+    Retorna (caminho do ZIP, nomes dos arquivos).
+    """
+    if destino is None:
+        with tempfile.NamedTemporaryFile(suffix='.zip', delete=False) as arquivo_temporario:
+            destino = arquivo_temporario.name
+
+    chaves = None
+    total = None
+    if avaliacoes is not None:
+        chaves = set(avaliacoes[CHAVE_ARQUIVO].itertuples(index=False, name=None))
+        total = len(chaves)
+
+    if processos is None:
+        processos = os.cpu_count() or 1
+
+    nomes = []
+    with tempfile.TemporaryDirectory() as pasta, \
+            zipfile.ZipFile(destino, 'w', zipfile.ZIP_DEFLATED) as zip_file:
+        tarefas = _tarefas_zip(documentos, chaves, pasta)
+        if processos > 1 and (total is None or total >= MINIMO_ARQUIVOS_PROCESSOS):
+            # 'spawn': os processos importam apenas este módulo, sem herdar as threads do Streamlit
+            executor = ProcessPoolExecutor(max_workers=processos, mp_context=multiprocessing.get_context('spawn'))
+            arquivos = _executar_no_pool(executor, tarefas, processos * ARQUIVOS_POR_PROCESSO)
+        else:
+            executor = None
+            arquivos = map(_gerar_arquivo, tarefas)
+
+        try:
+            for caminho, nome in arquivos:
+                zip_file.write(caminho, nome)
+                os.remove(caminho)
+                nomes.append(nome)
+                if progresso:
+                    progresso(len(nomes), total)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+    return destino, nomes
+
+# Aba com o resumo das pontuações no arquivo consolidado
+ABA_RESUMO = 'Resumo'
+
+# Caracteres que o Excel não aceita em nomes de abas (limitados a 31 caracteres)
+CARACTERES_INVALIDOS_ABA = '[]:*?/\\'
+
+def _nome_aba(nome, usados):
+    # Nome válido e único (o Excel não diferencia maiúsculas de minúsculas)
+    base = "".join(c for c in str(nome) if c not in CARACTERES_INVALIDOS_ABA).strip() or 'Sem nome'
+    base = base[:31]
+    candidato = base
+    sufixo = 2
+    while candidato.lower() in usados:
+        candidato = f"{base[:31 - len(str(sufixo)) - 3]} ({sufixo})"
+        sufixo += 1
+    usados.add(candidato.lower())
+    return candidato
+
+def gerar_excel_consolidado(documentos, agrupar_por='Fornecedor', destino=None, pontuacao=None):
+    """
+    Gera um único arquivo com uma aba por fornecedor (ou por unidade) e uma aba 'Resumo' com as
+    pontuações de cada um. Os documentos de avaliação (com a coluna 'Origem') são lidos um a um,
+    ex.: direto do cursor de iterar_avaliacoes, e cada linha é gravada assim que lida.
+    'pontuacao' é o valor de cada resposta (PONTUACAO_RESPOSTAS).
+    Grava em 'destino' ou, sem destino, retorna os bytes do arquivo.
+    """
+    pontuacao = pontuacao or {}
+    colunas = COLUNAS_AVALIACAO + ['Origem']
+
+    saida = BytesIO() if destino is None else destino
+    workbook = xlsxwriter.Workbook(saida, OPCOES_WORKBOOK)
+    try:
+        formatos = criar_formatos(workbook)
+        formato_media = workbook.add_format({'num_format': '0.00'})
+
+        # A aba de resumo é a primeira, mas é escrita no final com os totais acumulados
+        usados = set()
+        resumo = workbook.add_worksheet(_nome_aba(ABA_RESUMO, usados))
+
+        abas = {}
+        for documento in documentos:
+            # Linhas do modelo antigo (sem 'respostas') não são avaliações: como em _tarefas_zip
+            if not documento.get('respostas'):
+                continue
+            grupo = documento.get(agrupar_por) or 'Sem nome'
+            if grupo not in abas:
+                worksheet = workbook.add_worksheet(_nome_aba(grupo, usados))
+                for indice, coluna in enumerate(colunas):
+                    worksheet.set_column(indice, indice, LARGURAS_COLUNAS.get(coluna, 15))
+                worksheet.write_row(0, 0, colunas, formatos['cabecalho'])
+                abas[grupo] = {'aba': worksheet, 'linha': 0, 'avaliacoes': 0, 'respostas': 0,
+                               'pontuadas': 0, 'soma': 0, 'contagem': dict.fromkeys(pontuacao, 0)}
+            aba = abas[grupo]
+            aba['avaliacoes'] += 1
+
+            for linha in linhas_documento(documento):
+                aba['linha'] += 1
+                aba['aba'].write_row(aba['linha'], 0, linha + (documento.get('Origem'),))
+                aba['respostas'] += 1
+                resposta = linha[5]
+                if resposta in pontuacao:
+                    aba['pontuadas'] += 1
+                    aba['soma'] += pontuacao[resposta]
+                    aba['contagem'][resposta] += 1
+
+        colunas_resumo = [agrupar_por, 'Avaliações', 'Respostas', 'Pontuação Média'] + list(pontuacao)
+        resumo.set_column(0, 0, LARGURAS_COLUNAS.get(agrupar_por, 30))
+        resumo.set_column(1, len(colunas_resumo) - 1, 18)
+        resumo.write_row(0, 0, colunas_resumo, formatos['cabecalho'])
+        for indice, grupo in enumerate(sorted(abas), start=1):
+            aba = abas[grupo]
+            media = aba['soma'] / aba['pontuadas'] if aba['pontuadas'] else None
+            resumo.write_row(indice, 0, [grupo, aba['avaliacoes'], aba['respostas']])
+            resumo.write(indice, 3, media, formato_media)
+            resumo.write_row(indice, 4, [aba['contagem'][resposta] for resposta in pontuacao])
+    finally:
+        workbook.close()
+
+    if destino is None:
+        return saida.getvalue()
+    return destino
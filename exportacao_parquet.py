@@ -0,0 +1,126 @@
+import os
+import shutil
+import tempfile
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from avaliacoes_repositorio import iterar_avaliacoes
+
+# Quantidade de respostas convertidas por lote (cada lote vira um RecordBatch)
+TAMANHO_LOTE = 50000
+
+# Colunas de texto com poucos valores distintos: gravadas com codificação de dicionário
+TEXTO = pa.dictionary(pa.int32(), pa.string())
+
+# Esquema das respostas exportadas (uma linha por pergunta)
+ESQUEMA_AVALIACOES = pa.schema([
+    ('Unidade', TEXTO),
+    ('Período', TEXTO),
+    ('Fornecedor', TEXTO),
+    ('categorias', TEXTO),
+    ('Pergunta', TEXTO),
+    ('Resposta', TEXTO),
+    ('Data_Avaliacao', pa.timestamp('ms')),
+    ('origem', TEXTO),
+    ('ano', pa.int16()),
+    ('mes', pa.int8()),
+])
+
+# Colunas usadas como pastas (origem=.../ano=.../mes=...)
+PARTICOES = ['origem', 'ano', 'mes']
+
+def _ano_mes(periodo):
+    # Período no formato DD/MM/AAAA
+    try:
+        _, mes, ano = str(periodo).split('/')
+        return int(ano), int(mes)
+    except (TypeError, ValueError):
+        return None, None
+
+def _novo_lote(esquema):
+    return {campo.name: [] for campo in esquema}
+
+def _converter_lote(lote, esquema):
+    colunas = []
+    for campo in esquema:
+        valores = lote[campo.name]
+        if campo.name == 'Data_Avaliacao':
+            datas = pd.to_datetime(pd.Series(valores, dtype=object), errors='coerce')
+            colunas.append(pa.array(datas, type=campo.type, from_pandas=True))
+        elif pa.types.is_dictionary(campo.type):
+            colunas.append(pa.array(valores, type=pa.string()).dictionary_encode())
+        else:
+            colunas.append(pa.array(valores, type=campo.type))
+    return pa.RecordBatch.from_arrays(colunas, schema=esquema)
+
+def lotes_avaliacoes(documentos, tamanho_lote=TAMANHO_LOTE, esquema=ESQUEMA_AVALIACOES):
+    """
+    Converte documentos de avaliação (com a coluna 'Origem') em RecordBatches do Arrow,
+    uma linha por resposta, sem manter mais de um lote em memória.
+    Se o esquema tiver a coluna 'avaliacao_id', ela recebe o _id do documento.
+    """
+    com_id = 'avaliacao_id' in esquema.names
+    lote = _novo_lote(esquema)
+    linhas = 0
+    for documento in documentos:
+        ano, mes = _ano_mes(documento.get('Período'))
+        for item in documento.get('respostas', []):
+            if com_id:
+                lote['avaliacao_id'].append(str(documento.get('_id')))
+            lote['Unidade'].append(documento.get('Unidade'))
+            lote['Período'].append(documento.get('Período'))
+            lote['Fornecedor'].append(documento.get('Fornecedor'))
+            lote['categorias'].append(item.get('categorias'))
+            lote['Pergunta'].append(item.get('Pergunta'))
+            lote['Resposta'].append(item.get('Resposta'))
+            lote['Data_Avaliacao'].append(documento.get('Data_Avaliacao'))
+            lote['origem'].append(documento.get('Origem'))
+            lote['ano'].append(ano)
+            lote['mes'].append(mes)
+            linhas += 1
+            if linhas >= tamanho_lote:
+                yield _converter_lote(lote, esquema)
+                lote = _novo_lote(esquema)
+                linhas = 0
+    if linhas:
+        yield _converter_lote(lote, esquema)
+
+def exportar_parquet(destino, filtros=None, origem=None, tamanho_lote=TAMANHO_LOTE, progresso=None):
+    """
+    Exporta as avaliações para arquivos Parquet particionados em destino/origem=.../ano=.../mes=...
+    Os documentos são lidos do cursor em lotes e gravados conforme chegam; as partições
+    exportadas novamente são substituídas. 'progresso(linhas)' é chamada a cada lote.
+    Retorna a quantidade de linhas (respostas) exportadas.
+    """
+    total = [0]
+
+    def lotes():
+        for lote in lotes_avaliacoes(iterar_avaliacoes(filtros, origem=origem), tamanho_lote):
+            total[0] += lote.num_rows
+            if progresso:
+                progresso(total[0])
+            yield lote
+
+    ds.write_dataset(
+        lotes(),
+        destino,
+        schema=ESQUEMA_AVALIACOES,
+        format='parquet',
+        partitioning=ds.partitioning(pa.schema([ESQUEMA_AVALIACOES.field(nome) for nome in PARTICOES]), flavor='hive'),
+        existing_data_behavior='delete_matching',
+        basename_template='avaliacoes-{i}.parquet',
+    )
+    return total[0]
+
+def exportar_parquet_zip(filtros=None, origem=None, progresso=None):
+    """
+    Exporta para uma pasta temporária e compacta em um ZIP (para download).
+    Retorna (caminho do ZIP, linhas exportadas); o ZIP deve ser removido por quem chamou.
+    """
+    pasta = tempfile.mkdtemp()
+    try:
+        linhas = exportar_parquet(os.path.join(pasta, 'avaliacoes'), filtros, origem, progresso=progresso)
+        caminho_zip = shutil.make_archive(os.path.join(tempfile.gettempdir(), os.path.basename(pasta)), 'zip', pasta)
+    finally:
+        shutil.rmtree(pasta, ignore_errors=True)
+    return caminho_zip, linhas
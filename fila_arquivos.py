@@ -0,0 +1,227 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import gridfs
+from bson import ObjectId
+from pymongo import ReturnDocument
+from mongodb_config import get_database
+from avaliacoes_repositorio import COLECOES_POR_ORIGEM, montar_filtro
+from exportacao_excel import gerar_excel_avaliacao, gerar_nome_arquivo_avaliacao, MIME_EXCEL
+
+# Fila (outbox) com os arquivos Excel a gerar para cada avaliação enviada
+COLECAO_FILA = "fila_arquivos"
+
+# Bucket do GridFS onde os arquivos gerados ficam armazenados
+BUCKET_ARQUIVOS = "arquivos_avaliacao"
+
+# Situações de uma tarefa da fila
+STATUS_PENDENTE = "pendente"
+STATUS_PROCESSANDO = "processando"
+STATUS_CONCLUIDO = "concluido"
+STATUS_ERRO = "erro"
+
+# Quantidade de threads que processam a fila em segundo plano
+WORKERS_FILA = 2
+
+# Tentativas antes de marcar a tarefa como erro
+MAX_TENTATIVAS = 3
+
+# Tarefas em processamento há mais tempo que isso são consideradas abandonadas (ex.: reinício do app)
+TEMPO_LIMITE_PROCESSAMENTO = timedelta(minutes=10)
+
+# Folga da varredura de avaliações sem tarefa (criado_em é hora local e o _id, UTC)
+MARGEM_VARREDURA = timedelta(days=1)
+
+_executor = None
+_executor_lock = threading.Lock()
+
+def enfileirar_arquivo(documento, origem, db=None):
+    """
+    Registra na fila a geração do arquivo Excel de uma avaliação já gravada.
+    A tarefa usa o _id da avaliação, então reenviar a mesma avaliação apenas a recoloca como pendente.
+    """
+    if db is None:
+        db = get_database()
+
+    agora = datetime.now()
+    db[COLECAO_FILA].update_one(
+        {"_id": documento["_id"]},
+        {
+            "$set": {
+                "origem": origem,
+                "Fornecedor": documento.get("Fornecedor"),
+                "Unidade": documento.get("Unidade"),
+                "Período": documento.get("Período"),
+                "nome_arquivo": gerar_nome_arquivo_avaliacao(
+                    documento.get("Fornecedor", ""), documento.get("Período", ""), documento.get("Unidade", ""), origem
+                ),
+                "status": STATUS_PENDENTE,
+                "tentativas": 0,
+                "erro": None,
+                "atualizado_em": agora,
+            },
+            "$setOnInsert": {"criado_em": agora},
+        },
+        upsert=True
+    )
+    return documento["_id"]
+
+def enfileirar_avaliacoes_sem_tarefa(db=None):
+    """
+    Varredura executada na inicialização: registra na fila as avaliações gravadas sem tarefa
+    (ex.: o app parou entre a gravação da avaliação e o registro na fila). Considera apenas as
+    avaliações gravadas desde a primeira tarefa, para não gerar arquivos de avaliações anteriores à fila.
+    Retorna a quantidade de tarefas criadas.
+    """
+    if db is None:
+        db = get_database()
+
+    primeira = db[COLECAO_FILA].find_one({}, {"criado_em": 1}, sort=[("criado_em", 1)])
+    if primeira is None:
+        return 0
+    desde = ObjectId.from_datetime(primeira["criado_em"] - MARGEM_VARREDURA)
+
+    criadas = 0
+    for origem, nome_colecao in COLECOES_POR_ORIGEM.items():
+        pipeline = [
+            {"$match": {"_id": {"$gte": desde}, "respostas": {"$exists": True}}},
+            {"$project": {"Fornecedor": 1, "Unidade": 1, "Período": 1}},
+            {"$lookup": {"from": COLECAO_FILA, "localField": "_id", "foreignField": "_id", "as": "tarefa"}},
+            {"$match": {"tarefa": {"$size": 0}}},
+        ]
+        for documento in db[nome_colecao].aggregate(pipeline):
+            enfileirar_arquivo(documento, origem, db)
+            criadas += 1
+    if criadas:
+        processar_fila(db)
+    return criadas
+
+def remover_arquivos(avaliacao_ids, db=None):
+    """
+    Remove as tarefas da fila e os arquivos gerados das avaliações excluídas.
+    Um worker que ainda esteja gerando o arquivo descarta o resultado ao não encontrar a tarefa.
+    """
+    if not avaliacao_ids:
+        return 0
+    if db is None:
+        db = get_database()
+
+    fs = gridfs.GridFS(db, collection=BUCKET_ARQUIVOS)
+    removidas = 0
+    for avaliacao_id in avaliacao_ids:
+        # Remover a tarefa e obter o arquivo em uma única operação (não perde um arquivo recém-concluído)
+        tarefa = db[COLECAO_FILA].find_one_and_delete({"_id": avaliacao_id}, projection={"arquivo_id": 1})
+        if tarefa is None:
+            continue
+        removidas += 1
+        if tarefa.get("arquivo_id"):
+            fs.delete(tarefa["arquivo_id"])
+    return removidas
+
+def _reservar_tarefa(db):
+    # Marcar a próxima tarefa como em processamento (só um worker consegue reservá-la)
+    agora = datetime.now()
+    limite = agora - TEMPO_LIMITE_PROCESSAMENTO
+    # Tarefas abandonadas que já esgotaram as tentativas não voltam a ser processadas
+    db[COLECAO_FILA].update_many(
+        {"status": STATUS_PROCESSANDO, "atualizado_em": {"$lt": limite}, "tentativas": {"$gte": MAX_TENTATIVAS}},
+        {"$set": {"status": STATUS_ERRO, "erro": "Tempo limite de processamento excedido", "atualizado_em": agora}}
+    )
+    return db[COLECAO_FILA].find_one_and_update(
+        {"$or": [
+            {"status": STATUS_PENDENTE},
+            {"status": STATUS_PROCESSANDO, "atualizado_em": {"$lt": limite}, "tentativas": {"$lt": MAX_TENTATIVAS}},
+        ]},
+        {"$set": {"status": STATUS_PROCESSANDO, "atualizado_em": agora}, "$inc": {"tentativas": 1}},
+        sort=[("criado_em", 1)],
+        return_document=ReturnDocument.AFTER
+    )
+
+def _processar_tarefa(db, tarefa):
+    documento = db[COLECOES_POR_ORIGEM[tarefa["origem"]]].find_one({"_id": tarefa["_id"]})
+    if documento is None:
+        raise ValueError("Avaliação não encontrada")
+
+    fs = gridfs.GridFS(db, collection=BUCKET_ARQUIVOS)
+    arquivo_id = fs.put(
+        gerar_excel_avaliacao(documento),
+        filename=tarefa["nome_arquivo"],
+        contentType=MIME_EXCEL,
+        metadata={"avaliacao_id": tarefa["_id"], "origem": tarefa["origem"]}
+    )
+
+    # Concluir apenas se a tarefa não foi recolocada na fila enquanto o arquivo era gerado
+    anterior = db[COLECAO_FILA].find_one_and_update(
+        {"_id": tarefa["_id"], "status": STATUS_PROCESSANDO, "atualizado_em": tarefa["atualizado_em"]},
+        {"$set": {"status": STATUS_CONCLUIDO, "arquivo_id": arquivo_id, "concluido_em": datetime.now()}}
+    )
+    if anterior is None:
+        fs.delete(arquivo_id)
+    elif anterior.get("arquivo_id"):
+        # Remover o arquivo de um envio anterior da mesma avaliação
+        fs.delete(anterior["arquivo_id"])
+
+def _registrar_falha(db, tarefa, erro):
+    status = STATUS_ERRO if tarefa.get("tentativas", 0) >= MAX_TENTATIVAS else STATUS_PENDENTE
+    db[COLECAO_FILA].update_one(
+        {"_id": tarefa["_id"], "status": STATUS_PROCESSANDO, "atualizado_em": tarefa["atualizado_em"]},
+        {"$set": {"status": status, "erro": str(erro), "atualizado_em": datetime.now()}}
+    )
+
+def _esvaziar_fila(db):
+    # Executado nas threads do pool: processa tarefas até a fila ficar vazia
+    processadas = 0
+    while True:
+        try:
+            tarefa = _reservar_tarefa(db)
+        except Exception as e:
+            print(f"Erro ao reservar tarefa da fila de arquivos: {str(e)}")
+            return processadas
+        if tarefa is None:
+            return processadas
+        try:
+            _processar_tarefa(db, tarefa)
+            processadas += 1
+        except Exception as e:
+            print(f"Erro ao gerar arquivo da avaliação {tarefa['_id']}: {str(e)}")
+            _registrar_falha(db, tarefa, e)
+
+def _get_executor():
+    # Pool único por processo, compartilhado por todas as sessões
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=WORKERS_FILA, thread_name_prefix="fila_arquivos")
+        return _executor
+
+def processar_fila(db=None):
+    """
+    Aciona o processamento da fila em segundo plano e retorna imediatamente.
+    """
+    if db is None:
+        db = get_database()
+    return _get_executor().submit(_esvaziar_fila, db)
+
+def listar_arquivos(filtros=None, origem=None, limite=20):
+    """
+    Retorna as tarefas da fila (mais recentes primeiro) com a situação de cada arquivo.
+    """
+    query = montar_filtro(filtros)
+    if origem:
+        query["origem"] = origem
+
+    db = get_database()
+    cursor = db[COLECAO_FILA].find(query).sort("criado_em", -1).limit(limite)
+    return list(cursor)
+
+def get_status_arquivo(avaliacao_id):
+    db = get_database()
+    return db[COLECAO_FILA].find_one({"_id": avaliacao_id})
+
+def baixar_arquivo(arquivo_id):
+    """
+    Retorna o conteúdo de um arquivo gerado pela fila.
+    """
+    db = get_database()
+    fs = gridfs.GridFS(db, collection=BUCKET_ARQUIVOS)
+    return fs.get(arquivo_id).read()
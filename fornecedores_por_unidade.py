@@ -1,86 +1,228 @@
-fornecedores_por_unidade = {
-    'CANTINA FREITAS': ['CSA-BH'],
-    'EXPRESSA TURISMO LTDA': ['CSA-BH', 'CSA-CT', 'CSA-NL', 'CSA-GZ', 'CSA-DV'],
-    'ACREDITE EXCURSÕES E EXPOSIÇÕES INTINERANTE LTDA': ['CSA-BH'],
-    'LEAL VIAGENS E TURISMO': ['CSA-BH'],
-    'MINASCOPY NACIONAL EIRELI': ['CSA-BH', 'CSA-CT', 'CSA-NL', 'CSA-GZ', 'CSA-DV'],
-    'OTIMIZA VIGILÂNCIA E SEG. PATRIMONIAL': ['CSA-BH', 'CSA-NL', 'CSA-GZ'],
-    'PETRUS LOCACAO E SERVICOS LTDA': ['CSA-CT', 'EPSA', 'CSA-GZ', 'CSA-NL', 'CSA-BH'],
-    'REAL VANS LOCAÇÕES': ['CSA-GZ'],
-    'AC TRANSPORTES E SERVIÇOS LTDA - ACTUR': ['CSA-BH', 'CSA-CT', 'CSA-GZ', 'CSA-NL', 'EPSA'],
-    'TRANSCELO TRANSPORTES LTDA': ['CSA-BH'],
-    'AC Transportes e Serviços LTDA': [],
-    'GULP SÃO TOMAS': ['EPSA'],
-    'NUTRIMIX - EXCELÊNCIA EM ALIMENTAÇÃO': ['CSA-CT'],
-    'SALADA & TAL ( PAOLA OLIVEIRA COSTA )ELEVADORES ATLAS SCHINDLER LTDA': ['CSA-NL'],
-    'TK ELEVADORES BRASIL LTDA': [],
-    'ELEVAÇO LTDA': ['EPSA'],
-    'JD CONSERVAÇÃO E SERVIÇOS': ['CSA-GZ'],
-    'QA - IT ANSWER - CONSULTORIA - N1': ['SIC SEDE'],
-    'QA - IT ANSWER - CONSULTORIA - N2': ['SIC SEDE'],
-    'MODERNA TURISMO LTDA': ['CSA-BH', 'CSA-CT', 'CSA-NL', 'CSA-GZ', 'CSA-DV'],
-    'XINGU ELEVADORES': [],
-    'PHP SERVICE EIRELI': ['ILALI'],
-    'CAMPOS DE MINAS SERV. ORG. PROG.TURÍSTICOS': ['CSA-CT', 'CSA-GZ'],
-    'ACCESS GESTÃO DE DOCUMENTOS LTDA': ['SIC SEDE'],
-    'BOCAINA CIENCIAS NATURAIS & EDUCACAO AMBIENTAL': [],
-    'NOVA FORMA VIAGENS E TURISMO': [],
-    'CONSERVADORA CIDADE LC': ['SIC SEDE'],
-    'CONSERVADORA CIDADE PC': ['SIC SEDE'],
-    'OTIS ELEVADORES': [],
-    'ELEVADORES ATLAS SCHINDLER': ['CSA-CT', 'CSA-GZ'],
-    'FORMA CONHECER CIDADES LTDA': ['CSA-NL']
-}
-
 # Adicionar no início do arquivo
+import pandas as pd
+from bisect import bisect_left
+from collections.abc import Mapping
+from pymongo import UpdateOne
 from mongodb_config import get_database
-import streamlit as st
+from catalogo_versao import incrementar_versao
+from catalogo_cache import get_cache
+from dados_locais import carregar_dados_locais
+
+# Dados originais, lidos de dados/fornecedores_por_unidade.json apenas quando acessados
+def __getattr__(nome):
+    if nome == "fornecedores_por_unidade":
+        return carregar_dados_locais("fornecedores_por_unidade")
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+class CatalogoFornecedores(dict):
+    """
+    {fornecedor: (unidades)} com o índice inverso {unidade: (fornecedores em ordem alfabética)}.
+    O índice é atualizado a cada inclusão, alteração ou remoção de fornecedor, sem reconstrução.
+    Os valores são tuplas, para que possam ser compartilhados sem cópia.
+    """
+    def __init__(self, dados=None):
+        super().__init__()
+        # Carga completa em uma passada: agrupar por unidade e ordenar uma vez
+        # (as inclusões e alterações avulsas usam _indexar)
+        por_unidade = {}
+        for fornecedor, unidades in dict(dados or {}).items():
+            unidades = tuple(unidades)
+            super().__setitem__(fornecedor, unidades)
+            for unidade in unidades:
+                por_unidade.setdefault(unidade, set()).add(fornecedor)
+        self._por_unidade = {unidade: tuple(sorted(nomes)) for unidade, nomes in por_unidade.items()}
+
+    def _indexar(self, fornecedor, unidades):
+        for unidade in unidades:
+            lista = self._por_unidade.get(unidade, ())
+            posicao = bisect_left(lista, fornecedor)
+            if posicao == len(lista) or lista[posicao] != fornecedor:
+                self._por_unidade[unidade] = lista[:posicao] + (fornecedor,) + lista[posicao:]
+
+    def _desindexar(self, fornecedor, unidades):
+        for unidade in unidades:
+            lista = self._por_unidade.get(unidade, ())
+            posicao = bisect_left(lista, fornecedor)
+            if posicao < len(lista) and lista[posicao] == fornecedor:
+                self._por_unidade[unidade] = lista[:posicao] + lista[posicao + 1:]
+
+    def __setitem__(self, fornecedor, unidades):
+        if fornecedor in self:
+            self._desindexar(fornecedor, self[fornecedor])
+        super().__setitem__(fornecedor, tuple(unidades))
+        self._indexar(fornecedor, unidades)
+
+    def __delitem__(self, fornecedor):
+        self._desindexar(fornecedor, self[fornecedor])
+        super().__delitem__(fornecedor)
+
+    def pop(self, fornecedor, *padrao):
+        if fornecedor in self:
+            unidades = self[fornecedor]
+            del self[fornecedor]
+            return unidades
+        if padrao:
+            return padrao[0]
+        raise KeyError(fornecedor)
+
+    def update(self, *args, **kwargs):
+        for fornecedor, unidades in dict(*args, **kwargs).items():
+            self[fornecedor] = unidades
+
+    def fornecedores_da_unidade(self, unidade):
+        # Tupla já ordenada, mantida pelo índice
+        return self._por_unidade.get(unidade, ())
+
+    def unidades_do_fornecedor(self, fornecedor):
+        return self.get(fornecedor, ())
 
-# Usar cache para melhorar performance
-@st.cache_data(ttl=300)  # Cache por 5 minutos
-def get_fornecedores():
+    def copia(self):
+        # Copiar dados e índice sem reordenar (as tuplas são compartilhadas)
+        nova = CatalogoFornecedores()
+        dict.update(nova, self)
+        nova._por_unidade = dict(self._por_unidade)
+        return nova
+
+class VisaoFornecedores(Mapping):
+    """
+    Visão somente leitura de um CatalogoFornecedores, entregue às páginas sem copiar o catálogo.
+    """
+    def __init__(self, catalogo):
+        self._catalogo = catalogo
+
+    def __getitem__(self, fornecedor):
+        return self._catalogo[fornecedor]
+
+    def __iter__(self):
+        return iter(self._catalogo)
+
+    def __len__(self):
+        return len(self._catalogo)
+
+    def fornecedores_da_unidade(self, unidade):
+        return self._catalogo.fornecedores_da_unidade(unidade)
+
+    def unidades_do_fornecedor(self, fornecedor):
+        return self._catalogo.unidades_do_fornecedor(fornecedor)
+
+    def copia(self):
+        # Para quem precisa alterar o catálogo localmente
+        return self._catalogo.copia()
+
+def montar_fornecedores(documentos):
+    # Converter os documentos da coleção em {fornecedor: [unidades]} com o índice por unidade
+    return CatalogoFornecedores((doc["fornecedor"], doc["unidades"]) for doc in documentos)
+
+def _carregar_fornecedores():
     db = get_database()
     collection = db["fornecedores"]
     
-    # Verificar se já existem fornecedores no banco
-    if collection.count_documents({}) == 0:
-        # Se não existir, inicializar com os dados padrão
-        for fornecedor, unidades in fornecedores_por_unidade.items():
-            collection.insert_one({
-                "fornecedor": fornecedor,
-                "unidades": unidades
-            })
-    
-    # Buscar todos os fornecedores
-    result = {}
-    for doc in collection.find():
-        result[doc["fornecedor"]] = doc["unidades"]
-    
-    return result
+    # Buscar todos os fornecedores (a carga inicial é feita em carga_inicial.py)
+    return montar_fornecedores(collection.find({}, {"_id": 0, "fornecedor": 1, "unidades": 1}))
+
+def get_cache_fornecedores():
+    # Copy-on-write: as alterações geram um novo catálogo e o entregue às páginas nunca muda
+    return get_cache("fornecedores", _carregar_fornecedores, copiar=CatalogoFornecedores.copia)
+
+# Usar cache para melhorar performance: recarrega apenas quando a versão do catálogo muda
+def get_fornecedores(versao=None):
+    # Visão somente leitura do catálogo em cache, sem cópia (use .copia() para alterar)
+    return VisaoFornecedores(get_cache_fornecedores().obter(versao))
 
 def add_fornecedor(nome, unidades):
     if nome and unidades:
         db = get_database()
         collection = db["fornecedores"]
         
-        # Verificar se o fornecedor já existe
-        existing = collection.find_one({"fornecedor": nome})
-        
-        if existing:
-            # Atualizar unidades do fornecedor existente
-            collection.update_one(
-                {"fornecedor": nome},
-                {"$set": {"unidades": unidades}}
-            )
-        else:
-            # Adicionar novo fornecedor
-            collection.insert_one({
-                "fornecedor": nome,
-                "unidades": unidades
-            })
+        # Criar ou atualizar o fornecedor em uma única operação
+        collection.update_one(
+            {"fornecedor": nome},
+            {"$set": {"unidades": unidades}},
+            upsert=True
+        )
+        nova_versao = incrementar_versao("fornecedores")
+        get_cache_fornecedores().atualizar_entrada(nome, list(unidades), nova_versao)
         return True
     return False
 
+def ler_planilha_fornecedores(arquivo, nome_arquivo):
+    """
+    Lê um arquivo CSV ou XLSX com as colunas Fornecedor e Unidades (separadas por vírgula
+    ou ponto e vírgula) ou com uma linha por fornecedor e Unidade.
+    Retorna {fornecedor: [unidades]}.
+    """
+    if nome_arquivo.lower().endswith(".csv"):
+        df = pd.read_csv(arquivo, sep=None, engine="python", dtype=str, encoding="utf-8-sig")
+    else:
+        df = pd.read_excel(arquivo, dtype=str)
+    
+    # Localizar as colunas sem diferenciar maiúsculas/minúsculas
+    colunas = {str(c).strip().lower(): c for c in df.columns}
+    coluna_fornecedor = colunas.get("fornecedor") or colunas.get("nome")
+    coluna_unidades = colunas.get("unidades") or colunas.get("unidade")
+    if coluna_fornecedor is None or coluna_unidades is None:
+        raise ValueError("O arquivo deve ter as colunas 'Fornecedor' e 'Unidades'")
+    
+    fornecedores = {}
+    for fornecedor, unidades in zip(df[coluna_fornecedor], df[coluna_unidades]):
+        if pd.isna(fornecedor) or not str(fornecedor).strip():
+            continue
+        lista = fornecedores.setdefault(str(fornecedor).strip(), [])
+        if pd.isna(unidades):
+            continue
+        for unidade in str(unidades).replace(";", ",").split(","):
+            unidade = unidade.strip()
+            if unidade and unidade not in lista:
+                lista.append(unidade)
+    return fornecedores
+
+def validar_fornecedores(fornecedores, unidades_validas=None):
+    """
+    Separa os fornecedores importáveis dos que têm problemas (sem unidades ou com unidades
+    que não existem no cadastro). Retorna (validos, erros).
+    """
+    if unidades_validas is None:
+        from unidades import get_unidades
+        unidades_validas = get_unidades()
+    unidades_validas = set(unidades_validas)
+    
+    validos = {}
+    erros = []
+    for fornecedor, unidades in fornecedores.items():
+        desconhecidas = [u for u in unidades if u not in unidades_validas]
+        if not unidades:
+            erros.append(f"{fornecedor}: nenhuma unidade informada")
+        elif desconhecidas:
+            erros.append(f"{fornecedor}: unidades não cadastradas ({', '.join(desconhecidas)})")
+        else:
+            validos[fornecedor] = unidades
+    return validos, erros
+
+def importar_fornecedores(fornecedores):
+    """
+    Cria ou atualiza vários fornecedores com um único bulk_write (upsert por nome).
+    Retorna (criados, atualizados).
+    """
+    if not fornecedores:
+        return 0, 0
+    
+    db = get_database()
+    collection = db["fornecedores"]
+    
+    operacoes = [
+        UpdateOne({"fornecedor": nome}, {"$set": {"unidades": unidades}}, upsert=True)
+        for nome, unidades in fornecedores.items()
+    ]
+    resultado = collection.bulk_write(operacoes, ordered=False)
+    
+    # Atualizar o cache deste processo com os fornecedores importados (write-through)
+    nova_versao = incrementar_versao("fornecedores")
+    def alteracao(dados):
+        dados.update({nome: list(unidades) for nome, unidades in fornecedores.items()})
+    get_cache_fornecedores().aplicar(nova_versao, alteracao)
+    
+    return resultado.upserted_count, resultado.matched_count
+
 def remove_fornecedor(nome):
     if nome:
         db = get_database()
@@ -88,17 +230,20 @@ def remove_fornecedor(nome):
         
         # Remover o fornecedor
         result = collection.delete_one({"fornecedor": nome})
+        if result.deleted_count > 0:
+            nova_versao = incrementar_versao("fornecedores")
+            get_cache_fornecedores().remover_entrada(nome, nova_versao)
         return result.deleted_count > 0
     return False
 
-def get_fornecedores_por_unidade(unidade):
-    db = get_database()
-    collection = db["fornecedores"]
-    
-    # Buscar fornecedores que atendem a unidade específica
-    result = collection.find({"unidades": unidade})
-    return [doc["fornecedor"] for doc in result]
+def get_fornecedores_por_unidade(unidade, versao=None):
+    # Fornecedores que atendem a unidade, em ordem alfabética, a partir do índice em cache
+    return list(get_cache_fornecedores().obter(versao).fornecedores_da_unidade(unidade))
+
+def get_unidades_do_fornecedor(fornecedor, versao=None):
+    return list(get_cache_fornecedores().obter(versao).unidades_do_fornecedor(fornecedor))
 
 # Inicializar a coleção se for a primeira execução
 if __name__ == "__main__":
-    get_fornecedores()
+    from carga_inicial import garantir_carga_inicial
+    garantir_carga_inicial()
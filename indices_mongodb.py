@@ -0,0 +1,185 @@
+import pandas as pd
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import OperationFailure
+from mongodb_config import get_database
+from avaliacoes_repositorio import RETENCAO_EXCLUSOES
+
+# Códigos de erro de um índice que já existe com outra definição
+CODIGOS_INDICE_DIFERENTE = (85, 86)
+
+# Uma avaliação por (fornecedor, unidade, período), considerando apenas os documentos do modelo atual:
+# as linhas do modelo antigo (uma por pergunta) repetem a chave e continuam podendo ser gravadas e restauradas
+UNICO_AVALIACAO = {"unique": True, "partialFilterExpression": {"respostas": {"$exists": True}}}
+
+# Índices de cada coleção: (nome, chaves, opções)
+INDICES = {
+    "fornecedores": [
+        ("fornecedor_unico", [("fornecedor", ASCENDING)], {"unique": True}),
+        ("unidades", [("unidades", ASCENDING)], {}),
+    ],
+    "perguntas": [
+        ("fornecedor_categoria_unico", [("fornecedor", ASCENDING), ("categoria", ASCENDING)], {"unique": True}),
+    ],
+    "avaliacoes": [
+        ("fornecedor_unidade_periodo", [("Fornecedor", ASCENDING), ("Unidade", ASCENDING), ("Período", ASCENDING)], UNICO_AVALIACAO),
+        ("periodo_unidade", [("Período", ASCENDING), ("Unidade", ASCENDING)], {}),
+        ("data_avaliacao", [("Data_Avaliacao", DESCENDING)], {}),
+    ],
+    "avaliacoes_adm": [
+        ("fornecedor_unidade_periodo", [("Fornecedor", ASCENDING), ("Unidade", ASCENDING), ("Período", ASCENDING)], UNICO_AVALIACAO),
+        ("periodo_unidade", [("Período", ASCENDING), ("Unidade", ASCENDING)], {}),
+        ("data_avaliacao", [("Data_Avaliacao", DESCENDING)], {}),
+    ],
+    "avaliacoes_resumo": [
+        ("resumo_chave_unica", [("Período", ASCENDING), ("Unidade", ASCENDING), ("Fornecedor", ASCENDING), ("categoria", ASCENDING), ("origem", ASCENDING)], {"unique": True}),
+    ],
+    "fila_arquivos": [
+        ("status_criado_em", [("status", ASCENDING), ("criado_em", ASCENDING)], {}),
+        ("unidade_periodo", [("Unidade", ASCENDING), ("Período", ASCENDING), ("criado_em", DESCENDING)], {}),
+    ],
+    "avaliacoes_excluidas": [
+        ("excluido_em_ttl", [("excluido_em", ASCENDING)], {"expireAfterSeconds": int(RETENCAO_EXCLUSOES.total_seconds())}),
+    ],
+}
+
+# Índices criados por versões anteriores e que não são mais usados: {coleção: [nomes]}.
+# 'unidades' tem um único documento com a lista inteira, e o índice só custava espaço e escrita.
+INDICES_REMOVIDOS = {
+    "unidades": ["unidades"],
+}
+
+# Consultas mais frequentes de cada coleção, usadas para confirmar a cobertura dos índices
+CONSULTAS_FREQUENTES = {
+    "fornecedores": [
+        ("add_fornecedor", {"fornecedor": ""}),
+        ("get_fornecedores_por_unidade", {"unidades": ""}),
+    ],
+    "perguntas": [
+        ("perguntas_por_fornecedor", {"fornecedor": "", "categoria": ""}),
+    ],
+    "avaliacoes": [
+        ("salvar_avaliacao", {"Fornecedor": "", "Unidade": "", "Período": "", "respostas": {"$exists": True}}),
+        ("excluir_avaliacao_mongodb", {"Fornecedor": "", "Unidade": "", "Período": ""}),
+    ],
+    "avaliacoes_adm": [
+        ("salvar_avaliacao", {"Fornecedor": "", "Unidade": "", "Período": "", "respostas": {"$exists": True}}),
+        ("excluir_avaliacao_mongodb", {"Fornecedor": "", "Unidade": "", "Período": ""}),
+    ],
+}
+
+def _recriar_indice(collection, nome, chaves, opcoes):
+    # Trocar a definição de um índice existente (ex.: passar a ser único).
+    # Se o novo índice não puder ser criado, recriar o anterior sem 'unique' para manter as consultas cobertas.
+    if opcoes.get("unique"):
+        duplicadas = list(collection.aggregate([
+            {"$match": opcoes.get("partialFilterExpression", {})},
+            {"$group": {"_id": {campo: f"${campo}" for campo, _ in chaves}, "total": {"$sum": 1}}},
+            {"$match": {"total": {"$gt": 1}}},
+            {"$limit": 1}
+        ], allowDiskUse=True))
+        if duplicadas:
+            raise OperationFailure(f"Existem documentos duplicados para a chave {duplicadas[0]['_id']}")
+    collection.drop_index(nome)
+    try:
+        collection.create_index(chaves, name=nome, **opcoes)
+    except OperationFailure:
+        collection.create_index(chaves, name=nome, **{k: v for k, v in opcoes.items() if k != "unique"})
+        raise
+
+def criar_indices(collection, nome_colecao=None):
+    """
+    Cria em 'collection' os índices definidos para nome_colecao (padrão: o nome da própria coleção).
+    Permite criar os índices de uma coleção temporária antes de usá-la no lugar da original.
+    Retorna a lista de erros encontrados.
+    """
+    nome_colecao = nome_colecao or collection.name
+    erros = []
+    for nome, chaves, opcoes in INDICES.get(nome_colecao, []):
+        try:
+            try:
+                collection.create_index(chaves, name=nome, **opcoes)
+            except OperationFailure as e:
+                if e.code not in CODIGOS_INDICE_DIFERENTE:
+                    raise
+                _recriar_indice(collection, nome, chaves, opcoes)
+        except OperationFailure as e:
+            erros.append(f"{nome_colecao}.{nome}: {str(e)}")
+            print(f"Erro ao criar índice {nome} na coleção {nome_colecao}: {str(e)}")
+    return erros
+
+def garantir_indices(db=None):
+    """
+    Cria os índices de todas as coleções. Pode ser executada várias vezes:
+    índices já existentes com a mesma definição são mantidos.
+    Retorna a lista de erros encontrados (ex.: duplicidades que impedem um índice único).
+    """
+    if db is None:
+        db = get_database()
+
+    erros = []
+    for nome_colecao in INDICES.keys():
+        erros.extend(criar_indices(db[nome_colecao]))
+    for nome_colecao, nomes in INDICES_REMOVIDOS.items():
+        existentes = db[nome_colecao].index_information()
+        for nome in nomes:
+            if nome in existentes:
+                db[nome_colecao].drop_index(nome)
+    return erros
+
+def relatorio_uso_indices(db=None):
+    """
+    Retorna um DataFrame com o número de acessos de cada índice ($indexStats).
+    """
+    if db is None:
+        db = get_database()
+
+    linhas = []
+    for nome_colecao in INDICES.keys():
+        try:
+            for stats in db[nome_colecao].aggregate([{"$indexStats": {}}]):
+                linhas.append({
+                    "Coleção": nome_colecao,
+                    "Índice": stats["name"],
+                    "Acessos": stats.get("accesses", {}).get("ops", 0),
+                    "Desde": stats.get("accesses", {}).get("since"),
+                })
+        except OperationFailure as e:
+            print(f"Erro ao obter uso dos índices da coleção {nome_colecao}: {str(e)}")
+    return pd.DataFrame(linhas, columns=["Coleção", "Índice", "Acessos", "Desde"])
+
+def _estagios_plano(plano):
+    # Percorrer o plano vencedor e coletar os estágios (IXSCAN, COLLSCAN, FETCH...)
+    estagios = []
+    while plano:
+        estagios.append(plano.get("stage"))
+        if "indexName" in plano:
+            estagios[-1] = f"{plano['stage']} ({plano['indexName']})"
+        plano = plano.get("inputStage") or (plano.get("inputStages") or [None])[0]
+    return estagios
+
+def verificar_consultas_frequentes(db=None):
+    """
+    Executa explain() nas consultas mais frequentes e indica se cada uma usa índice.
+    """
+    if db is None:
+        db = get_database()
+
+    linhas = []
+    for nome_colecao, consultas in CONSULTAS_FREQUENTES.items():
+        for origem, filtro in consultas:
+            try:
+                plano = db[nome_colecao].find(filtro).explain()["queryPlanner"]["winningPlan"]
+                estagios = _estagios_plano(plano)
+                linhas.append({
+                    "Coleção": nome_colecao,
+                    "Consulta": origem,
+                    "Plano": " <- ".join(str(e) for e in estagios),
+                    "Usa índice": not any(str(e).startswith("COLLSCAN") for e in estagios),
+                })
+            except Exception as e:
+                linhas.append({"Coleção": nome_colecao, "Consulta": origem, "Plano": f"Erro: {str(e)}", "Usa índice": False})
+    return pd.DataFrame(linhas, columns=["Coleção", "Consulta", "Plano", "Usa índice"])
+
+# Criar os índices manualmente
+if __name__ == "__main__":
+    garantir_indices()
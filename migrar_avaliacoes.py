@@ -0,0 +1,158 @@
+from pymongo import ReplaceOne, UpdateOne
+from mongodb_config import get_database
+from avaliacoes_repositorio import COLECOES_POR_ORIGEM, CAMPOS_RESPOSTA, registrar_exclusoes
+from resumo_avaliacoes import reconstruir_resumo
+
+# Documentos no modelo antigo: uma linha por pergunta, sem o array 'respostas'
+FILTRO_LEGADO = {'respostas': {'$exists': False}}
+
+def contar_registros_legados(origem=None):
+    db = get_database()
+    origens = [origem] if origem else list(COLECOES_POR_ORIGEM.keys())
+    return {o: db[COLECOES_POR_ORIGEM[o]].count_documents(FILTRO_LEGADO) for o in origens}
+
+def _respostas_unicas(respostas):
+    # Envios repetidos no mesmo segundo caem no mesmo grupo: manter a última resposta de cada pergunta
+    unicas = {}
+    for item in respostas:
+        unicas[(item.get('categorias'), item.get('Pergunta'))] = item
+    return list(unicas.values())
+
+def _avaliacoes_atuais(collection, lote):
+    # Avaliações já no modelo novo para as chaves do lote: {(Fornecedor, Unidade, Período): documento}
+    chaves = [dict(grupo['_id']) for grupo in lote]
+    atuais = {}
+    consulta = {'$or': chaves, 'respostas': {'$exists': True}}
+    for documento in collection.find(consulta, {'Fornecedor': 1, 'Unidade': 1, 'Período': 1, 'Data_Avaliacao': 1}):
+        atuais[(documento.get('Fornecedor'), documento.get('Unidade'), documento.get('Período'))] = documento
+    return atuais
+
+def _gravar_lote(collection, lote):
+    # Criar os documentos novos e só então remover as linhas antigas (de todos os envios da chave).
+    # Uma avaliação já no modelo novo só é substituída se o envio antigo for mais recente;
+    # se o processo for interrompido, a próxima execução encontra o documento criado e não duplica.
+    atuais = _avaliacoes_atuais(collection, lote)
+    operacoes = []
+    ids_antigos = []
+    for grupo in lote:
+        chave = dict(grupo['_id'])
+        documento = dict(chave)
+        documento['Data_Avaliacao'] = grupo['Data_Avaliacao']
+        documento['respostas'] = _respostas_unicas(grupo['respostas'])
+        for ids in grupo['ids']:
+            ids_antigos.extend(ids)
+
+        atual = atuais.get((chave.get('Fornecedor'), chave.get('Unidade'), chave.get('Período')))
+        if atual is None:
+            filtro = dict(chave)
+            filtro['respostas'] = {'$exists': True}
+            operacoes.append(UpdateOne(filtro, {'$setOnInsert': documento}, upsert=True))
+        elif str(atual.get('Data_Avaliacao') or '') < str(grupo['Data_Avaliacao'] or ''):
+            # Substituir apenas se a avaliação atual não mudou desde a leitura
+            filtro = {'_id': atual['_id'], 'Data_Avaliacao': atual.get('Data_Avaliacao')}
+            operacoes.append(ReplaceOne(filtro, documento))
+
+    if operacoes:
+        collection.bulk_write(operacoes, ordered=False)
+    collection.delete_many({'_id': {'$in': ids_antigos}})
+    return len(ids_antigos)
+
+def migrar_colecao(nome_colecao, tamanho_lote=200, progresso=None, db=None):
+    """
+    Converte as linhas de uma coleção (uma por pergunta) em documentos de avaliação
+    com as respostas embutidas. Cada (fornecedor, unidade, período) vira um único documento
+    com o envio mais recente; as linhas dos envios anteriores são descartadas.
+    Processa em lotes e pode ser executada novamente para retomar uma migração interrompida.
+    Retorna (avaliações migradas, linhas convertidas).
+    """
+    if db is None:
+        db = get_database()
+    collection = db[nome_colecao]
+
+    pipeline = [
+        {'$match': FILTRO_LEGADO},
+        {'$sort': {'_id': 1}},
+        # Um grupo por envio (mesma chave e mesma data)
+        {'$group': {
+            '_id': {
+                'Unidade': '$Unidade',
+                'Período': '$Período',
+                'Fornecedor': '$Fornecedor',
+                'Data_Avaliacao': '$Data_Avaliacao'
+            },
+            'ids': {'$push': '$_id'},
+            'ultimo_id': {'$max': '$_id'},
+            'respostas': {'$push': {campo: f'${campo}' for campo in CAMPOS_RESPOSTA}}
+        }},
+        # Manter o envio mais recente de cada (fornecedor, unidade, período), como no índice único
+        {'$sort': {'_id.Data_Avaliacao': -1, 'ultimo_id': -1}},
+        {'$group': {
+            '_id': {
+                'Unidade': '$_id.Unidade',
+                'Período': '$_id.Período',
+                'Fornecedor': '$_id.Fornecedor'
+            },
+            'Data_Avaliacao': {'$first': '$_id.Data_Avaliacao'},
+            'respostas': {'$first': '$respostas'},
+            'ids': {'$push': '$ids'}
+        }}
+    ]
+
+    avaliacoes_migradas = 0
+    linhas_convertidas = 0
+    lote = []
+    for grupo in collection.aggregate(pipeline, allowDiskUse=True):
+        lote.append(grupo)
+        if len(lote) >= tamanho_lote:
+            linhas_convertidas += _gravar_lote(collection, lote)
+            avaliacoes_migradas += len(lote)
+            lote = []
+            if progresso:
+                progresso(nome_colecao, avaliacoes_migradas, linhas_convertidas)
+
+    if lote:
+        linhas_convertidas += _gravar_lote(collection, lote)
+        avaliacoes_migradas += len(lote)
+        if progresso:
+            progresso(nome_colecao, avaliacoes_migradas, linhas_convertidas)
+
+    return avaliacoes_migradas, linhas_convertidas
+
+def migrar_avaliacoes(origem=None, tamanho_lote=200, progresso=None):
+    """
+    Migra as coleções de avaliações para o modelo cabeçalho + respostas embutidas.
+    Retorna {origem: (avaliações migradas, linhas convertidas)}.
+    """
+    origens = [origem] if origem else list(COLECOES_POR_ORIGEM.keys())
+    resultado = {}
+    for nome_origem in origens:
+        resultado[nome_origem] = migrar_colecao(COLECOES_POR_ORIGEM[nome_origem], tamanho_lote, progresso)
+        if resultado[nome_origem][0]:
+            registrar_exclusoes(nome_origem)
+    return resultado
+
+def garantir_migracao(db=None):
+    """
+    Migra as coleções que ainda tenham linhas no modelo antigo e recalcula o resumo mensal.
+    Executada na inicialização e após restaurações; sem linhas antigas, faz uma consulta por coleção.
+    Retorna {origem: (avaliações migradas, linhas convertidas)}.
+    """
+    if db is None:
+        db = get_database()
+    resultado = {}
+    for nome_origem, nome_colecao in COLECOES_POR_ORIGEM.items():
+        if db[nome_colecao].find_one(FILTRO_LEGADO, {'_id': 1}) is None:
+            continue
+        resultado[nome_origem] = migrar_colecao(nome_colecao, db=db)
+        registrar_exclusoes(nome_origem, db=db)
+    if resultado:
+        reconstruir_resumo(db)
+    return resultado
+
+# Executar a migração manualmente
+if __name__ == "__main__":
+    def _imprimir_progresso(nome_colecao, avaliacoes, linhas):
+        print(f"{nome_colecao}: {avaliacoes} avaliações migradas ({linhas} linhas convertidas)")
+
+    for nome_origem, (avaliacoes, linhas) in migrar_avaliacoes(progresso=_imprimir_progresso).items():
+        print(f"{nome_origem}: concluído - {avaliacoes} avaliações, {linhas} linhas")
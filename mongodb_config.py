@@ -16,25 +16,105 @@ except KeyError as e:
 
 MONGODB_DATABASE = "avaliacao_fornecedores"
 
-# Variável global para armazenar a conexão
-_mongo_client = None
+# Parâmetros padrão do pool de conexões (podem ser sobrescritos na seção [mongodb] do secrets.toml)
+MONGODB_POOL_PADRAO = {
+    "MONGODB_MAX_POOL_SIZE": 20,
+    "MONGODB_MIN_POOL_SIZE": 2,
+    "MONGODB_CONNECT_TIMEOUT_MS": 5000,
+    "MONGODB_SERVER_SELECTION_TIMEOUT_MS": 5000,
+    "MONGODB_COMPRESSORS": "zstd,snappy,zlib",
+}
 
-# Função para obter conexão com o MongoDB Atlas
-def get_database():
-    global _mongo_client
-    
-    # Reutilizar conexão existente se disponível
-    if _mongo_client is not None:
-        return _mongo_client[MONGODB_DATABASE]
-        
+# Bibliotecas opcionais necessárias para cada algoritmo de compressão
+_COMPRESSORES_MODULOS = {
+    "zstd": "zstandard",
+    "snappy": "snappy",
+    "zlib": "zlib",
+}
+
+def _get_opcao(nome):
+    try:
+        return st.secrets["mongodb"].get(nome, MONGODB_POOL_PADRAO[nome])
+    except Exception:
+        return MONGODB_POOL_PADRAO[nome]
+
+def _compressores_disponiveis(compressores):
+    # Manter apenas os compressores cuja biblioteca está instalada, na ordem de preferência
+    disponiveis = []
+    for nome in [c.strip() for c in str(compressores).split(",") if c.strip()]:
+        modulo = _COMPRESSORES_MODULOS.get(nome)
+        if modulo is None:
+            continue
+        try:
+            __import__(modulo)
+            disponiveis.append(nome)
+        except ImportError:
+            pass
+    return disponiveis
+
+# Cliente compartilhado por todas as sessões e páginas do processo
+@st.cache_resource(show_spinner=False)
+def get_mongo_client():
     username = urllib.parse.quote_plus(MONGODB_USERNAME)
     password = urllib.parse.quote_plus(MONGODB_PASSWORD)
-    
+
     # String de conexão para MongoDB Atlas
     connection_string = f"mongodb+srv://{username}:{password}@{MONGODB_CLUSTER}/{MONGODB_DATABASE}?retryWrites=true&w=majority"
-    
-    # Criar conexão com o MongoDB
-    _mongo_client = MongoClient(connection_string)
-    
-    # Retornar a base de dados
-    return _mongo_client[MONGODB_DATABASE]
\ No newline at end of file
+
+    # Criar conexão com o MongoDB usando o pool configurado
+    client = MongoClient(
+        connection_string,
+        maxPoolSize=int(_get_opcao("MONGODB_MAX_POOL_SIZE")),
+        minPoolSize=int(_get_opcao("MONGODB_MIN_POOL_SIZE")),
+        connectTimeoutMS=int(_get_opcao("MONGODB_CONNECT_TIMEOUT_MS")),
+        serverSelectionTimeoutMS=int(_get_opcao("MONGODB_SERVER_SELECTION_TIMEOUT_MS")),
+        compressors=_compressores_disponiveis(_get_opcao("MONGODB_COMPRESSORS")),
+    )
+
+    # Aquecer a conexão (resolução DNS + handshake TLS) antes da primeira consulta
+    try:
+        client.admin.command("ping")
+    except Exception as e:
+        print(f"Aviso: não foi possível aquecer a conexão com o MongoDB: {str(e)}")
+
+    # Garantir os índices das coleções (idempotente, executado uma vez por processo)
+    try:
+        from indices_mongodb import garantir_indices
+        garantir_indices(client[MONGODB_DATABASE])
+    except Exception as e:
+        print(f"Aviso: não foi possível verificar os índices do MongoDB: {str(e)}")
+
+    # Carga inicial dos catálogos (executada de fato apenas enquanto o marcador não existir)
+    try:
+        from carga_inicial import garantir_carga_inicial
+        garantir_carga_inicial(client[MONGODB_DATABASE])
+    except Exception as e:
+        print(f"Aviso: não foi possível verificar a carga inicial dos catálogos: {str(e)}")
+
+    # Converter avaliações ainda gravadas no modelo antigo (uma linha por pergunta)
+    try:
+        from migrar_avaliacoes import garantir_migracao
+        garantir_migracao(client[MONGODB_DATABASE])
+    except Exception as e:
+        print(f"Aviso: não foi possível migrar as avaliações no modelo antigo: {str(e)}")
+
+    # Criar o resumo mensal usado pelo DASHBOARD, se ainda não existir
+    try:
+        from resumo_avaliacoes import garantir_resumo
+        garantir_resumo(client[MONGODB_DATABASE])
+    except Exception as e:
+        print(f"Aviso: não foi possível verificar o resumo mensal das avaliações: {str(e)}")
+
+    # Registrar na fila os arquivos das avaliações gravadas sem tarefa (ex.: reinício durante um envio)
+    try:
+        from fila_arquivos import enfileirar_avaliacoes_sem_tarefa
+        enfileirar_avaliacoes_sem_tarefa(client[MONGODB_DATABASE])
+    except Exception as e:
+        print(f"Aviso: não foi possível verificar a fila de arquivos: {str(e)}")
+
+    return client
+
+# Função para obter conexão com o MongoDB Atlas
+def get_database():
+    # Reutilizar o cliente do processo (criado apenas uma vez)
+    return get_mongo_client()[MONGODB_DATABASE]
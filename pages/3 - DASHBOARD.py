@@ -2,7 +2,14 @@ import streamlit as st
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from mongodb_config import get_database
+from avaliacoes_cache import listar_avaliacoes_cache
+from resumo_avaliacoes import (
+    get_valores_filtros,
+    listar_resumo,
+    calcular_media_por_fornecedor,
+    calcular_distribuicao_respostas,
+    calcular_evolucao_por_periodo
+)
 
 st.set_page_config(
     page_title='Dashboard - Avaliação de Fornecedores',
@@ -19,73 +26,66 @@ st.markdown(
 
 st.write('---')
 
-# Função para obter dados de avaliações
-def get_all_avaliacoes():
+# Função para obter os valores disponíveis para os filtros (a partir do resumo mensal)
+def get_opcoes_filtros():
     try:
-        db = get_database()
-        # Combinar dados das duas coleções
-        avaliacoes_adm = list(db["avaliacoes_adm"].find({}))
-        avaliacoes = list(db["avaliacoes"].find({}))
-        
-        # Remover campo _id
-        for avaliacao in avaliacoes_adm + avaliacoes:
-            if '_id' in avaliacao:
-                del avaliacao['_id']
-        
-        return pd.DataFrame(avaliacoes_adm + avaliacoes)
+        return get_valores_filtros()
+    except Exception as e:
+        st.error(f"Erro ao obter avaliações: {str(e)}")
+        return {}
+
+# Função para obter dados de avaliações com os filtros aplicados sobre o cache local
+def get_all_avaliacoes(filtros=None):
+    try:
+        return listar_avaliacoes_cache(filtros)
     except Exception as e:
         st.error(f"Erro ao obter avaliações: {str(e)}")
         return pd.DataFrame()
 
 # Obter dados
-df = get_all_avaliacoes()
+opcoes_filtros = get_opcoes_filtros()
 
-if not df.empty:
+if opcoes_filtros.get('Fornecedor'):
     # Filtros laterais
     st.sidebar.title("Filtros")
     
     # Filtro de período
-    periodos = sorted(df['Período'].unique()) if 'Período' in df.columns else []
+    periodos = opcoes_filtros['Período']
     periodo_selecionado = st.sidebar.multiselect("Período", periodos, default=periodos)
     
     # Filtro de unidade
-    unidades = sorted(df['Unidade'].unique()) if 'Unidade' in df.columns else []
+    unidades = opcoes_filtros['Unidade']
     unidade_selecionada = st.sidebar.multiselect("Unidade", unidades, default=unidades)
     
     # Filtro de fornecedor
-    fornecedores = sorted(df['Fornecedor'].unique()) if 'Fornecedor' in df.columns else []
+    fornecedores = opcoes_filtros['Fornecedor']
     fornecedor_selecionado = st.sidebar.multiselect("Fornecedor", fornecedores)
     
-    # Aplicar filtros
-    mask = pd.Series(True, index=df.index)
-    if periodo_selecionado:
-        mask &= df['Período'].isin(periodo_selecionado)
-    if unidade_selecionada:
-        mask &= df['Unidade'].isin(unidade_selecionada)
-    if fornecedor_selecionado:
-        mask &= df['Fornecedor'].isin(fornecedor_selecionado)
+    # Filtros aplicados diretamente na consulta ao resumo mensal
+    filtros = {
+        'Período': periodo_selecionado,
+        'Unidade': unidade_selecionada,
+        'Fornecedor': fornecedor_selecionado
+    }
     
-    df_filtrado = df[mask]
+    # Obter os dados pré-agregados para os gráficos
+    try:
+        resumo_df = listar_resumo(filtros)
+        media_por_fornecedor = calcular_media_por_fornecedor(resumo_df)
+        contagem_por_fornecedor = calcular_distribuicao_respostas(resumo_df)
+        evolucao_temporal = calcular_evolucao_por_periodo(resumo_df)
+    except Exception as e:
+        st.error(f"Erro ao obter indicadores: {str(e)}")
+        media_por_fornecedor = pd.DataFrame(columns=['Fornecedor', 'Valor_Resposta'])
+        contagem_por_fornecedor = pd.DataFrame(columns=['Resposta', 'Fornecedor', 'count'])
+        evolucao_temporal = pd.DataFrame(columns=['Período', 'Fornecedor', 'Valor_Resposta'])
     
     # Layout em colunas
     col1, col2 = st.columns(2)
     
     with col1:
         # Gráfico de desempenho por fornecedor
-        if 'Resposta' in df_filtrado.columns:
-            # Mapear respostas para valores numéricos
-            mapeamento = {
-                'Atende Totalmente': 3,
-                'Atende Parcialmente': 2,
-                'Não Atende': 1,
-                'Não se Aplica': 0
-            }
-            
-            # Criar coluna numérica
-            df_filtrado['Valor_Resposta'] = df_filtrado['Resposta'].map(mapeamento)
-            
-            # Calcular média por fornecedor
-            media_por_fornecedor = df_filtrado.groupby('Fornecedor')['Valor_Resposta'].mean().reset_index()
+        if not media_por_fornecedor.empty:
             media_por_fornecedor = media_por_fornecedor[media_por_fornecedor['Valor_Resposta'] > 0]  # Excluir 'Não se Aplica'
             
             # Ordenar por desempenho
@@ -107,8 +107,8 @@ if not df.empty:
     
     with col2:
         # Gráfico de distribuição de respostas
-        if 'Resposta' in df_filtrado.columns:
-            contagem_respostas = df_filtrado['Resposta'].value_counts()
+        if not contagem_por_fornecedor.empty:
+            contagem_respostas = contagem_por_fornecedor.groupby('Resposta')['count'].sum().sort_values(ascending=False)
             
             # Definir cores para cada tipo de resposta
             cores = {
@@ -118,9 +118,6 @@ if not df.empty:
                 'Não se Aplica': 'gray'
             }
             
-            # Criar contagem de respostas por fornecedor
-            contagem_por_fornecedor = df_filtrado.groupby(['Resposta', 'Fornecedor']).size().reset_index(name='count')
-            
             # Preparar textos customizados para cada fatia
             textos_customizados = []
             for resposta in contagem_respostas.index:
@@ -150,12 +147,9 @@ if not df.empty:
             st.plotly_chart(fig, use_container_width=True)
     
     # Evolução temporal
-    if 'Período' in df_filtrado.columns and 'Valor_Resposta' in df_filtrado.columns:
+    if not evolucao_temporal.empty:
         st.subheader("Evolução do Desempenho ao Longo do Tempo")
         
-        # Agrupar por período e fornecedor
-        evolucao_temporal = df_filtrado.groupby(['Período', 'Fornecedor'])['Valor_Resposta'].mean().reset_index()
-        
         # Converter período para datetime e ordenar
         try:
             evolucao_temporal['Período_dt'] = pd.to_datetime(evolucao_temporal['Período'], format='%m/%Y')
@@ -186,8 +180,9 @@ if not df.empty:
         
         st.plotly_chart(fig, use_container_width=True)
     
-    # Tabela detalhada
+    # Tabela detalhada (carregada apenas quando solicitada)
     st.subheader("Dados Detalhados")
-    st.dataframe(df_filtrado)
+    if st.checkbox("Exibir respostas detalhadas", value=False):
+        st.dataframe(get_all_avaliacoes(filtros))
 else:
     st.warning("Não há dados de avaliações disponíveis.")
\ No newline at end of file
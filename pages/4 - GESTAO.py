@@ -1,6 +1,4 @@
 import streamlit as st
-import importlib.util
-import sys
 import os
 import zipfile
 import tempfile
@@ -165,47 +163,27 @@ def download_sharepoint_files_optimized(folders, max_workers=3):
         st.error(f"Erro crítico ao criar arquivo ZIP: {str(e)}")
         return None
 
-# Função para importar módulos dinamicamente
-def import_module(module_name, file_path):
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-    return module
-
 st.set_page_config(
     page_title='Gestão - Avaliação de Fornecedores',
     page_icon='CSA.png',
     layout='wide'
 )
 
-# Obtendo o caminho base do projeto
-base_path = os.path.dirname(os.path.dirname(__file__))
-
-# Importar módulos locais com caminhos absolutos
-fornecedores_module = import_module('fornecedores_por_unidade', os.path.join(base_path, 'fornecedores_por_unidade.py'))
-perguntas_module = import_module('perguntas_por_fornecedor', os.path.join(base_path, 'perguntas_por_fornecedor.py'))
-unidades_module = import_module('unidades', os.path.join(base_path, 'unidades.py'))
+# Catálogos compartilhados (módulo importado uma vez por processo)
+import catalogos
+from renomear_fornecedor import renomear_fornecedor
 
 # Acessar os dados usando as funções MongoDB
 try:
-    fornecedores_por_unidade = fornecedores_module.get_fornecedores()
-    unidades = unidades_module.get_unidades()
-    perguntas_por_fornecedor = perguntas_module.get_perguntas()
+    unidades, fornecedores_por_unidade, perguntas_por_fornecedor = catalogos.carregar_catalogos()
     
-    # Verificar se os dados foram obtidos corretamente
-    if not unidades or not fornecedores_por_unidade or not perguntas_por_fornecedor:
-        raise Exception("Dados vazios retornados do MongoDB")
-        
     # Adicionar mensagem de sucesso
     st.success("Dados carregados com sucesso do MongoDB")
     
 except Exception as e:
     # Fallback para os dados originais se houver erro
     st.error(f"Erro ao conectar ao MongoDB: {str(e)}. Usando dados locais como fallback.")
-    fornecedores_por_unidade = getattr(fornecedores_module, 'fornecedores_por_unidade', {})
-    unidades = getattr(unidades_module, 'unidades', [])
-    perguntas_por_fornecedor = getattr(perguntas_module, 'perguntas_por_fornecedor', {})
+    unidades, fornecedores_por_unidade, perguntas_por_fornecedor = catalogos.carregar_catalogos_locais()
 
 # Adicionar função para baixar arquivos do SharePoint
 def download_sharepoint_files(folders):
@@ -306,7 +284,7 @@ with tab1:
             novo_nome = st.text_input('Novo nome do fornecedor', value=st.session_state.editing_fornecedor)
             
             # Buscar todas as unidades disponíveis do MongoDB
-            todas_unidades = unidades_module.get_unidades()
+            todas_unidades = catalogos.get_unidades()
             
             # Usar as unidades do fornecedor que está sendo editado como valores padrão
             valores_default_validos = []
@@ -323,18 +301,32 @@ with tab1:
             with col1:
                 # Edição de fornecedor
                 if st.form_submit_button('Salvar Alterações'):
-                    # Remover fornecedor antigo
-                    fornecedores_module.remove_fornecedor(st.session_state.editing_fornecedor)
-                    # Adicionar fornecedor com novo nome e unidades
-                    fornecedores_module.add_fornecedor(novo_nome, novas_unidades)
-                    
-                    # Atualizar a variável local para refletir as mudanças
-                    fornecedores_por_unidade = fornecedores_module.get_fornecedores()
-                    
-                    del st.session_state.editing_fornecedor
-                    del st.session_state.editing_unidades
-                    st.success('Fornecedor atualizado com sucesso!')
-                    st.rerun()
+                    nome_atual = st.session_state.editing_fornecedor
+                    novo_nome = novo_nome.strip()
+                    try:
+                        if not novo_nome or novo_nome == nome_atual:
+                            # Apenas as unidades foram alteradas
+                            catalogos.add_fornecedor(nome_atual, novas_unidades)
+                        else:
+                            # Renomear (ou mesclar) em fornecedores, perguntas e avaliações
+                            barra_progresso = st.progress(0, text="Renomeando fornecedor...")
+                            def atualizar_progresso(etapa, feitos, total):
+                                barra_progresso.progress(feitos / total if total else 1.0, text=f"Atualizando {etapa}: {feitos}/{total}")
+                            resultado = renomear_fornecedor(nome_atual, novo_nome, novas_unidades, progresso=atualizar_progresso)
+                            if resultado['mesclado']:
+                                st.info(f'"{nome_atual}" foi mesclado com o fornecedor existente "{novo_nome}".')
+                            if resultado['avaliacoes_substituidas']:
+                                st.info(f"{resultado['avaliacoes_substituidas']} avaliação(ões) da mesma unidade e período foram mantidas apenas na versão mais recente.")
+                        
+                        # Atualizar a variável local para refletir as mudanças
+                        fornecedores_por_unidade = catalogos.get_fornecedores()
+                        
+                        del st.session_state.editing_fornecedor
+                        del st.session_state.editing_unidades
+                        st.success('Fornecedor atualizado com sucesso!')
+                        st.rerun()
+                    except Exception as e:
+                        st.error(f"Erro ao atualizar fornecedor: {str(e)}")
             with col2:
                 if st.form_submit_button('Cancelar'):
                     del st.session_state.editing_fornecedor
@@ -349,10 +341,10 @@ with tab1:
             selecionados = [f for f, v in fornecedores_selecionados.items() if v]
             if selecionados:
                 for fornecedor in selecionados:
-                    fornecedores_module.remove_fornecedor(fornecedor)
+                    catalogos.remove_fornecedor(fornecedor)
                 
                 # Atualizar a variável local para refletir as mudanças
-                fornecedores_por_unidade = fornecedores_module.get_fornecedores()
+                fornecedores_por_unidade = catalogos.get_fornecedores()
                 
                 st.success('Fornecedores excluídos com sucesso!')
                 st.rerun()
@@ -381,6 +373,9 @@ with tab2:
                         st.session_state.editing_categoria = categoria
                         st.session_state.editing_pergunta_idx = idx
                         st.session_state.editing_pergunta = pergunta
+                        # Guardar a versão da categoria para detectar edições de outras sessões
+                        doc_categoria = catalogos.get_categoria(fornecedor_selecionado, categoria)
+                        st.session_state.editing_versao = doc_categoria.get('versao', 0) if doc_categoria else None
 
             # Interface de edição de pergunta
             if ('editing_categoria' in st.session_state and 
@@ -394,23 +389,30 @@ with tab2:
                     with col1:
                         # Edição de pergunta
                         if st.form_submit_button('Salvar Alterações'):
-                            # Atualizar a pergunta no MongoDB
-                            success = perguntas_module.update_pergunta(
+                            # Atualizar a pergunta no MongoDB (somente se ninguém alterou a categoria desde a leitura)
+                            success, doc_categoria = catalogos.update_pergunta(
                                 fornecedor_selecionado,
                                 categoria,
                                 st.session_state.editing_pergunta_idx,
-                                nova_pergunta
+                                nova_pergunta,
+                                versao=st.session_state.get('editing_versao'),
+                                pergunta_atual=st.session_state.editing_pergunta
                             )
                             
                             if success:
-                                # Atualizar a variável local para refletir as mudanças
-                                perguntas_por_fornecedor = perguntas_module.get_perguntas()
-                                
+                                # O cache do catálogo já recebeu a categoria alterada: basta recarregar a página
                                 del st.session_state.editing_categoria
                                 del st.session_state.editing_pergunta_idx
                                 del st.session_state.editing_pergunta
+                                st.session_state.pop('editing_versao', None)
                                 st.success('Pergunta atualizada com sucesso!')
                                 st.rerun()
+                            elif doc_categoria is not None:
+                                # Conflito: outra sessão alterou a categoria; recarregar a versão atual
+                                idx_edicao = st.session_state.editing_pergunta_idx
+                                st.session_state.editing_pergunta = doc_categoria['perguntas'][idx_edicao]
+                                st.session_state.editing_versao = doc_categoria.get('versao', 0)
+                                st.warning('Esta categoria foi alterada por outra sessão. A pergunta foi recarregada com o texto atual; revise e salve novamente.')
                             else:
                                 st.error('Erro ao atualizar a pergunta. Tente novamente.')
                     with col2:
@@ -418,6 +420,7 @@ with tab2:
                             del st.session_state.editing_categoria
                             del st.session_state.editing_pergunta_idx
                             del st.session_state.editing_pergunta
+                            st.session_state.pop('editing_versao', None)
                             st.rerun()
 
             # Botões de ação por categoria
@@ -439,17 +442,16 @@ with tab2:
                         # Obter perguntas atuais
                         perguntas = perguntas_por_fornecedor[fornecedor_selecionado][categoria]
                         
-                        # Remover cada pergunta selecionada
-                        for idx in sorted(indices_selecionados, reverse=True):
-                            if 0 <= idx < len(perguntas):
-                                pergunta = perguntas[idx]
-                                perguntas_module.remove_pergunta(fornecedor_selecionado, categoria, pergunta)
+                        # Remover as perguntas selecionadas em uma única operação
+                        selecionadas = [perguntas[idx] for idx in sorted(indices_selecionados) if 0 <= idx < len(perguntas)]
+                        doc = catalogos.remove_perguntas(fornecedor_selecionado, categoria, selecionadas)
                         
-                        # Atualizar a variável local para refletir as mudanças
-                        perguntas_por_fornecedor = perguntas_module.get_perguntas()
-                        
-                        st.success('Perguntas excluídas com sucesso!')
-                        st.rerun()
+                        if doc is not None:
+                            # O cache do catálogo já recebeu a categoria alterada: basta recarregar a página
+                            st.success('Perguntas excluídas com sucesso!')
+                            st.rerun()
+                        else:
+                            st.error('Erro ao excluir as perguntas. Tente novamente.')
 
 # Adicionar após as importações e antes do conteúdo principal
 
@@ -457,11 +459,11 @@ with tab2:
 def salvar_fornecedores(fornecedor, unidades_selecionadas):
     try:
         # Usar a função do módulo para adicionar/atualizar fornecedor
-        success = fornecedores_module.add_fornecedor(fornecedor, unidades_selecionadas)
+        success = catalogos.add_fornecedor(fornecedor, unidades_selecionadas)
         if success:
             # Atualizar a variável local
             global fornecedores_por_unidade
-            fornecedores_por_unidade = fornecedores_module.get_fornecedores()
+            fornecedores_por_unidade = catalogos.get_fornecedores()
             return True
         return False
     except Exception as e:
@@ -474,7 +476,7 @@ def cadastrar_fornecedor():
     novo_fornecedor = st.text_input('Nome do fornecedor', key="cadastro_novo_fornecedor")
     
     # Buscar unidades diretamente do MongoDB usando a função do módulo unidades
-    unidades_disponiveis = unidades_module.get_unidades()
+    unidades_disponiveis = catalogos.get_unidades()
     unidades_selecionadas = st.multiselect("Selecione as unidades", options=unidades_disponiveis, key="cadastro_unidades_select")
 
     if st.button("Salvar", key="cadastro_salvar_fornecedor"):
@@ -491,6 +493,36 @@ def cadastrar_fornecedor():
         else:
             st.warning('Por favor, preencha o nome do fornecedor e selecione pelo menos uma unidade')
 
+@st.dialog("Importar Fornecedores", width="large")
+def importar_fornecedores():
+    st.subheader("Importação de Fornecedores em Lote")
+    st.write("Envie um arquivo CSV ou XLSX com as colunas **Fornecedor** e **Unidades** (unidades separadas por vírgula ou ponto e vírgula).")
+    arquivo = st.file_uploader("Arquivo de fornecedores", type=["csv", "xlsx"], key="importar_fornecedores_arquivo")
+
+    if arquivo is not None:
+        try:
+            fornecedores_arquivo = catalogos.ler_planilha_fornecedores(arquivo, arquivo.name)
+        except Exception as e:
+            st.error(f"Erro ao ler o arquivo: {str(e)}")
+            return
+
+        # Validar as unidades contra o cadastro
+        validos, erros = catalogos.validar_fornecedores(fornecedores_arquivo, catalogos.get_unidades())
+        novos = [f for f in validos if f not in fornecedores_por_unidade]
+
+        st.write(f"**{len(validos)}** fornecedores válidos ({len(novos)} novos, {len(validos) - len(novos)} atualizações)")
+        if erros:
+            with st.expander(f"⚠️ {len(erros)} linhas com problemas (não serão importadas)"):
+                for erro in erros:
+                    st.write(f"- {erro}")
+
+        if validos and st.button("Importar", key="importar_fornecedores_salvar"):
+            try:
+                criados, atualizados = catalogos.importar_fornecedores(validos)
+                st.toast(f'{criados} fornecedores criados e {atualizados} atualizados!', icon='✅')
+            except Exception as e:
+                st.error(f"Erro ao importar fornecedores: {str(e)}")
+
 @st.dialog("Cadastrar Nova Pergunta", width="large")
 def cadastrar_pergunta():
     st.subheader("Cadastro de Nova Pergunta")
@@ -504,11 +536,11 @@ def cadastrar_pergunta():
         if fornecedor and categoria and nova_pergunta:
             try:
                 # Usar a função do módulo para adicionar pergunta
-                success = perguntas_module.add_pergunta(fornecedor, categoria, nova_pergunta)
+                success = catalogos.add_pergunta(fornecedor, categoria, nova_pergunta)
                 if success:
                     # Atualizar a variável local
                     global perguntas_por_fornecedor
-                    perguntas_por_fornecedor = perguntas_module.get_perguntas()
+                    perguntas_por_fornecedor = catalogos.get_perguntas()
                     st.success("Pergunta adicionada com sucesso!")
                 else:
                     st.warning("Não foi possível adicionar a pergunta.")
@@ -523,6 +555,9 @@ st.sidebar.write('---')
 if st.sidebar.button('Cadastrar Novo Fornecedor', key='cadastrar_fornecedor_sidebar'):
     cadastrar_fornecedor()
 
+if st.sidebar.button('Importar Fornecedores (CSV/XLSX)', key='importar_fornecedores_sidebar'):
+    importar_fornecedores()
+
 if st.sidebar.button('Cadastrar Nova Pergunta', key='cadastrar_pergunta_sidebar'):
     cadastrar_pergunta()
 
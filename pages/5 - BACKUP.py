@@ -1,6 +1,4 @@
 import streamlit as st
-import importlib.util
-import sys
 import os
 import json
 import datetime
@@ -10,30 +8,22 @@ from io import StringIO, BytesIO
 
 # Importações necessárias para o sistema
 
-# Função para importar módulos dinamicamente
-def import_module(module_name, file_path):
-    spec = importlib.util.spec_from_file_location(module_name, file_path)
-    module = importlib.util.module_from_spec(spec)
-    sys.modules[module_name] = module
-    spec.loader.exec_module(module)
-    return module
-
 st.set_page_config(
     page_title='Backup e Restauração - Avaliação de Fornecedores',
     page_icon='CSA.png',
     layout='wide'
 )
 
-# Obtendo o caminho base do projeto
-base_path = os.path.dirname(os.path.dirname(__file__))
-
-# Importar módulos locais com caminhos absolutos
-fornecedores_module = import_module('fornecedores_por_unidade', os.path.join(base_path, 'fornecedores_por_unidade.py'))
-perguntas_module = import_module('perguntas_por_fornecedor', os.path.join(base_path, 'perguntas_por_fornecedor.py'))
-unidades_module = import_module('unidades', os.path.join(base_path, 'unidades.py'))
-
 # Importar configuração do MongoDB
 from mongodb_config import get_database
+from catalogo_versao import CATALOGOS, incrementar_versao
+from carga_inicial import semear_catalogos
+from avaliacoes_repositorio import COLECOES_POR_ORIGEM, buscar_avaliacao, listar_cabecalhos_avaliacoes, registrar_exclusoes, remover_avaliacoes_duplicadas
+from migrar_avaliacoes import contar_registros_legados, garantir_migracao, migrar_avaliacoes
+from resumo_avaliacoes import reconstruir_resumo
+from indices_mongodb import criar_indices, garantir_indices, relatorio_uso_indices, verificar_consultas_frequentes
+from exportacao_excel import gerar_excel_avaliacao, gerar_nome_arquivo_avaliacao
+from exportacao_parquet import exportar_parquet_zip
 
 # Função para fazer backup de uma coleção
 def backup_collection(collection_name):
@@ -52,14 +42,36 @@ def restore_collection(collection_name, data):
         db = get_database()
         collection = db[collection_name]
         
-        # Limpar coleção existente
-        collection.delete_many({})
-        
-        # Inserir dados do backup
-        if data and len(data) > 0:
-            collection.insert_many(data)
-            return True
-        return False
+        # Carregar o backup em uma coleção temporária, com os mesmos índices (inclusive os únicos),
+        # e só depois de validado trocá-la pela coleção atual
+        temporaria = db[f"{collection_name}_restauracao"]
+        temporaria.drop()
+        try:
+            if data:
+                temporaria.insert_many([dict(documento) for documento in data], ordered=False)
+            erros = criar_indices(temporaria, collection_name)
+            if erros:
+                st.error(f"Backup da coleção {collection_name} não restaurado: {'; '.join(erros)}")
+                return False
+            
+            if data:
+                # Substituir a coleção atual pela temporária em uma única operação (rename)
+                temporaria.rename(collection_name, dropTarget=True)
+            else:
+                # Backup vazio: não há coleção temporária para renomear
+                collection.delete_many({})
+        finally:
+            temporaria.drop()
+        restaurado = bool(data)
+        
+        # Invalidar o cache dos catálogos em todas as sessões
+        if collection_name in CATALOGOS:
+            incrementar_versao(collection_name)
+        # Recarregar as avaliações restauradas no cache local
+        for origem, colecao in COLECOES_POR_ORIGEM.items():
+            if colecao == collection_name:
+                registrar_exclusoes(origem, db=db)
+        return restaurado
     except Exception as e:
         st.error(f"Erro ao restaurar a coleção {collection_name}: {str(e)}")
         return False
@@ -67,76 +79,22 @@ def restore_collection(collection_name, data):
 # Função para importar dados das bibliotecas locais para o MongoDB
 def import_local_data():
     try:
-        # Importar fornecedores
-        db = get_database()
-        fornecedores_collection = db["fornecedores"]
-        fornecedores_collection.delete_many({})
-        
-        for fornecedor, unidades in fornecedores_module.fornecedores_por_unidade.items():
-            fornecedores_collection.insert_one({
-                "fornecedor": fornecedor,
-                "unidades": unidades
-            })
-        
-        # Importar unidades
-        unidades_collection = db["unidades"]
-        unidades_collection.delete_many({})
-        unidades_collection.insert_one({"unidades": unidades_module.unidades})
-        
-        # Importar perguntas
-        perguntas_collection = db["perguntas"]
-        perguntas_collection.delete_many({})
+        # Gravar os dados locais com bulk_write por chave natural, sem apagar as coleções antes
+        semear_catalogos(get_database(), substituir=True)
         
-        for fornecedor, categorias in perguntas_module.perguntas_por_fornecedor.items():
-            for categoria, perguntas in categorias.items():
-                perguntas_collection.insert_one({
-                    "fornecedor": fornecedor,
-                    "categoria": categoria,
-                    "perguntas": perguntas
-                })
+        # Invalidar o cache dos catálogos em todas as sessões
+        for catalogo in CATALOGOS:
+            incrementar_versao(catalogo)
         
         return True
     except Exception as e:
         st.error(f"Erro ao importar dados locais: {str(e)}")
         return False
 
-# Função para buscar avaliações do MongoDB (ambas as coleções)
+# Função para buscar a lista de avaliações do MongoDB (ambas as coleções)
 def get_avaliacoes_para_recuperacao():
     try:
-        db = get_database()
-        
-        # Buscar avaliações da coleção 'avaliacoes' (SUPRIMENTOS)
-        avaliacoes_sup = list(db["avaliacoes"].find({}))
-        for avaliacao in avaliacoes_sup:
-            if '_id' in avaliacao:
-                del avaliacao['_id']
-        
-        # Buscar avaliações da coleção 'avaliacoes_adm' (ADMINISTRAÇÃO)
-        avaliacoes_adm = list(db["avaliacoes_adm"].find({}))
-        for avaliacao in avaliacoes_adm:
-            if '_id' in avaliacao:
-                del avaliacao['_id']
-        
-        # Criar DataFrames e adicionar origem
-        df_sup = pd.DataFrame(avaliacoes_sup)
-        df_adm = pd.DataFrame(avaliacoes_adm)
-        
-        if not df_sup.empty:
-            df_sup['Origem'] = 'SUPRIMENTOS'
-        if not df_adm.empty:
-            df_adm['Origem'] = 'ADMINISTRAÇÃO'
-        
-        # Combinar os DataFrames
-        if not df_sup.empty and not df_adm.empty:
-            todas_avaliacoes = pd.concat([df_sup, df_adm], ignore_index=True)
-        elif not df_sup.empty:
-            todas_avaliacoes = df_sup
-        elif not df_adm.empty:
-            todas_avaliacoes = df_adm
-        else:
-            todas_avaliacoes = pd.DataFrame()
-        
-        return todas_avaliacoes
+        return listar_cabecalhos_avaliacoes()
     except Exception as e:
         st.error(f"Erro ao buscar avaliações: {str(e)}")
         return pd.DataFrame()
@@ -147,13 +105,8 @@ def gerar_excel_recuperacao(avaliacao_data, origem):
         # Criar DataFrame com os dados da avaliação
         df_avaliacao = pd.DataFrame(avaliacao_data)
         
-        # Criar arquivo Excel em memória
-        output = BytesIO()
-        with pd.ExcelWriter(output, engine='openpyxl') as writer:
-            df_avaliacao.to_excel(writer, index=False, sheet_name='Avaliação')
-        output.seek(0)
-        
-        return output
+        # Gerar o arquivo no mesmo formato da planilha do envio (exportacao_excel.py)
+        return BytesIO(gerar_excel_avaliacao(df_avaliacao))
     except Exception as e:
         st.error(f"Erro ao gerar arquivo Excel: {str(e)}")
         return None
@@ -277,36 +230,8 @@ def verificar_arquivo_existe_sharepoint(nome_arquivo, origem):
     except:
         return False
 
-def gerar_nome_arquivo_avaliacao(fornecedor, periodo, unidade, origem):
-    """
-    Gera o nome do arquivo baseado nos dados da avaliação
-    """
-    nome_fornecedor = "".join(x for x in fornecedor.replace(' ', '_') if x.isalnum() or x in ['_', '-'])
-    
-    # Converter período do formato DD/MM/YYYY para MES-YY
-    partes_data = periodo.split('/')
-    mes_num = partes_data[1]  # MM
-    ano_abrev = partes_data[2][-2:]  # YY (últimos 2 dígitos)
-    
-    # Dicionário para conversão de mês
-    meses_abrev = {
-        '01': 'JAN', '02': 'FEV', '03': 'MAR', '04': 'ABR',
-        '05': 'MAI', '06': 'JUN', '07': 'JUL', '08': 'AGO',
-        '09': 'SET', '10': 'OUT', '11': 'NOV', '12': 'DEZ'
-    }
-    nome_periodo = f"{meses_abrev[mes_num]}-{ano_abrev}"
-    
-    nome_unidade = "".join(x for x in unidade if x.isalnum() or x in ['_', '-'])
-    
-    if origem == 'SUPRIMENTOS':
-        nome_arquivo = f'{nome_fornecedor}_{nome_periodo}_{nome_unidade}_SUP.xlsx'
-    else:
-        nome_arquivo = f'{nome_fornecedor}_{nome_periodo}_{nome_unidade}.xlsx'
-    
-    return nome_arquivo
-
 # Criar as abas da interface
-tabs = st.tabs(["Backup", "Restauração", "Importação de Dados Locais", "Recuperação de Arquivos"])
+tabs = st.tabs(["Backup", "Restauração", "Importação de Dados Locais", "Recuperação de Arquivos", "Índices", "Migração de Avaliações", "Exportação Parquet"])
 
 # Tab de Backup
 with tabs[0]:
@@ -373,6 +298,13 @@ with tabs[1]:
                             if not restore_collection(colecao, backup_data[colecao]):
                                 success = False
                     
+                    # Backups antigos trazem uma linha por pergunta: converter antes de recalcular o resumo mensal
+                    try:
+                        garantir_migracao()
+                        reconstruir_resumo()
+                    except Exception as e:
+                        st.warning(f"Não foi possível reconstruir o resumo mensal: {str(e)}")
+                    
                     if success:
                         st.success("Backup restaurado com sucesso!")
                     else:
@@ -407,10 +339,8 @@ with tabs[3]:
     if todas_avaliacoes.empty:
         st.warning("Nenhuma avaliação encontrada no banco de dados.")
     else:
-        # Criar resumo das avaliações únicas
-        avaliacoes_unicas = todas_avaliacoes.drop_duplicates(
-            subset=['Fornecedor', 'Unidade', 'Período', 'Origem']
-        )[['Fornecedor', 'Unidade', 'Período', 'Data_Avaliacao', 'Origem']].copy()
+        # Resumo das avaliações únicas (já agrupado no banco)
+        avaliacoes_unicas = todas_avaliacoes.copy()
         
         # SEÇÃO DE FILTRAGEM
         st.subheader("🔍 Filtros")
@@ -492,12 +422,12 @@ with tabs[3]:
                     with st.spinner("Processando recuperação do arquivo..."):
                         try:
                             # Buscar dados completos da avaliação
-                            dados_completos = todas_avaliacoes[
-                                (todas_avaliacoes['Fornecedor'] == avaliacao_info['Fornecedor']) &
-                                (todas_avaliacoes['Unidade'] == avaliacao_info['Unidade']) &
-                                (todas_avaliacoes['Período'] == avaliacao_info['Período']) &
-                                (todas_avaliacoes['Origem'] == avaliacao_info['Origem'])
-                            ]
+                            dados_completos = buscar_avaliacao(
+                                avaliacao_info['Fornecedor'],
+                                avaliacao_info['Unidade'],
+                                avaliacao_info['Período'],
+                                avaliacao_info['Origem']
+                            )
                             
                             if dados_completos.empty:
                                 st.error("Erro: Dados da avaliação não encontrados.")
@@ -553,7 +483,118 @@ with tabs[3]:
                             st.error(f"Erro durante o processo de recuperação: {str(e)}")
         else:
             st.warning("Nenhuma avaliação encontrada com os filtros aplicados.")
-# ... existing code ...
+
+# Aba de Índices do MongoDB
+with tabs[4]:
+    st.header("Índices do MongoDB")
+    st.write("Os índices são criados automaticamente na inicialização. Use esta aba para confirmar que as consultas mais frequentes estão cobertas.")
+    
+    if st.button("Recriar Índices", key="indices_button"):
+        with st.spinner("Verificando índices..."):
+            erros = garantir_indices()
+            if erros:
+                st.error("Não foi possível criar alguns índices:\n" + "\n".join(f"- {erro}" for erro in erros))
+            else:
+                st.success("Índices verificados com sucesso!")
+    
+    st.write("O índice único de (Fornecedor, Unidade, Período) só pode ser criado depois de remover as avaliações repetidas. A avaliação mais recente de cada chave é mantida.")
+    if st.button("Remover Avaliações Duplicadas", key="duplicadas_button"):
+        with st.spinner("Removendo avaliações duplicadas..."):
+            try:
+                removidas = remover_avaliacoes_duplicadas()
+                erros = garantir_indices()
+                st.success("Avaliações duplicadas removidas: " + ", ".join(f"**{origem}:** {total}" for origem, total in removidas.items()))
+                if erros:
+                    st.error("Não foi possível criar alguns índices:\n" + "\n".join(f"- {erro}" for erro in erros))
+            except Exception as e:
+                st.error(f"Erro ao remover avaliações duplicadas: {str(e)}")
+    
+    st.subheader("Uso dos Índices")
+    try:
+        st.dataframe(relatorio_uso_indices(), use_container_width=True)
+    except Exception as e:
+        st.error(f"Erro ao obter uso dos índices: {str(e)}")
+    
+    st.subheader("Plano das Consultas Frequentes")
+    try:
+        st.dataframe(verificar_consultas_frequentes(), use_container_width=True)
+    except Exception as e:
+        st.error(f"Erro ao verificar consultas: {str(e)}")
+
+# Aba de Migração das avaliações para o modelo cabeçalho + respostas
+with tabs[5]:
+    st.header("Migração de Avaliações")
+    st.write("Converte as avaliações gravadas no modelo antigo (um documento por pergunta) em um documento por avaliação, com as respostas embutidas.")
+    st.info("💡 A migração é feita em lotes e pode ser executada novamente para retomar uma execução interrompida.")
+    
+    try:
+        pendentes = contar_registros_legados()
+        st.write(", ".join(f"**{origem}:** {total} registros no modelo antigo" for origem, total in pendentes.items()))
+    except Exception as e:
+        pendentes = {}
+        st.error(f"Erro ao contar registros: {str(e)}")
+    
+    if st.button("Migrar Avaliações", key="migrar_button", disabled=not any(pendentes.values())):
+        status_text = st.empty()
+        
+        def mostrar_progresso(nome_colecao, avaliacoes, linhas):
+            status_text.text(f"{nome_colecao}: {avaliacoes} avaliações migradas ({linhas} registros convertidos)")
+        
+        try:
+            resultado = migrar_avaliacoes(progresso=mostrar_progresso)
+            status_text.text("Reconstruindo o resumo mensal...")
+            reconstruir_resumo()
+            status_text.empty()
+            st.success("Migração concluída!\n" + "\n".join(
+                f"- {origem}: {avaliacoes} avaliações ({linhas} registros convertidos)"
+                for origem, (avaliacoes, linhas) in resultado.items()
+            ))
+        except Exception as e:
+            st.error(f"Erro durante a migração: {str(e)}")
+    
+    st.subheader("Resumo Mensal")
+    st.write("Recalcula o resumo mensal usado pelo DASHBOARD a partir de todas as avaliações registradas.")
+    
+    if st.button("Reconstruir Resumo", key="resumo_button"):
+        with st.spinner("Reconstruindo resumo..."):
+            try:
+                total_linhas = reconstruir_resumo()
+                st.success(f"Resumo reconstruído com sucesso! ({total_linhas} linhas)")
+            except Exception as e:
+                st.error(f"Erro ao reconstruir o resumo: {str(e)}")
+
+
+# Aba de Exportação das avaliações em Parquet
+with tabs[6]:
+    st.header("Exportação Parquet")
+    st.write("Exporta as respostas de todas as avaliações em arquivos Parquet particionados por origem, ano e mês (origem=.../ano=.../mes=...), para análise com pandas, pyarrow, DuckDB ou Power BI.")
+    st.info("💡 Leia a pasta inteira com pd.read_parquet('avaliacoes', columns=[...]) para carregar apenas as colunas necessárias.")
+    
+    origem_parquet = st.selectbox("Origem", options=['Todas', 'SUPRIMENTOS', 'ADMINISTRAÇÃO'], key="origem_parquet")
+    
+    if st.button("Exportar para Parquet", key="parquet_button"):
+        status_text = st.empty()
+        
+        def mostrar_progresso_parquet(linhas):
+            status_text.text(f"{linhas} respostas exportadas...")
+        
+        try:
+            caminho_zip, linhas = exportar_parquet_zip(origem=origem_parquet, progresso=mostrar_progresso_parquet)
+            with open(caminho_zip, 'rb') as arquivo_zip:
+                conteudo_zip = arquivo_zip.read()
+            os.remove(caminho_zip)
+            status_text.empty()
+            
+            timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+            st.download_button(
+                label="Baixar Exportação Parquet",
+                data=conteudo_zip,
+                file_name=f"avaliacoes_parquet_{timestamp}.zip",
+                mime="application/zip"
+            )
+            st.success(f"Exportação concluída! ({linhas} respostas)")
+        except Exception as e:
+            st.error(f"Erro ao exportar para Parquet: {str(e)}")
 
 # Botões de controle do cache (fora da aba)
 col_refresh, col_info = st.columns([1, 4])
@@ -1,10 +1,12 @@
 import streamlit as st
 import pandas as pd
-import importlib.util
-import sys
 import os
 from datetime import datetime
 from mongodb_config import get_database
+from avaliacoes_repositorio import COLECOES_POR_ORIGEM, excluir_avaliacao, iterar_avaliacoes, registrar_exclusoes
+from avaliacoes_cache import listar_cabecalhos_cache
+from resumo_avaliacoes import limpar_resumo, PONTUACAO_RESPOSTAS
+from exportacao_excel import gerar_excel_consolidado, gerar_zip_avaliacoes, MIME_EXCEL
 
 st.set_page_config(
     page_title='Controle de Avaliações de Fornecedores',
@@ -12,32 +14,13 @@ st.set_page_config(
     layout='wide'
 )
 
-# Função para importar módulos dinamicamente
-def import_module(module_name, file_path):
-    try:
-        spec = importlib.util.spec_from_file_location(module_name, file_path)
-        if spec is None:
-            st.error(f"Erro ao importar {module_name}: Arquivo não encontrado")
-            return None
-        module = importlib.util.module_from_spec(spec)
-        sys.modules[module_name] = module
-        spec.loader.exec_module(module)
-        return module
-    except Exception as e:
-        st.error(f"Erro ao importar {module_name}: {str(e)}")
-        return None
-
-# Obtendo o caminho base do projeto
-base_path = os.path.dirname(os.path.dirname(__file__))
-
-# Importar módulos locais com caminhos absolutos
-fornecedores_module = import_module("fornecedores_por_unidade", os.path.join(base_path, "fornecedores_por_unidade.py"))
-unidades_module = import_module("unidades", os.path.join(base_path, "unidades.py"))
+# Catálogos compartilhados (módulo importado uma vez por processo)
+import catalogos
 
 # Carregar dados
 try:
-    fornecedores_por_unidade = fornecedores_module.get_fornecedores()
-    unidades = unidades_module.get_unidades()
+    fornecedores_por_unidade = catalogos.get_fornecedores()
+    unidades = catalogos.get_unidades()
 except Exception as e:
     st.error(f"Erro ao carregar dados: {str(e)}")
     fornecedores_por_unidade = {}
@@ -52,84 +35,22 @@ st.markdown(
 
 st.write('---')
 
-# Função para obter avaliações do MongoDB (coleção avaliacoes)
-def get_avaliacoes_mongodb():
+# Função para obter a lista de avaliações (uma linha por avaliação) de ambas as coleções.
+# Lida do cache local, que busca no banco apenas o que mudou desde a última execução
+def get_controle_avaliacoes():
     try:
-        db = get_database()
-        collection = db["avaliacoes"]
-        
-        # Buscar todas as avaliações
-        avaliacoes = list(collection.find({}))
-        
-        if avaliacoes:
-            df = pd.DataFrame(avaliacoes)
-            # Remover o campo _id que é específico do MongoDB
-            if '_id' in df.columns:
-                df = df.drop('_id', axis=1)
-            return df
-        else:
-            return pd.DataFrame()
+        return listar_cabecalhos_cache()
     except Exception as e:
-        st.error(f"Erro ao consultar MongoDB (avaliacoes): {str(e)}")
-        return pd.DataFrame()
-
-# Função para obter avaliações do MongoDB (coleção avaliacoes_adm)
-def get_avaliacoes_adm_mongodb():
-    try:
-        db = get_database()
-        collection = db["avaliacoes_adm"]
-        
-        # Buscar todas as avaliações
-        avaliacoes = list(collection.find({}))
-        
-        if avaliacoes:
-            df = pd.DataFrame(avaliacoes)
-            # Remover o campo _id que é específico do MongoDB
-            if '_id' in df.columns:
-                df = df.drop('_id', axis=1)
-            return df
-        else:
-            return pd.DataFrame()
-    except Exception as e:
-        st.error(f"Erro ao consultar MongoDB (avaliacoes_adm): {str(e)}")
-        return pd.DataFrame()
-
-# Obter avaliações do MongoDB (ambas as coleções)
-avaliacoes_df = get_avaliacoes_mongodb()
-avaliacoes_adm_df = get_avaliacoes_adm_mongodb()
-
-# Combinar os DataFrames se ambos não estiverem vazios
-if not avaliacoes_df.empty and not avaliacoes_adm_df.empty:
-    # Adicionar coluna para identificar a origem
-    avaliacoes_df['Origem'] = 'SUPRIMENTOS'
-    avaliacoes_adm_df['Origem'] = 'ADMINISTRAÇÃO'
-    
-    # Concatenar os DataFrames
-    todas_avaliacoes_df = pd.concat([avaliacoes_df, avaliacoes_adm_df], ignore_index=True)
-elif not avaliacoes_df.empty:
-    avaliacoes_df['Origem'] = 'SUPRIMENTOS'
-    todas_avaliacoes_df = avaliacoes_df
-elif not avaliacoes_adm_df.empty:
-    avaliacoes_adm_df['Origem'] = 'ADMINISTRAÇÃO'
-    todas_avaliacoes_df = avaliacoes_adm_df
-else:
-    todas_avaliacoes_df = pd.DataFrame(columns=['Fornecedor', 'Unidade', 'Período', 'Data_Avaliacao', 'Origem'])
+        st.error(f"Erro ao consultar MongoDB (avaliacoes/avaliacoes_adm): {str(e)}")
+        return pd.DataFrame(columns=['Fornecedor', 'Unidade', 'Período', 'Data_Avaliacao', 'Origem'])
 
 # Criar um DataFrame para armazenar as informações de controle
-if not todas_avaliacoes_df.empty:
-    # Agrupar por Fornecedor, Unidade, Período e Origem para obter avaliações únicas
-    controle_df = todas_avaliacoes_df.drop_duplicates(subset=['Fornecedor', 'Unidade', 'Período', 'Origem'])
-    
-    # Selecionar apenas as colunas relevantes
-    controle_df = controle_df[['Fornecedor', 'Unidade', 'Período', 'Data_Avaliacao', 'Origem']]
-    
-    # Ordenar por data de avaliação (mais recente primeiro)
-    if 'Data_Avaliacao' in controle_df.columns:
-        controle_df['Data_Avaliacao'] = pd.to_datetime(controle_df['Data_Avaliacao'])
-        controle_df = controle_df.sort_values('Data_Avaliacao', ascending=False)
-else:
-    # Criar DataFrame vazio se não houver avaliações
-    controle_df = pd.DataFrame(columns=['Fornecedor', 'Unidade', 'Período', 'Data_Avaliacao', 'Origem'])
+controle_df = get_controle_avaliacoes()
+
+# Ordenar por data de avaliação (mais recente primeiro)
+if not controle_df.empty and 'Data_Avaliacao' in controle_df.columns:
+    controle_df['Data_Avaliacao'] = pd.to_datetime(controle_df['Data_Avaliacao'])
+    controle_df = controle_df.sort_values('Data_Avaliacao', ascending=False)
 
 # Interface de usuário para filtros
 st.subheader("Filtros")
@@ -195,7 +116,7 @@ def excluir_avaliacao_mongodb(fornecedor, unidade, periodo, origem):
         }
         
         # Buscar um registro para obter o período original do banco
-        registro_exemplo = collection.find_one(filtro)
+        registro_exemplo = collection.find_one(filtro, {'Período': 1})
         
         if not registro_exemplo:
             return False, "Nenhum registro encontrado com os critérios especificados"
@@ -203,10 +124,10 @@ def excluir_avaliacao_mongodb(fornecedor, unidade, periodo, origem):
         # Usar o período original do banco de dados
         periodo_original = registro_exemplo['Período']
         
-        # Excluir do MongoDB
-        resultado = collection.delete_many(filtro)
+        # Excluir do MongoDB (descontando as avaliações do resumo mensal)
+        deleted_count = excluir_avaliacao(fornecedor, unidade, periodo, origem)
         
-        if resultado.deleted_count > 0:
+        if deleted_count > 0:
             # Se a exclusão do MongoDB foi bem-sucedida, tentar excluir do SharePoint
             try:
                 # Gerar nome do arquivo baseado nos dados (USANDO A MESMA LÓGICA DA CRIAÇÃO)
@@ -244,12 +165,12 @@ def excluir_avaliacao_mongodb(fornecedor, unidade, periodo, origem):
                 sucesso_sp, mensagem_sp = sp.delete_file(nome_arquivo, sharepoint_folder)
                 
                 if sucesso_sp:
-                    return True, f"{resultado.deleted_count} registro(s) excluído(s) do MongoDB e arquivo '{nome_arquivo}' excluído do SharePoint com sucesso"
+                    return True, f"{deleted_count} registro(s) excluído(s) do MongoDB e arquivo '{nome_arquivo}' excluído do SharePoint com sucesso"
                 else:
-                    return True, f"{resultado.deleted_count} registro(s) excluído(s) do MongoDB com sucesso. Aviso: {mensagem_sp}"
+                    return True, f"{deleted_count} registro(s) excluído(s) do MongoDB com sucesso. Aviso: {mensagem_sp}"
                     
             except Exception as e:
-                return True, f"{resultado.deleted_count} registro(s) excluído(s) do MongoDB com sucesso. Erro ao excluir do SharePoint: {str(e)}"
+                return True, f"{deleted_count} registro(s) excluído(s) do MongoDB com sucesso. Erro ao excluir do SharePoint: {str(e)}"
         else:
             return False, "Nenhum registro foi excluído do MongoDB"
             
@@ -276,8 +197,12 @@ def excluir_todas_avaliacoes_colecao(nome_colecao):
         else:
             sharepoint_folder = None
         
-        # Excluir todos os registros da coleção
+        # Excluir todos os registros da coleção e as linhas correspondentes do resumo mensal
         resultado = collection.delete_many({})
+        origem = next((o for o, c in COLECOES_POR_ORIGEM.items() if c == nome_colecao), None)
+        if origem:
+            limpar_resumo(origem)
+            registrar_exclusoes(origem, db=db)
         
         mensagem_mongodb = f"{resultado.deleted_count} registros excluídos da coleção '{nome_colecao}'"
         
@@ -483,37 +408,6 @@ with col_download2:
     
     if st.button("📥 Gerar Arquivos Individuais", type="primary"):
         try:
-            from io import BytesIO
-            import openpyxl
-            import zipfile
-            
-            # Função para gerar nome do arquivo (importada do padrão existente)
-            def gerar_nome_arquivo_avaliacao(fornecedor, periodo, unidade, origem):
-                """Gera o nome do arquivo baseado nos dados da avaliação"""
-                nome_fornecedor = "".join(x for x in fornecedor.replace(' ', '_') if x.isalnum() or x in ['_', '-'])
-                
-                # Converter período do formato DD/MM/YYYY para MES-YY
-                partes_data = periodo.split('/')
-                mes_num = partes_data[1]  # MM
-                ano_abrev = partes_data[2][-2:]  # YY (últimos 2 dígitos)
-                
-                # Dicionário para conversão de mês
-                meses_abrev = {
-                    '01': 'JAN', '02': 'FEV', '03': 'MAR', '04': 'ABR',
-                    '05': 'MAI', '06': 'JUN', '07': 'JUL', '08': 'AGO',
-                    '09': 'SET', '10': 'OUT', '11': 'NOV', '12': 'DEZ'
-                }
-                nome_periodo = f"{meses_abrev[mes_num]}-{ano_abrev}"
-                
-                nome_unidade = "".join(x for x in unidade if x.isalnum() or x in ['_', '-'])
-                
-                if origem == 'SUPRIMENTOS':
-                    nome_arquivo = f'{nome_fornecedor}_{nome_periodo}_{nome_unidade}_SUP.xlsx'
-                else:
-                    nome_arquivo = f'{nome_fornecedor}_{nome_periodo}_{nome_unidade}.xlsx'
-                
-                return nome_arquivo
-            
             # Determinar quais dados usar baseado na seleção
             if tipo_download == "Avaliações Filtradas (Arquivos Individuais)":
                 dados_base = df_filtrado.copy()
@@ -532,79 +426,47 @@ with col_download2:
                 prefixo_zip = "todas_avaliacoes"
             
             if not dados_base.empty:
-                # Criar arquivo ZIP em memória para conter todos os arquivos Excel
-                zip_buffer = BytesIO()
-                arquivos_gerados = []
+                # Ler do cursor apenas as avaliações selecionadas, um documento por vez
+                documentos = iterar_avaliacoes(
+                    {
+                        'Fornecedor': dados_base['Fornecedor'].unique().tolist(),
+                        'Unidade': dados_base['Unidade'].unique().tolist(),
+                        'Período': dados_base['Período'].unique().tolist()
+                    },
+                    origem=dados_base['Origem'].unique().tolist()
+                )
                 
-                with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
-                    # Barra de progresso
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                    
-                    total_avaliacoes = len(dados_base)
-                    
-                    for contador, (index, row) in enumerate(dados_base.iterrows()):
-                        # Atualizar progresso usando contador sequencial
-                        progresso = min(1.0, (contador + 1) / total_avaliacoes)
-                        progress_bar.progress(progresso)
-                        status_text.text(f"Processando {contador + 1}/{total_avaliacoes}: {row['Fornecedor']} - {row['Período']}")
-                        
-                        # Buscar dados detalhados da avaliação
-                        if row['Origem'] == 'SUPRIMENTOS':
-                            dados_detalhados = avaliacoes_df[
-                                (avaliacoes_df['Fornecedor'] == row['Fornecedor']) &
-                                (avaliacoes_df['Unidade'] == row['Unidade']) &
-                                (avaliacoes_df['Período'] == row['Período'])
-                            ].copy()
-                        else:  # ADMINISTRAÇÃO
-                            dados_detalhados = avaliacoes_adm_df[
-                                (avaliacoes_adm_df['Fornecedor'] == row['Fornecedor']) &
-                                (avaliacoes_adm_df['Unidade'] == row['Unidade']) &
-                                (avaliacoes_adm_df['Período'] == row['Período'])
-                            ].copy()
-                        
-                        if not dados_detalhados.empty:
-                            # Remover a coluna 'Origem' antes de salvar no Excel
-                            if 'Origem' in dados_detalhados.columns:
-                                dados_detalhados = dados_detalhados.drop('Origem', axis=1)
-                            
-                            # Gerar nome do arquivo usando o padrão existente
-                            nome_arquivo = gerar_nome_arquivo_avaliacao(
-                                row['Fornecedor'],
-                                row['Período'],
-                                row['Unidade'],
-                                row['Origem']
-                            )
-                            
-                            # Criar arquivo Excel individual em memória
-                            excel_buffer = BytesIO()
-                            with pd.ExcelWriter(excel_buffer, engine='openpyxl') as writer:
-                                dados_detalhados.to_excel(writer, index=False, sheet_name='Avaliação')
-                            
-                            excel_buffer.seek(0)
-                            
-                            # Adicionar arquivo ao ZIP
-                            zip_file.writestr(nome_arquivo, excel_buffer.getvalue())
-                            arquivos_gerados.append(nome_arquivo)
-                    
-                    # Limpar barra de progresso
-                    progress_bar.empty()
-                    status_text.empty()
+                # Barra de progresso
+                progress_bar = st.progress(0)
+                status_text = st.empty()
+                
+                def mostrar_progresso(feitos, total):
+                    progress_bar.progress(min(1.0, feitos / total))
+                    status_text.text(f"Processando {feitos}/{total} arquivos")
                 
-                zip_buffer.seek(0)
+                # Gerar os arquivos em paralelo conforme os documentos chegam, com o ZIP gravado em disco
+                caminho_zip, arquivos_gerados = gerar_zip_avaliacoes(documentos, dados_base, progresso=mostrar_progresso)
+                
+                # Limpar barra de progresso
+                progress_bar.empty()
+                status_text.empty()
                 
                 # Nome do arquivo ZIP
                 timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
                 nome_zip = f"{prefixo_zip}_individuais_{timestamp}.zip"
                 
-                # Botão de download do ZIP
-                st.download_button(
-                    label=f"📥 Baixar {nome_zip} ({len(arquivos_gerados)} arquivos)",
-                    data=zip_buffer.getvalue(),
-                    file_name=nome_zip,
-                    mime='application/zip',
-                    type="primary"
-                )
+                # Botão de download do ZIP: o arquivo em disco é entregue ao Streamlit e removido em seguida
+                try:
+                    with open(caminho_zip, 'rb') as arquivo_zip:
+                        st.download_button(
+                            label=f"📥 Baixar {nome_zip} ({len(arquivos_gerados)} arquivos)",
+                            data=arquivo_zip,
+                            file_name=nome_zip,
+                            mime='application/zip',
+                            type="primary"
+                        )
+                finally:
+                    os.remove(caminho_zip)
                 
                 st.success(f"✅ **{len(arquivos_gerados)} arquivos Excel gerados com sucesso!**")
                 
@@ -619,6 +481,51 @@ with col_download2:
         except Exception as e:
             st.error(f"Erro ao gerar arquivos: {str(e)}")
 
+# Arquivo único com uma aba por fornecedor (ou unidade) e uma aba de resumo das pontuações
+st.write("**Gerar um único arquivo Excel consolidado (mesma seleção acima):**")
+
+col_consolidado1, col_consolidado2 = st.columns([2, 1])
+
+with col_consolidado1:
+    agrupar_por = st.radio("Uma aba para cada:", options=['Fornecedor', 'Unidade'], horizontal=True)
+
+with col_consolidado2:
+    if st.button("📊 Gerar Arquivo Consolidado"):
+        try:
+            # Mesma seleção do download de arquivos individuais, aplicada direto na consulta ao banco
+            if tipo_download == "Avaliações Filtradas (Arquivos Individuais)":
+                filtros_consolidado = {'Fornecedor': fornecedor_filtro, 'Unidade': unidade_filtro, 'Período': periodo_filtro}
+                origem_consolidado = origem_filtro
+                prefixo_consolidado = "avaliacoes_filtradas"
+            elif tipo_download == "Todas as Avaliações SUPRIMENTOS (Arquivos Individuais)":
+                filtros_consolidado, origem_consolidado, prefixo_consolidado = {}, 'SUPRIMENTOS', "todas_suprimentos"
+            elif tipo_download == "Todas as Avaliações ADMINISTRAÇÃO (Arquivos Individuais)":
+                filtros_consolidado, origem_consolidado, prefixo_consolidado = {}, 'ADMINISTRAÇÃO', "todas_administracao"
+            else:
+                filtros_consolidado, origem_consolidado, prefixo_consolidado = {}, None, "todas_avaliacoes"
+            
+            with st.spinner("Gerando arquivo consolidado..."):
+                # Documentos lidos do cursor em ordem e gravados linha a linha
+                documentos = iterar_avaliacoes(
+                    filtros_consolidado,
+                    origem=origem_consolidado,
+                    ordenar_por=[agrupar_por, 'Período', 'Unidade' if agrupar_por == 'Fornecedor' else 'Fornecedor']
+                )
+                arquivo_consolidado = gerar_excel_consolidado(documentos, agrupar_por, pontuacao=PONTUACAO_RESPOSTAS)
+            
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            nome_consolidado = f"{prefixo_consolidado}_por_{agrupar_por.lower()}_{timestamp}.xlsx"
+            
+            st.download_button(
+                label=f"📥 Baixar {nome_consolidado}",
+                data=arquivo_consolidado,
+                file_name=nome_consolidado,
+                mime=MIME_EXCEL,
+                type="primary"
+            )
+        except Exception as e:
+            st.error(f"Erro ao gerar arquivo consolidado: {str(e)}")
+
 # Rodapé com copyright
 st.sidebar.markdown("""
     <style>
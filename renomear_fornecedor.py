@@ -0,0 +1,173 @@
+from pymongo import UpdateOne, UpdateMany, DeleteOne
+from mongodb_config import get_database
+from catalogo_versao import incrementar_versao
+from avaliacoes_repositorio import COLECOES_POR_ORIGEM, registrar_exclusoes
+from resumo_avaliacoes import COLECAO_RESUMO, CHAVE_RESUMO, atualizar_resumo
+
+# Quantidade de avaliações atualizadas por operação em lote
+TAMANHO_LOTE = 500
+
+def _suporta_transacoes(client):
+    # Transações exigem replica set ou cluster fragmentado (ex.: MongoDB Atlas)
+    try:
+        info = client.admin.command("hello")
+        return bool(info.get("setName")) or info.get("msg") == "isdbgrid"
+    except Exception:
+        return False
+
+def _renomear_cadastro(db, nome_atual, novo_nome, unidades, session):
+    collection = db["fornecedores"]
+    destino = collection.find_one({"fornecedor": novo_nome}, session=session)
+    atual = collection.find_one({"fornecedor": nome_atual}, session=session)
+
+    if unidades is None:
+        unidades = atual["unidades"] if atual else []
+
+    if destino:
+        # Mesclar: o fornecedor de destino passa a atender também as unidades do atual
+        unidades = list(destino["unidades"]) + [u for u in unidades if u not in destino["unidades"]]
+        collection.update_one({"fornecedor": novo_nome}, {"$set": {"unidades": unidades}}, session=session)
+        collection.delete_one({"fornecedor": nome_atual}, session=session)
+    else:
+        collection.update_one(
+            {"fornecedor": nome_atual},
+            {"$set": {"fornecedor": novo_nome, "unidades": unidades}},
+            upsert=True,
+            session=session
+        )
+    return destino is not None
+
+def _renomear_perguntas(db, nome_atual, novo_nome, session):
+    collection = db["perguntas"]
+    categorias_destino = {
+        doc["categoria"] for doc in collection.find({"fornecedor": novo_nome}, {"categoria": 1}, session=session)
+    }
+
+    operacoes = []
+    categorias = 0
+    for doc in collection.find({"fornecedor": nome_atual}, session=session):
+        categorias += 1
+        if doc["categoria"] in categorias_destino:
+            # Categoria já existe no destino: acrescentar as perguntas que ainda não existem
+            operacoes.append(UpdateOne(
+                {"fornecedor": novo_nome, "categoria": doc["categoria"]},
+                {"$addToSet": {"perguntas": {"$each": doc["perguntas"]}}, "$inc": {"versao": 1}}
+            ))
+            operacoes.append(DeleteOne({"_id": doc["_id"]}))
+        else:
+            operacoes.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"fornecedor": novo_nome}, "$inc": {"versao": 1}}))
+
+    if operacoes:
+        collection.bulk_write(operacoes, ordered=True, session=session)
+    return categorias
+
+def _remover_avaliacoes_em_conflito(db, nome_atual, novo_nome, session):
+    # O novo nome pode já ter avaliações (com ou sem cadastro em fornecedores) na mesma unidade e período,
+    # e o índice único não aceitaria as duas: manter a mais recente (como remover_avaliacoes_duplicadas)
+    # e descontar a outra do resumo
+    projecao = {"Unidade": 1, "Período": 1, "Data_Avaliacao": 1}
+    removidas = 0
+    for nome_origem, nome_colecao in COLECOES_POR_ORIGEM.items():
+        collection = db[nome_colecao]
+        destino = {
+            (doc.get("Unidade"), doc.get("Período")): doc
+            for doc in collection.find({"Fornecedor": novo_nome, "respostas": {"$exists": True}}, projecao, session=session)
+        }
+        if not destino:
+            continue
+        for doc in collection.find({"Fornecedor": nome_atual, "respostas": {"$exists": True}}, projecao, session=session):
+            existente = destino.get((doc.get("Unidade"), doc.get("Período")))
+            if existente is None:
+                continue
+            mais_recente = max(doc, existente, key=lambda d: (str(d.get("Data_Avaliacao") or ""), d["_id"]))
+            descartada = existente if mais_recente is doc else doc
+            documento = collection.find_one_and_delete({"_id": descartada["_id"]}, session=session)
+            if documento is not None:
+                atualizar_resumo(documento, nome_origem, sinal=-1, session=session)
+                removidas += 1
+    return removidas
+
+def _renomear_avaliacoes(db, nome_atual, novo_nome, session, progresso, tamanho_lote):
+    total = 0
+    for nome_origem, nome_colecao in COLECOES_POR_ORIGEM.items():
+        collection = db[nome_colecao]
+        ids = [doc["_id"] for doc in collection.find({"Fornecedor": nome_atual}, {"_id": 1}, session=session)]
+        for inicio in range(0, len(ids), tamanho_lote):
+            lote = ids[inicio:inicio + tamanho_lote]
+            collection.bulk_write(
+                [UpdateMany({"_id": {"$in": lote}}, {"$set": {"Fornecedor": novo_nome}})],
+                session=session
+            )
+            if progresso:
+                progresso(nome_origem, inicio + len(lote), len(ids))
+        total += len(ids)
+    return total
+
+def _renomear_resumo(db, nome_atual, novo_nome, session):
+    # Somar as linhas do nome atual às do novo nome (a chave do resumo é única)
+    collection = db[COLECAO_RESUMO]
+    operacoes = []
+    for linha in collection.find({"Fornecedor": nome_atual}, session=session):
+        chave = {campo: linha.get(campo) for campo in CHAVE_RESUMO}
+        chave["Fornecedor"] = novo_nome
+        inc = {"quantidade": linha.get("quantidade", 0), "soma_pontuacao": linha.get("soma_pontuacao", 0)}
+        for resposta, quantidade in linha.get("contagem", {}).items():
+            inc[f"contagem.{resposta}"] = quantidade
+        operacoes.append(UpdateOne(chave, {"$inc": inc}, upsert=True))
+        operacoes.append(DeleteOne({"_id": linha["_id"]}))
+
+    if operacoes:
+        collection.bulk_write(operacoes, ordered=True, session=session)
+    return len(operacoes) // 2
+
+def renomear_fornecedor(nome_atual, novo_nome, unidades=None, progresso=None, tamanho_lote=TAMANHO_LOTE):
+    """
+    Renomeia um fornecedor (ou o mescla com outro já existente) em todas as coleções:
+    fornecedores, perguntas, avaliacoes, avaliacoes_adm e avaliacoes_resumo.
+    Usa uma transação quando o servidor suporta (replica set/Atlas); caso contrário,
+    aplica as alterações em lotes na mesma ordem.
+    Na mescla, se os dois fornecedores têm avaliação da mesma unidade e período, fica só a mais recente.
+    'progresso(etapa, feitos, total)' é chamada a cada lote de avaliações.
+    Retorna um dicionário com o que foi alterado.
+    """
+    if not nome_atual or not novo_nome:
+        raise ValueError("Informe o nome atual e o novo nome do fornecedor")
+    if nome_atual == novo_nome:
+        raise ValueError("O novo nome é igual ao nome atual")
+
+    db = get_database()
+    client = db.client
+
+    def executar(session=None):
+        resultado = {}
+        resultado["mesclado"] = _renomear_cadastro(db, nome_atual, novo_nome, unidades, session)
+        if progresso:
+            progresso("fornecedores", 1, 1)
+        resultado["perguntas"] = _renomear_perguntas(db, nome_atual, novo_nome, session)
+        if progresso:
+            progresso("perguntas", 1, 1)
+        # O novo nome pode ter avaliações mesmo sem estar no cadastro de fornecedores
+        resultado["avaliacoes_substituidas"] = _remover_avaliacoes_em_conflito(db, nome_atual, novo_nome, session)
+        resultado["avaliacoes"] = _renomear_avaliacoes(db, nome_atual, novo_nome, session, progresso, tamanho_lote)
+        resultado["resumo"] = _renomear_resumo(db, nome_atual, novo_nome, session)
+        if progresso:
+            progresso("resumo", 1, 1)
+        return resultado
+
+    if _suporta_transacoes(client):
+        with client.start_session() as session:
+            resultado = session.with_transaction(executar)
+        resultado["transacao"] = True
+    else:
+        resultado = executar()
+        resultado["transacao"] = False
+
+    # Invalidar o cache dos catálogos alterados em todas as sessões
+    incrementar_versao("fornecedores")
+    if resultado["perguntas"]:
+        incrementar_versao("perguntas")
+    # As avaliações renomeadas mantêm _id e data: o cache local precisa recarregar as coleções
+    if resultado["avaliacoes"] or resultado["avaliacoes_substituidas"]:
+        for nome_origem in COLECOES_POR_ORIGEM:
+            registrar_exclusoes(nome_origem, db=db)
+    return resultado
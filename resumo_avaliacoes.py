@@ -0,0 +1,203 @@
+import pandas as pd
+from pymongo import UpdateOne
+from mongodb_config import get_database
+from avaliacoes_repositorio import COLECOES_POR_ORIGEM, montar_filtro
+
+# Coleção com o resumo mensal das respostas
+COLECAO_RESUMO = "avaliacoes_resumo"
+
+# Campos que identificam uma linha do resumo
+CHAVE_RESUMO = ['Período', 'Unidade', 'Fornecedor', 'categoria', 'origem']
+
+# Pontuação de cada resposta usada nos indicadores
+PONTUACAO_RESPOSTAS = {
+    'Atende Totalmente': 3,
+    'Atende Parcialmente': 2,
+    'Não Atende': 1,
+    'Não se Aplica': 0
+}
+
+def _incrementos_por_categoria(documento, sinal):
+    # Somar quantidade, pontuação e contagem de cada resposta por categoria
+    incrementos = {}
+    for item in documento.get('respostas', []):
+        resposta = item.get('Resposta')
+        if resposta not in PONTUACAO_RESPOSTAS:
+            continue
+        inc = incrementos.setdefault(item.get('categorias'), {})
+        inc['quantidade'] = inc.get('quantidade', 0) + sinal
+        inc['soma_pontuacao'] = inc.get('soma_pontuacao', 0) + sinal * PONTUACAO_RESPOSTAS[resposta]
+        campo = f'contagem.{resposta}'
+        inc[campo] = inc.get(campo, 0) + sinal
+    return incrementos
+
+def atualizar_resumo(documento, origem, sinal=1, session=None):
+    """
+    Soma (sinal=1) ou desconta (sinal=-1) uma avaliação do resumo mensal usando $inc.
+    'session' permite descontar dentro de uma transação (ex.: renomeação de fornecedor);
+    nesse caso os erros são repassados para que a transação seja abortada.
+    """
+    operacoes = []
+    chaves = []
+    for categoria, inc in _incrementos_por_categoria(documento, sinal).items():
+        chave = {
+            'Período': documento.get('Período'),
+            'Unidade': documento.get('Unidade'),
+            'Fornecedor': documento.get('Fornecedor'),
+            'categoria': categoria,
+            'origem': origem
+        }
+        chaves.append(chave)
+        operacoes.append(UpdateOne(chave, {'$inc': inc}, upsert=True))
+
+    if not operacoes:
+        return None
+
+    try:
+        db = get_database()
+        resultado = db[COLECAO_RESUMO].bulk_write(operacoes, ordered=False, session=session)
+        if sinal < 0:
+            # Remover as linhas que ficaram sem respostas
+            for chave in chaves:
+                db[COLECAO_RESUMO].delete_one(dict(chave, quantidade={'$lte': 0}), session=session)
+        return resultado
+    except Exception as e:
+        # Dentro de uma transação a falha precisa desfazer a operação inteira
+        if session is not None:
+            raise
+        # Fora dela, o resumo pode ser reconstruído a qualquer momento a partir das avaliações
+        print(f"Erro ao atualizar resumo das avaliações: {str(e)}")
+        return None
+
+def limpar_resumo(origem=None):
+    """
+    Remove as linhas do resumo de uma origem (ou de todas).
+    """
+    db = get_database()
+    filtro = {'origem': origem} if origem else {}
+    return db[COLECAO_RESUMO].delete_many(filtro).deleted_count
+
+def reconstruir_resumo(db=None):
+    """
+    Recalcula todo o resumo a partir das avaliações e substitui a coleção ($out).
+    """
+    if db is None:
+        db = get_database()
+    origens = list(COLECOES_POR_ORIGEM.items())
+
+    pontuacao = {'$switch': {
+        'branches': [
+            {'case': {'$eq': ['$respostas.Resposta', resposta]}, 'then': valor}
+            for resposta, valor in PONTUACAO_RESPOSTAS.items()
+        ],
+        'default': None
+    }}
+
+    pipeline = [{'$addFields': {'origem': origens[0][0]}}]
+    for nome_origem, nome_colecao in origens[1:]:
+        pipeline.append({'$unionWith': {
+            'coll': nome_colecao,
+            'pipeline': [{'$addFields': {'origem': nome_origem}}]
+        }})
+
+    grupo = {
+        '_id': {
+            'Período': '$Período',
+            'Unidade': '$Unidade',
+            'Fornecedor': '$Fornecedor',
+            'categoria': '$respostas.categorias',
+            'origem': '$origem'
+        },
+        'quantidade': {'$sum': {'$cond': [{'$eq': [pontuacao, None]}, 0, 1]}},
+        'soma_pontuacao': {'$sum': pontuacao}
+    }
+    for i, resposta in enumerate(PONTUACAO_RESPOSTAS):
+        grupo[f'r{i}'] = {'$sum': {'$cond': [{'$eq': ['$respostas.Resposta', resposta]}, 1, 0]}}
+
+    projecao = {'_id': 0, 'quantidade': 1, 'soma_pontuacao': 1}
+    for campo in CHAVE_RESUMO:
+        projecao[campo] = f'$_id.{campo}'
+    projecao['contagem'] = {resposta: f'$r{i}' for i, resposta in enumerate(PONTUACAO_RESPOSTAS)}
+
+    pipeline.extend([
+        {'$unwind': '$respostas'},
+        {'$group': grupo},
+        {'$project': projecao},
+        {'$out': COLECAO_RESUMO}
+    ])
+
+    db[origens[0][1]].aggregate(pipeline, allowDiskUse=True)
+    return db[COLECAO_RESUMO].count_documents({})
+
+def garantir_resumo(db=None):
+    """
+    Reconstrói o resumo mensal quando ele ainda não existe (ou está vazio) e há avaliações,
+    como na primeira execução após a atualização. Retorna as linhas criadas (0 se nada foi feito).
+    """
+    if db is None:
+        db = get_database()
+    if db[COLECAO_RESUMO].find_one({}, {'_id': 1}) is not None:
+        return 0
+    if all(db[nome_colecao].find_one({}, {'_id': 1}) is None for nome_colecao in COLECOES_POR_ORIGEM.values()):
+        return 0
+    return reconstruir_resumo(db)
+
+def listar_resumo(filtros=None, origem=None):
+    """
+    Retorna as linhas do resumo que atendem aos filtros, com uma coluna por resposta.
+    """
+    db = get_database()
+    query = montar_filtro(filtros)
+    if origem and origem not in ('Todas', 'Todos'):
+        query['origem'] = origem
+
+    linhas = []
+    for doc in db[COLECAO_RESUMO].find(query, {'_id': 0}):
+        linha = {campo: doc.get(campo) for campo in CHAVE_RESUMO}
+        linha['quantidade'] = doc.get('quantidade', 0)
+        linha['soma_pontuacao'] = doc.get('soma_pontuacao', 0)
+        for resposta in PONTUACAO_RESPOSTAS:
+            linha[resposta] = doc.get('contagem', {}).get(resposta, 0)
+        linhas.append(linha)
+
+    return pd.DataFrame(linhas, columns=CHAVE_RESUMO + ['quantidade', 'soma_pontuacao'] + list(PONTUACAO_RESPOSTAS))
+
+def get_valores_filtros():
+    """
+    Retorna os valores distintos de Período, Unidade e Fornecedor presentes no resumo.
+    """
+    db = get_database()
+    collection = db[COLECAO_RESUMO]
+    return {campo: sorted(v for v in collection.distinct(campo) if v is not None)
+            for campo in ['Período', 'Unidade', 'Fornecedor']}
+
+def _media(df, agrupamento):
+    resultado = df.groupby(agrupamento)[['soma_pontuacao', 'quantidade']].sum().reset_index()
+    resultado = resultado[resultado['quantidade'] > 0]
+    resultado['Valor_Resposta'] = resultado['soma_pontuacao'] / resultado['quantidade']
+    return resultado[agrupamento + ['Valor_Resposta']]
+
+def calcular_media_por_fornecedor(resumo_df):
+    """
+    Pontuação média por fornecedor a partir das linhas do resumo.
+    """
+    return _media(resumo_df, ['Fornecedor']).sort_values('Valor_Resposta', ascending=False)
+
+def calcular_distribuicao_respostas(resumo_df):
+    """
+    Quantidade de cada resposta por fornecedor a partir das linhas do resumo.
+    """
+    contagem = resumo_df.groupby('Fornecedor')[list(PONTUACAO_RESPOSTAS)].sum().reset_index()
+    contagem = contagem.melt(id_vars='Fornecedor', var_name='Resposta', value_name='count')
+    contagem = contagem[contagem['count'] > 0]
+    return contagem[['Resposta', 'Fornecedor', 'count']].sort_values(['Resposta', 'Fornecedor']).reset_index(drop=True)
+
+def calcular_evolucao_por_periodo(resumo_df):
+    """
+    Pontuação média por período e fornecedor a partir das linhas do resumo.
+    """
+    return _media(resumo_df, ['Período', 'Fornecedor'])
+
+# Reconstruir o resumo manualmente
+if __name__ == "__main__":
+    print(f"Resumo reconstruído: {reconstruir_resumo()} linhas")
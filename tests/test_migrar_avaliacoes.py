@@ -0,0 +1,86 @@
+import os
+import sys
+import types
+
+import pytest
+
+mongomock = pytest.importorskip("mongomock")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Banco em memória no lugar do MongoDB Atlas (mongodb_config lê st.secrets na importação)
+_cliente = mongomock.MongoClient()
+_config = types.ModuleType("mongodb_config")
+_config.get_database = lambda: _cliente["avaliacao_fornecedores"]
+sys.modules["mongodb_config"] = _config
+
+import migrar_avaliacoes  # noqa: E402
+
+CHAVE = {"Fornecedor": "ACME", "Unidade": "BARRA", "Período": "Janeiro"}
+
+def _linha_legada(pergunta, resposta, data):
+    linha = dict(CHAVE)
+    linha.update({"categorias": "Qualidade", "Pergunta": pergunta, "Resposta": resposta, "Data_Avaliacao": data})
+    return linha
+
+def _avaliacao(data, resposta, id_envio):
+    documento = dict(CHAVE)
+    documento.update({
+        "Data_Avaliacao": data,
+        "id_envio": id_envio,
+        "respostas": [{"categorias": "Qualidade", "Pergunta": "P1", "Resposta": resposta}],
+    })
+    return documento
+
+@pytest.fixture
+def colecao():
+    db = _config.get_database()
+    for nome in db.list_collection_names():
+        db.drop_collection(nome)
+    return db["avaliacoes"]
+
+def test_migracao_preserva_avaliacao_mais_recente(colecao):
+    colecao.insert_one(_avaliacao("2024-02-01 10:00:00", "Atende Totalmente", "envio-novo"))
+    colecao.insert_many([
+        _linha_legada("P1", "Não Atende", "2024-01-15 09:00:00"),
+        _linha_legada("P2", "Não Atende", "2024-01-15 09:00:00"),
+    ])
+
+    assert migrar_avaliacoes.migrar_colecao("avaliacoes") == (1, 2)
+
+    documentos = list(colecao.find())
+    assert len(documentos) == 1
+    assert documentos[0]["id_envio"] == "envio-novo"
+    assert documentos[0]["Data_Avaliacao"] == "2024-02-01 10:00:00"
+    assert documentos[0]["respostas"][0]["Resposta"] == "Atende Totalmente"
+
+def test_migracao_substitui_avaliacao_mais_antiga(colecao):
+    colecao.insert_one(_avaliacao("2024-01-01 10:00:00", "Atende Totalmente", "envio-antigo"))
+    colecao.insert_many([
+        _linha_legada("P1", "Não Atende", "2024-01-15 09:00:00"),
+        _linha_legada("P2", "Atende Parcialmente", "2024-01-15 09:00:00"),
+    ])
+
+    migrar_avaliacoes.migrar_colecao("avaliacoes")
+
+    documentos = list(colecao.find())
+    assert len(documentos) == 1
+    assert documentos[0]["Data_Avaliacao"] == "2024-01-15 09:00:00"
+    assert "id_envio" not in documentos[0]
+    assert {r["Pergunta"]: r["Resposta"] for r in documentos[0]["respostas"]} == {
+        "P1": "Não Atende", "P2": "Atende Parcialmente"
+    }
+
+def test_migracao_cria_avaliacao_ausente(colecao):
+    colecao.insert_many([
+        _linha_legada("P1", "Não Atende", "2024-01-15 09:00:00"),
+        _linha_legada("P1", "Atende Totalmente", "2024-01-20 09:00:00"),
+    ])
+
+    assert migrar_avaliacoes.migrar_colecao("avaliacoes") == (1, 2)
+    assert migrar_avaliacoes.migrar_colecao("avaliacoes") == (0, 0)
+
+    documentos = list(colecao.find())
+    assert len(documentos) == 1
+    assert documentos[0]["Data_Avaliacao"] == "2024-01-20 09:00:00"
+    assert documentos[0]["respostas"][0]["Resposta"] == "Atende Totalmente"
@@ -1,63 +1,67 @@
+from pymongo import ReturnDocument
 from mongodb_config import get_database
+from catalogo_versao import incrementar_versao
+from catalogo_cache import get_cache
+from dados_locais import carregar_dados_locais
 
-# Dados originais (mantidos para compatibilidade)
-unidades = [
-    'CSA-BH',
-    'CSA-CT',
-    'CSA-NL',
-    'CSA-GZ',
-    'CSA-DV I',
-    'EPSA',
-    'ESA',
-    'AIACOM',
-    'ILALI',
-    'ADEODATO',
-    'SIC SEDE',
-    'CSA-DV II'
-]
+# Dados originais, lidos de dados/unidades.json apenas quando acessados
+def __getattr__(nome):
+    if nome == "unidades":
+        return carregar_dados_locais("unidades")
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
 
 # Funções para manipular unidades no MongoDB
-def get_unidades():
+def montar_unidades(documentos):
+    # A coleção tem um único documento com a lista de unidades
+    for doc in documentos:
+        return doc["unidades"]
+    return []
+
+def _carregar_unidades():
+    db = get_database()
+    collection = db["unidades"]
+    
+    # Retornar as unidades do banco (a carga inicial é feita em carga_inicial.py)
+    return montar_unidades(collection.find({}, {"_id": 0, "unidades": 1}).limit(1))
+
+def get_cache_unidades():
+    return get_cache("unidades", _carregar_unidades)
+
+def get_unidades(versao=None):
+    # Cache em memória, recarregado apenas quando a versão do catálogo de unidades muda
+    return list(get_cache_unidades().obter(versao))
+
+def _gravar_unidades(operacao):
     db = get_database()
     collection = db["unidades"]
     
-    # Verificar se já existem unidades no banco
-    if collection.count_documents({}) == 0:
-        # Se não existir, inicializar com os dados padrão
-        collection.insert_one({"unidades": unidades})
-        return unidades
-    else:
-        # Se existir, retornar as unidades do banco
-        result = collection.find_one({})
-        return result["unidades"]
+    # Aplicar a alteração e obter a lista atualizada na mesma operação
+    doc = collection.find_one_and_update(
+        {},
+        operacao,
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    
+    # Atualizar o cache deste processo com a lista gravada (write-through)
+    nova_versao = incrementar_versao("unidades")
+    get_cache_unidades().substituir(doc["unidades"], nova_versao)
 
 def add_unidade(unidade):
     if unidade and unidade not in get_unidades():
-        db = get_database()
-        collection = db["unidades"]
-        
         # Atualizar a lista de unidades
-        collection.update_one(
-            {}, 
-            {"$push": {"unidades": unidade}},
-            upsert=True
-        )
+        _gravar_unidades({"$push": {"unidades": unidade}})
         return True
     return False
 
 def remove_unidade(unidade):
     if unidade and unidade in get_unidades():
-        db = get_database()
-        collection = db["unidades"]
-        
         # Remover a unidade da lista
-        collection.update_one(
-            {}, 
-            {"$pull": {"unidades": unidade}}
-        )
+        _gravar_unidades({"$pull": {"unidades": unidade}})
         return True
     return False
 
 # Inicializar a coleção se for a primeira execução
 if __name__ == "__main__":
-    get_unidades()
\ No newline at end of file
+    from carga_inicial import garantir_carga_inicial
+    garantir_carga_inicial()
\ No newline at end of file